@@ -1,31 +1,124 @@
-import typing as tp
+import argparse
+import collections
+import functools
+import itertools
+import math
+import multiprocessing
 import pathlib
 import random
+import sys
+import time
+import typing as tp
 
 T = tp.TypeVar("T")
 
+ALPHABET = "123456789ABCDEFGHIJKLMNOP"
+
+
+class Board:
+    """
+    Компактная сетка судоку размером N² x N² (9x9, 16x16, 25x25).
+
+    Клетки хранятся построчно в одном bytearray: 0 — пустая клетка,
+    1..size — номер цифры в `ALPHABET`.
+    """
+
+    __slots__ = ("box", "size", "cells")
+
+    def __init__(self, box: int = 3, cells: tp.Optional[tp.Iterable[int]] = None) -> None:
+        self.box = box
+        self.size = box * box
+        self.cells = bytearray(self.size * self.size) if cells is None else bytearray(cells)
+        if len(self.cells) != self.size * self.size:
+            raise ValueError(f"Expected {self.size * self.size} cells, got {len(self.cells)}")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, pos: tp.Tuple[int, int]) -> str:
+        value = self.cells[pos[0] * self.size + pos[1]]
+        return ALPHABET[value - 1] if value else "."
+
+    def __setitem__(self, pos: tp.Tuple[int, int], value: str) -> None:
+        self.cells[pos[0] * self.size + pos[1]] = ALPHABET.index(value) + 1 if value != "." else 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Board) and self.box == other.box and self.cells == other.cells
+
+    def __repr__(self) -> str:
+        puzzle = "".join(value for row in self.rows() for value in row)
+        return f"Board(box={self.box}, puzzle={puzzle!r})"
+
+    def copy(self) -> "Board":
+        return Board(self.box, self.cells)
+
+    def rows(self) -> tp.List[tp.List[str]]:
+        return [[self[r, c] for c in range(self.size)] for r in range(self.size)]
+
+
+Grid = tp.Union[tp.List[tp.List[str]], Board]
+
+
+class _Layout(tp.NamedTuple):
+    size: int
+    full: int
+    # для каждой клетки — номера ее строки, столбца и блока в общем списке из 3 * size рядов
+    peers: tp.List[tp.Tuple[int, int, int]]
+    units: tp.List[tp.List[int]]
+
+
+@functools.lru_cache(maxsize=None)
+def _layout(box: int) -> _Layout:
+    size = box * box
+    peers = []
+    for pos in range(size * size):
+        r, c = divmod(pos, size)
+        peers.append((r, size + c, 2 * size + (r // box) * box + c // box))
+    units: tp.List[tp.List[int]] = [[] for _ in range(3 * size)]
+    for pos, unit_ids in enumerate(peers):
+        for unit in unit_ids:
+            units[unit].append(pos)
+    return _Layout(size, (1 << size) - 1, peers, units)
+
+
+def _box_size(size: int) -> int:
+    # поддерживаются поля 9x9, 16x16 и 25x25
+    box = math.isqrt(size)
+    if box * box != size or not 9 <= size <= len(ALPHABET):
+        raise ValueError(f"Unsupported sudoku size: {size}")
+    return box
+
+
 def group(values: tp.List[T], n: int) -> tp.List[tp.List[T]]:
     return [values[i:i + n] for i in range(0, len(values), n)]
 
-def create_grid(puzzle: str) -> tp.List[tp.List[str]]:
-    digits = [c for c in puzzle if c in "123456789."]
-    grid = group(digits, 9)
+def create_grid(puzzle: str, compact: bool = False) -> Grid:
+    digits = [c for c in puzzle if c in ALPHABET or c == "."]
+    size = math.isqrt(len(digits))
+    if size * size != len(digits):
+        raise ValueError(f"Unsupported number of cells: {len(digits)}")
+    box = _box_size(size)
+    if compact:
+        return Board(box, (ALPHABET.index(c) + 1 if c != "." else 0 for c in digits))
+    grid = group(digits, size)
     return grid
 
-def read_sudoku(path: tp.Union[str, pathlib.Path]) -> tp.List[tp.List[str]]:
+def read_sudoku(path: tp.Union[str, pathlib.Path], compact: bool = False) -> Grid:
     path = pathlib.Path(path)
     with path.open() as f:
         puzzle = f.read()
-    return create_grid(puzzle)
+    return create_grid(puzzle, compact)
 
-def display(grid: tp.List[tp.List[str]]) -> None:
-    for row in range(len(grid)):
-        if row in (3, 6):
-            print("-" * 21)
-        for col in range(len(grid[row])):
-            if col in (3, 6):
+def display(grid: Grid) -> None:
+    rows = grid.rows() if isinstance(grid, Board) else grid
+    box = math.isqrt(len(rows))
+    for row in range(len(rows)):
+        if row and row % box == 0:
+            print("-" * (2 * len(rows) + 2 * (box - 1) - 1))
+        for col in range(len(rows[row])):
+            if col and col % box == 0:
                 print("|", end=" ")
-            print(grid[row][col], end=" ")
+            print(rows[row][col], end=" ")
         print()
 
 def get_row(grid: tp.List[tp.List[str]], pos: tp.Tuple[int, int]) -> tp.List[str]:
@@ -35,9 +128,12 @@ def get_col(grid: tp.List[tp.List[str]], pos: tp.Tuple[int, int]) -> tp.List[str
     return [grid[row][pos[1]] for row in range(len(grid))]
 
 def get_block(grid: tp.List[tp.List[str]], pos: tp.Tuple[int, int]) -> tp.List[str]:
-    block_row = pos[0] // 3 * 3
-    block_col = pos[1] // 3 * 3
-    return [grid[r][c] for r in range(block_row, block_row + 3) for c in range(block_col, block_col + 3)]
+    box = math.isqrt(len(grid))
+    block_row = pos[0] // box * box
+    block_col = pos[1] // box * box
+    return [
+        grid[r][c] for r in range(block_row, block_row + box) for c in range(block_col, block_col + box)
+    ]
 
 def find_empty_positions(grid: tp.List[tp.List[str]]) -> tp.Optional[tp.Tuple[int, int]]:
     for row in range(len(grid)):
@@ -47,13 +143,15 @@ def find_empty_positions(grid: tp.List[tp.List[str]]) -> tp.Optional[tp.Tuple[in
     return None
 
 def find_possible_values(grid: tp.List[tp.List[str]], pos: tp.Tuple[int, int]) -> tp.Set[str]:
-    values = set("123456789")
+    values = set(ALPHABET[: len(grid)])
     values -= set(get_row(grid, pos))
     values -= set(get_col(grid, pos))
     values -= set(get_block(grid, pos))
     return values
 
-def solve(grid: tp.List[tp.List[str]]) -> tp.Optional[tp.List[tp.List[str]]]:
+def solve(grid: Grid) -> tp.Optional[Grid]:
+    if isinstance(grid, Board):
+        return solve_bitset(grid)
     pos = find_empty_positions(grid)
     if not pos:
         return grid
@@ -65,16 +163,160 @@ def solve(grid: tp.List[tp.List[str]]) -> tp.Optional[tp.List[tp.List[str]]]:
         grid[row][col] = '.'
     return None
 
-def check_solution(solution: tp.List[tp.List[str]]) -> bool:
+def _place(layout: _Layout, cells: tp.List[int], masks: tp.List[int], pos: int, bit: int) -> None:
+    # masks: size строк, затем size столбцов, затем size блоков
+    row, col, box = layout.peers[pos]
+    cells[pos] = bit
+    masks[row] |= bit
+    masks[col] |= bit
+    masks[box] |= bit
+
+
+def _load(grid: Grid) -> tp.Optional[tp.Tuple[_Layout, tp.List[int], tp.List[int]]]:
+    """
+    Перевести сетку в битовые маски: значение клетки — бит ее цифры, маска
+    ряда — объединение битов цифр в нем. None, если подсказки противоречивы.
+    """
+    if isinstance(grid, Board):
+        layout = _layout(grid.box)
+        values: tp.Iterable[int] = grid.cells
+    else:
+        layout = _layout(_box_size(len(grid)))
+        values = (ALPHABET.find(value, 0, len(grid)) + 1 for row in grid for value in row)
+    cells = [0] * (layout.size * layout.size)
+    masks = [0] * (3 * layout.size)
+    peers = layout.peers
+    for pos, value in enumerate(values):
+        if not value:
+            continue
+        bit = 1 << (value - 1)
+        row, col, box = peers[pos]
+        if (masks[row] | masks[col] | masks[box]) & bit:
+            return None
+        _place(layout, cells, masks, pos, bit)
+    return layout, cells, masks
+
+
+def _propagate(
+    layout: _Layout, cells: tp.List[int], masks: tp.List[int], empties: tp.List[int]
+) -> tp.Optional[tp.Tuple[int, int]]:
+    """
+    Расставить все naked и hidden singles.
+
+    Возвращает (позиция, кандидаты) самой ограниченной пустой клетки,
+    (-1, 0) если сетка заполнена, или None при противоречии.
+    """
+    full, peers = layout.full, layout.peers
+    while True:
+        cands = [0] * len(cells)
+        best, best_cands, best_count = -1, 0, layout.size + 1
+        progress = False
+        empties[:] = [pos for pos in empties if not cells[pos]]
+        for pos in empties:
+            row, col, box = peers[pos]
+            free = full & ~(masks[row] | masks[col] | masks[box])
+            if not free:
+                return None
+            if not free & (free - 1):
+                _place(layout, cells, masks, pos, free)
+                progress = True
+                continue
+            cands[pos] = free
+            # лучше двух кандидатов не бывает: одиночки уже расставлены
+            if best_count > 2:
+                count = free.bit_count()
+                if count < best_count:
+                    best, best_cands, best_count = pos, free, count
+        if progress:
+            continue
+        if best < 0:
+            return -1, 0
+        for unit in layout.units:
+            once = twice = placed = 0
+            for pos in unit:
+                free = cands[pos]
+                twice |= once & free
+                once |= free
+                placed |= cells[pos]
+            if (once | placed) != full:
+                return None
+            singles = once & ~twice & ~placed
+            while singles:
+                bit = singles & -singles
+                singles ^= bit
+                for pos in unit:
+                    if cands[pos] & bit:
+                        # клетка могла быть заполнена раньше в этом же проходе
+                        row, col, box = peers[pos]
+                        if cells[pos] or (masks[row] | masks[col] | masks[box]) & bit:
+                            return None
+                        _place(layout, cells, masks, pos, bit)
+                        progress = True
+                        break
+        if not progress:
+            return best, best_cands
+
+
+def _search(
+    layout: _Layout, cells: tp.List[int], masks: tp.List[int], empties: tp.List[int]
+) -> tp.Optional[tp.List[int]]:
+    found = _propagate(layout, cells, masks, empties)
+    if found is None:
+        return None
+    pos, free = found
+    if pos < 0:
+        return cells
+    while free:
+        bit = free & -free
+        free ^= bit
+        next_cells, next_masks = cells[:], masks[:]
+        _place(layout, next_cells, next_masks, pos, bit)
+        solution = _search(layout, next_cells, next_masks, empties[:])
+        if solution is not None:
+            return solution
+    return None
+
+
+def solve_bitset(grid: Grid) -> tp.Optional[Grid]:
+    """
+    Решить судоку на битовых масках кандидатов.
+
+    Маски занятых цифр строк, столбцов и блоков обновляются инкрементально,
+    на каждом шаге расставляются naked и hidden singles, а ветвление идет
+    по клетке с наименьшим числом кандидатов (MRV). Сетка заполняется на месте,
+    как и в `solve`; при противоречивых подсказках возвращается None.
+    """
+    loaded = _load(grid)
+    if loaded is None:
+        return None
+    layout, cells, masks = loaded
+    solution = _search(layout, cells, masks, [pos for pos, bit in enumerate(cells) if not bit])
+    if solution is None:
+        return None
+    if isinstance(grid, Board):
+        grid.cells[:] = bytes(bit.bit_length() for bit in solution)
+        return grid
+    for pos, bit in enumerate(solution):
+        grid[pos // layout.size][pos % layout.size] = ALPHABET[bit.bit_length() - 1]
+    return grid
+
+
+def check_solution(solution: Grid) -> bool:
+    if isinstance(solution, Board):
+        expected = set(range(1, solution.size + 1))
+        units = _layout(solution.box).units
+        return all({solution.cells[pos] for pos in unit} == expected for unit in units)
+    box = math.isqrt(len(solution))
+    digits = set(ALPHABET[: len(solution)])
     for row in range(len(solution)):
-        if set(solution[row]) != set("123456789"):
+        if set(solution[row]) != digits:
             return False
     for col in range(len(solution)):
-        if set(get_col(solution, (0, col))) != set("123456789"):
+        if set(get_col(solution, (0, col))) != digits:
             return False
-    for block_row in range(0, 9, 3):
-        for block_col in range(0, 9, 3):
-            if set(get_block(solution, (block_row, block_col))) != set("123456789"):
+    for block_row in range(0, len(solution), box):
+        for block_col in range(0, len(solution), box):
+            if set(get_block(solution, (block_row, block_col))) != digits:
                 return False
     return True
 
@@ -88,13 +330,254 @@ def generate_sudoku(N: int) -> tp.List[tp.List[str]]:
         grid[pos[0]][pos[1]] = '.'
     return grid
 
-if __name__ == "__main__":
-    for filename in ("puzzle1.txt", "puzzle2.txt", "puzzle3.txt"):
-        grid = read_sudoku(filename)
-        display(grid)
-        solution = solve(grid)
-        if solution:
-            display(solution)
-            assert check_solution(solution)
+def _exact_cover(
+    grid: Grid, limit: int, shuffle: bool = False
+) -> tp.Tuple[int, tp.Optional[tp.List[tp.Tuple[int, str]]]]:
+    """
+    Алгоритм X Кнута на танцующих ссылках (DLX).
+
+    Столбцы матрицы — ограничения «клетка заполнена», «цифра в строке»,
+    «цифра в столбце» и «цифра в блоке», не покрытые подсказками; строки —
+    допустимые пары (клетка, цифра). Поиск останавливается, найдя `limit`
+    решений. Возвращает число найденных решений и первое из них в виде
+    списка пар (позиция, цифра) для пустых клеток.
+    """
+    loaded = _load(grid)
+    if loaded is None:
+        return 0, None
+    layout, cells, masks = loaded
+    size, area = layout.size, len(cells)
+
+    # Узел 0 — корень, далее 4 * area заголовков столбцов, затем узлы матрицы:
+    # столбец 1 + pos — клетка pos, area + 1 + size * unit + d — цифра d в ряду,
+    # столбце или блоке unit (нумерация рядов та же, что в masks). В список
+    # заголовков включаются только ограничения, не покрытые подсказками.
+    headers = 4 * area + 1
+    L = list(range(-1, headers - 1))
+    R = list(range(1, headers + 1))
+    U = list(range(headers))
+    D = list(range(headers))
+    C = list(range(headers))
+    S = [0] * headers
+    options: tp.List[tp.Tuple[int, str]] = [(-1, "")] * headers
+    active = [pos + 1 for pos in range(area) if not cells[pos]]
+    for unit, used in enumerate(masks):
+        active.extend(area + 1 + size * unit + d for d in range(size) if not used >> d & 1)
+    prev = 0
+    for col in active:
+        R[prev], L[col] = col, prev
+        prev = col
+    R[prev], L[0] = 0, prev
+
+    candidates = []
+    for pos, (row, col, box) in enumerate(layout.peers):
+        if cells[pos]:
+            continue
+        free = layout.full & ~(masks[row] | masks[col] | masks[box])
+        for d in range(size):
+            if free >> d & 1:
+                first = area + 1 + d
+                columns = (pos + 1, first + size * row, first + size * col, first + size * box)
+                candidates.append((pos, ALPHABET[d], columns))
+    if shuffle:
+        random.shuffle(candidates)
+    for pos, digit, columns in candidates:
+        node = len(L)
+        L.extend((node + 3, node, node + 1, node + 2))
+        R.extend((node + 1, node + 2, node + 3, node))
+        C.extend(columns)
+        S.extend((0, 0, 0, 0))
+        options.extend(((pos, digit),) * 4)
+        for col in columns:
+            U.append(U[col])
+            D.append(col)
+            D[U[col]] = node
+            U[col] = node
+            S[col] += 1
+            node += 1
+
+    def cover(col: int) -> None:
+        L[R[col]], R[L[col]] = L[col], R[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                U[D[j]], D[U[j]] = U[j], D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(col: int) -> None:
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[col]] = R[L[col]] = col
+
+    count = 0
+    chosen: tp.List[int] = []
+    first_solution: tp.Optional[tp.List[tp.Tuple[int, str]]] = None
+
+    def search() -> None:
+        nonlocal count, first_solution
+        if R[0] == 0:
+            count += 1
+            if first_solution is None:
+                first_solution = [options[node] for node in chosen]
+            return
+        col = best = R[0]
+        while col:
+            if S[col] < S[best]:
+                best = col
+                if S[col] < 2:
+                    break
+            col = R[col]
+        if not S[best]:
+            return
+        cover(best)
+        row = D[best]
+        while row != best and count < limit:
+            chosen.append(row)
+            j = R[row]
+            while j != row:
+                cover(C[j])
+                j = R[j]
+            search()
+            j = L[row]
+            while j != row:
+                uncover(C[j])
+                j = L[j]
+            chosen.pop()
+            row = D[row]
+        uncover(best)
+
+    search()
+    return count, first_solution
+
+
+def count_solutions(grid: Grid, limit: int = 2) -> int:
+    """
+    Посчитать решения судоку, остановившись на `limit`.
+
+    С limit=2 это проверка единственности: 0 — нет решений, 1 — решение
+    единственное, 2 — решений несколько.
+    """
+    count, _ = _exact_cover(grid, limit)
+    return count
+
+
+def generate_unique_sudoku(N: int) -> tp.List[tp.List[str]]:
+    """
+    Сгенерировать судоку с единственным решением и не менее чем N подсказками.
+
+    Из случайно заполненной сетки клетки удаляются в случайном порядке,
+    а удаление отменяется, если решение перестает быть единственным.
+    Если уже нельзя удалить ни одной клетки, подсказок останется больше N.
+    """
+    grid = [["."] * 9 for _ in range(9)]
+    _, solution = _exact_cover(grid, 1, shuffle=True)
+    for pos, digit in solution or []:
+        grid[pos // 9][pos % 9] = digit
+    positions = [(r, c) for r in range(9) for c in range(9)]
+    random.shuffle(positions)
+    clues = 81
+    for r, c in positions:
+        if clues <= N:
+            break
+        digit, grid[r][c] = grid[r][c], "."
+        if count_solutions(grid) == 1:
+            clues -= 1
         else:
-            print("No solution found")
+            grid[r][c] = digit
+    return grid
+
+
+def _solve_line(puzzle: str) -> tp.Optional[str]:
+    try:
+        grid = create_grid(puzzle)
+    except ValueError:
+        # пустая строка или испорченный пазл не должны останавливать весь поток
+        return None
+    solution = solve_bitset(grid)
+    if solution is None:
+        return None
+    return "".join(value for row in solution for value in row)
+
+
+def _solve_chunk(puzzles: tp.List[str]) -> tp.List[tp.Optional[str]]:
+    return [_solve_line(puzzle) for puzzle in puzzles]
+
+
+def solve_many(
+    puzzles: tp.Iterable[str], workers: tp.Optional[int] = None, chunksize: int = 512
+) -> tp.Iterator[tp.Optional[str]]:
+    """
+    Решить поток однострочных судоку, сохраняя порядок входа.
+
+    Пазлы читаются из итератора порциями по `chunksize` и раздаются пулу
+    процессов; одновременно в работе держится не больше `2 * workers` порций,
+    так что весь вход никогда не загружается в память. Для каждой строки
+    входа выдается ровно одно значение — строка решения или None, если
+    решения нет, строка пустая или число клеток не 81, 256 или 625, — так
+    что N-е решение всегда соответствует N-й строке.
+    """
+    lines = (line.strip() for line in puzzles)
+    chunks = iter(lambda: list(itertools.islice(lines, chunksize)), [])
+    workers = workers or multiprocessing.cpu_count()
+    if workers == 1:
+        for chunk in chunks:
+            yield from _solve_chunk(chunk)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        pending: tp.Deque[tp.Any] = collections.deque()
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                pending.append(pool.apply_async(_solve_chunk, (chunk,)))
+            while pending and (chunk is None or len(pending) >= 2 * workers):
+                yield from pending.popleft().get()
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Решение судоку, по одному пазлу в строке.")
+    parser.add_argument("input", nargs="?", default="-", help="файл с пазлами или - для stdin")
+    parser.add_argument("-o", "--output", default="-", help="файл для решений или - для stdout")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="число процессов")
+    parser.add_argument("--chunksize", type=int, default=512, help="пазлов в одной порции")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    target = sys.stdout if args.output == "-" else open(args.output, "w")
+    count = solved = 0
+    start = time.perf_counter()
+    try:
+        for solution in solve_many(source, workers=args.workers, chunksize=args.chunksize):
+            target.write((solution or "No solution found") + "\n")
+            count += 1
+            solved += solution is not None
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Solved {solved} of {count} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main()
+    else:
+        for filename in ("puzzle1.txt", "puzzle2.txt", "puzzle3.txt"):
+            grid = read_sudoku(filename)
+            display(grid)
+            solution = solve(grid)
+            if solution:
+                display(solution)
+                assert check_solution(solution)
+            else:
+                print("No solution found")
@@ -1,3 +1,5 @@
+import os
+import random
 import unittest
 
 import sudoku
@@ -170,6 +172,52 @@ class SudokuTestCase(unittest.TestCase):
         actual_solution = sudoku.solve(grid)
         self.assertEqual(expected_solution, actual_solution)
 
+    def test_solve_bitset(self):
+        tests_dir = os.path.dirname(__file__)
+        grid = sudoku.read_sudoku(os.path.join(tests_dir, "puzzle1.txt"))
+        expected_solution = [
+            ["5", "3", "4", "6", "7", "8", "9", "1", "2"],
+            ["6", "7", "2", "1", "9", "5", "3", "4", "8"],
+            ["1", "9", "8", "3", "4", "2", "5", "6", "7"],
+            ["8", "5", "9", "7", "6", "1", "4", "2", "3"],
+            ["4", "2", "6", "8", "5", "3", "7", "9", "1"],
+            ["7", "1", "3", "9", "2", "4", "8", "5", "6"],
+            ["9", "6", "1", "5", "3", "7", "2", "8", "4"],
+            ["2", "8", "7", "4", "1", "9", "6", "3", "5"],
+            ["3", "4", "5", "2", "8", "6", "1", "7", "9"],
+        ]
+        self.assertEqual(expected_solution, sudoku.solve_bitset(grid))
+
+        with open(os.path.join(tests_dir, "hard_puzzles.txt")) as f:
+            puzzles = [line.strip() for line in f if line.strip()]
+        for puzzle in puzzles[:10]:
+            solution = sudoku.solve_bitset(sudoku.create_grid(puzzle))
+            self.assertTrue(sudoku.check_solution(solution))
+            solved = "".join(value for row in solution for value in row)
+            self.assertTrue(all(c in (".", s) for c, s in zip(puzzle, solved)))
+
+        grid = sudoku.create_grid("11" + "." * 79)
+        self.assertIsNone(sudoku.solve_bitset(grid))
+
+    def test_solve_many(self):
+        tests_dir = os.path.dirname(__file__)
+        with open(os.path.join(tests_dir, "hard_puzzles.txt")) as f:
+            puzzles = [line.strip() for line in f][:6]
+        puzzles.insert(3, "11" + "." * 79)
+        puzzles.insert(1, "")
+        puzzles.append("12")
+        puzzles.append(puzzles[0][:80])
+        for workers in (1, 2):
+            solutions = list(sudoku.solve_many(puzzles, workers=workers, chunksize=2))
+            self.assertEqual(len(puzzles), len(solutions))
+            for index in (1, 4, 8, 9):
+                self.assertIsNone(solutions[index])
+            self.assertIsNotNone(solutions[0])
+            for puzzle, solution in zip(puzzles, solutions):
+                if solution is not None:
+                    self.assertTrue(sudoku.check_solution(sudoku.create_grid(solution)))
+                    self.assertTrue(all(c in (".", s) for c, s in zip(puzzle, solution)))
+
     def test_check_solution(self):
         good_solution = [
             ["5", "3", "4", "6", "7", "8", "9", "1", "2"],
@@ -239,4 +287,74 @@ class SudokuTestCase(unittest.TestCase):
         self.assertEqual(expected_unknown, actual_unknown)
         solution = sudoku.solve(grid)
         solved = sudoku.check_solution(solution)
-        self.assertTrue(solved)
\ No newline at end of file
+        self.assertTrue(solved)
+
+    def test_count_solutions(self):
+        tests_dir = os.path.dirname(__file__)
+        grid = sudoku.read_sudoku(os.path.join(tests_dir, "puzzle1.txt"))
+        self.assertEqual(1, sudoku.count_solutions(grid))
+        self.assertEqual(2, sudoku.count_solutions(sudoku.create_grid("." * 81)))
+        self.assertEqual(5, sudoku.count_solutions(sudoku.create_grid("." * 81), limit=5))
+        self.assertEqual(0, sudoku.count_solutions(sudoku.create_grid("11" + "." * 79)))
+
+        solution = sudoku.solve_bitset(grid)
+        self.assertEqual(1, sudoku.count_solutions(solution))
+        solution[0][0], solution[0][1] = solution[0][1], solution[0][0]
+        self.assertEqual(0, sudoku.count_solutions(solution))
+
+    def test_generate_unique_sudoku(self):
+        grid = sudoku.generate_unique_sudoku(40)
+        self.assertEqual(41, sum(1 for row in grid for e in row if e == "."))
+        self.assertEqual(1, sudoku.count_solutions(grid))
+
+        grid = sudoku.generate_unique_sudoku(0)
+        self.assertGreaterEqual(sum(1 for row in grid for e in row if e != "."), 17)
+        self.assertEqual(1, sudoku.count_solutions(grid))
+        self.assertTrue(sudoku.check_solution(sudoku.solve_bitset(grid)))
+
+    def test_create_grid_rejects_unsupported_sizes(self):
+        tests_dir = os.path.dirname(__file__)
+        with open(os.path.join(tests_dir, "hard_puzzles.txt")) as f:
+            puzzle = f.readline().strip()
+        for bad in (puzzle[:80], puzzle + ".", "12", "", "." * 16):
+            with self.assertRaises(ValueError):
+                sudoku.create_grid(bad)
+            with self.assertRaises(ValueError):
+                sudoku.create_grid(bad, compact=True)
+        self.assertEqual(9, len(sudoku.create_grid(puzzle)))
+
+    def test_board(self):
+        tests_dir = os.path.dirname(__file__)
+        board = sudoku.read_sudoku(os.path.join(tests_dir, "puzzle1.txt"), compact=True)
+        grid = sudoku.read_sudoku(os.path.join(tests_dir, "puzzle1.txt"))
+        self.assertIsInstance(board, sudoku.Board)
+        self.assertEqual(9, len(board))
+        self.assertEqual(grid, board.rows())
+        self.assertEqual("5", board[0, 0])
+        self.assertEqual(".", board[0, 2])
+        self.assertFalse(sudoku.check_solution(board))
+
+        solution = sudoku.solve(board)
+        self.assertIs(board, solution)
+        self.assertTrue(sudoku.check_solution(solution))
+        self.assertEqual(sudoku.solve(grid), solution.rows())
+
+    def test_solve_large_boards(self):
+        for box in (4, 5):
+            size = box * box
+            solved = "".join(
+                sudoku.ALPHABET[(box * (r % box) + r // box + c) % size] for r in range(size) for c in range(size)
+            )
+            random.seed(box)
+            puzzle = "".join("." if random.random() < 0.4 else value for value in solved)
+
+            board = sudoku.create_grid(puzzle, compact=True)
+            self.assertEqual(size, board.size)
+            solution = sudoku.solve(board)
+            self.assertTrue(sudoku.check_solution(solution))
+            flat = "".join(value for row in solution.rows() for value in row)
+            self.assertTrue(all(c in (".", s) for c, s in zip(puzzle, flat)))
+
+            grid = sudoku.create_grid(puzzle)
+            self.assertEqual(size, len(grid))
+            self.assertTrue(sudoku.check_solution(sudoku.solve_bitset(grid)))
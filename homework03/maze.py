@@ -1,8 +1,20 @@
+import heapq
+import sys
 from copy import deepcopy
-from random import choice, randint
-from typing import List, Optional, Tuple, Union
+from functools import partial
+from random import choice, getrandbits, randint
+from typing import Callable, Dict, Generator, Iterator, List, Optional, TextIO, Tuple, Union
 
-import pandas as pd
+import numpy as np
+
+# Коды клеток компактного лабиринта: байт на клетку в массиве NumPy
+FREE, WALL, EXIT = 0, 1, 2
+SYMBOLS = (" ", "■", "X")
+
+Maze = np.ndarray
+
+# Порция случайных чисел, которую генераторы с циклом на Python берут за раз
+_RANDOM_CHUNK = 1 << 16
 
 
 def create_grid(rows: int = 15, cols: int = 15) -> List[List[Union[str, int]]]:
@@ -13,133 +25,926 @@ def remove_wall(
     grid: List[List[Union[str, int]]], coord: Tuple[int, int]
 ) -> List[List[Union[str, int]]]:
     """
+    Снести стену над клеткой `coord` или справа от нее.
 
-    :param grid:
-    :param coord:
-    :return:
+    Направление выбирается случайно; если в выбранном направлении граница
+    поля, сносится стена во втором направлении. У правого верхнего угла
+    обе стены граничные, и лабиринт не меняется.
     """
+    x, y = coord
+    direction = choice(("up", "right"))
+    can_go_up, can_go_right = x > 1, y < len(grid[0]) - 2
+    if can_go_right and (direction == "right" or not can_go_up):
+        grid[x][y + 1] = " "
+    elif can_go_up:
+        grid[x - 1][y] = " "
+    return grid
 
-    pass
 
+def lattice(rows: int, cols: int, out: Optional[Maze] = None) -> Maze:
+    """
+    Компактное поле `rows` x `cols` из стен с пустыми клетками на нечетных координатах.
 
-def bin_tree_maze(
-    rows: int = 15, cols: int = 15, random_exit: bool = True
-) -> List[List[Union[str, int]]]:
+    Если передан буфер `out` (например, файл из `maze_io.create_maze_file`),
+    поле строится в нем.
     """
+    if out is None:
+        grid = np.full((rows, cols), WALL, dtype=np.uint8)
+    else:
+        if out.shape != (rows, cols) or out.dtype != np.uint8:
+            raise ValueError(f"Maze buffer must be uint8 of shape {(rows, cols)}")
+        grid = out
+        grid.fill(WALL)
+    grid[1 : rows - 1 : 2, 1 : cols - 1 : 2] = FREE
+    return grid
 
-    :param rows:
-    :param cols:
-    :param random_exit:
-    :return:
+
+def _cell_shape(grid: Maze) -> Tuple[int, int]:
+    # число клеток решетки по вертикали и горизонтали
+    rows, cols = grid.shape
+    return len(range(1, rows - 1, 2)), len(range(1, cols - 1, 2))
+
+
+def _generator(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    # без явного генератора лабиринт воспроизводится через random.seed
+    return rng if rng is not None else np.random.default_rng(getrandbits(64))
+
+
+def _random_stream(rng: np.random.Generator, high: Optional[int] = None) -> Iterator:
+    # бесконечный поток случайных чисел, которые выдаются порциями
+    while True:
+        if high is None:
+            yield from rng.random(_RANDOM_CHUNK).tolist()
+        else:
+            yield from rng.integers(0, high, _RANDOM_CHUNK, dtype=np.uint8).tobytes()
+
+
+def _place_exits(grid: Maze, random_exit: bool = True, rng: Optional[np.random.Generator] = None) -> Maze:
     """
+    Отметить вход и выход на границе поля.
 
-    grid = create_grid(rows, cols)
-    empty_cells = []
-    for x, row in enumerate(grid):
-        for y, _ in enumerate(row):
-            if x % 2 == 1 and y % 2 == 1:
-                grid[x][y] = " "
-                empty_cells.append((x, y))
-
-    # 1. выбрать любую клетку
-    # 2. выбрать направление: наверх или направо.
-    # Если в выбранном направлении следующая клетка лежит за границами поля,
-    # выбрать второе возможное направление
-    # 3. перейти в следующую клетку, сносим между клетками стену
-    # 4. повторять 2-3 до тех пор, пока не будут пройдены все клетки
-
-    # генерация входа и выхода
-    if random_exit:
-        x_in, x_out = randint(0, rows - 1), randint(0, rows - 1)
-        y_in = randint(0, cols - 1) if x_in in (0, rows - 1) else choice((0, cols - 1))
-        y_out = randint(0, cols - 1) if x_out in (0, rows - 1) else choice((0, cols - 1))
-    else:
+    Без `rng` случайные координаты берутся из модуля `random`, как в
+    `bin_tree_maze`.
+    """
+    rows, cols = grid.shape
+    if not random_exit:
         x_in, y_in = 0, cols - 2
         x_out, y_out = rows - 1, 1
+    else:
+        if rng is None:
+            randint_: Callable[[int, int], int] = randint
+            choice_: Callable[[Tuple[int, int]], int] = choice
+        else:
+            randint_ = lambda low, high: int(rng.integers(low, high + 1))  # noqa: E731
+            choice_ = lambda options: options[int(rng.integers(len(options)))]  # noqa: E731
+        x_in, x_out = randint_(0, rows - 1), randint_(0, rows - 1)
+        y_in = randint_(0, cols - 1) if x_in in (0, rows - 1) else choice_((0, cols - 1))
+        y_out = randint_(0, cols - 1) if x_out in (0, rows - 1) else choice_((0, cols - 1))
+    grid[x_in, y_in] = EXIT
+    grid[x_out, y_out] = EXIT
+    return grid
 
-    grid[x_in][y_in], grid[x_out][y_out] = "X", "X"
 
+def carve_bin_tree(grid: Maze, rng: Optional[np.random.Generator] = None) -> Maze:
+    """
+    Двоичное дерево: у каждой клетки сносится стена сверху или справа.
+
+    С генератором `rng` направления выбираются для всех клеток сразу
+    операциями над массивами. Без него клетки обходятся построчно, и на
+    каждую тратится один вызов `random.choice`, как в `remove_wall`,
+    поэтому лабиринт совпадает с построенным на списках при том же `random.seed`.
+    """
+    height, width = _cell_shape(grid)
+    north = grid[0 : 2 * height : 2, 1 : 2 * width : 2]
+    east = grid[1 : 2 * height : 2, 2 : 2 * width + 1 : 2]
+    up_ok = np.zeros((height, width), dtype=bool)
+    up_ok[1:] = True
+    right_ok = np.zeros((height, width), dtype=bool)
+    right_ok[:, :-1] = True
+    if rng is None:
+        right = np.fromiter(
+            (choice(("up", "right")) == "right" for _ in range(height * width)), dtype=bool, count=height * width
+        ).reshape(height, width)
+    else:
+        right = rng.integers(0, 2, (height, width), dtype=np.uint8).astype(bool)
+    go_right = right_ok & (right | ~up_ok)
+    go_up = up_ok & ~go_right
+    north[go_up] = FREE
+    east[go_right] = FREE
     return grid
 
 
-def get_exits(grid: List[List[Union[str, int]]]) -> List[Tuple[int, int]]:
+def carve_sidewinder(grid: Maze, rng: Optional[np.random.Generator] = None) -> Maze:
+    """
+    Sidewinder: строки клеток делятся на случайные отрезки, верхний ряд — один коридор.
+
+    В каждом отрезке сносятся стены между соседями и одна стена вверх из
+    случайной клетки отрезка. Все отрезки всех строк обрабатываются сразу.
     """
+    rng = _generator(rng)
+    height, width = _cell_shape(grid)
+    if height == 0 or width == 0:
+        return grid
+    east = grid[1 : 2 * height : 2, 2 : 2 * width - 1 : 2]
+    east[0] = FREE
+    if height < 2:
+        return grid
+    close = rng.random((height - 1, width)) < 0.5
+    close[:, -1] = True
+    east[1:][~close[:, :-1]] = FREE
+    ends = np.flatnonzero(close)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    picks = starts + (rng.random(len(ends)) * (ends - starts + 1)).astype(np.int64)
+    xs, ys = np.divmod(picks, width)
+    grid[2 * xs + 2, 2 * ys + 1] = FREE
+    return grid
+
 
-    :param grid:
-    :return:
+def _cell_marks(grid: Maze, outside: int) -> bytearray:
     """
+    Плоская разметка поля: клетки решетки — 0, остальное — `outside`.
 
-    pass
+    Разметка длиннее поля на две строки, поэтому шаг к соседу через
+    границу попадает в отметку `outside` без проверок координат.
+    """
+    rows, cols = grid.shape
+    marks = np.full(rows * cols + 2 * cols, outside, dtype=np.uint8)
+    marks[: rows * cols].reshape(rows, cols)[1 : rows - 1 : 2, 1 : cols - 1 : 2] = 0
+    return bytearray(marks.tobytes())
 
 
-def make_step(grid: List[List[Union[str, int]]], k: int) -> List[List[Union[str, int]]]:
+def carve_backtracker(grid: Maze, rng: Optional[np.random.Generator] = None) -> Maze:
     """
+    Поиск с возвратом на явном стеке вместо рекурсии.
 
-    :param grid:
-    :param k:
-    :return:
+    Из текущей клетки идем в случайного непосещенного соседа, снося стену;
+    если таких нет, возвращаемся по стеку. Глубина стека ограничена только
+    памятью, поэтому ограничение на глубину рекурсии не мешает.
     """
+    rng = _generator(rng)
+    cols = grid.shape[1]
+    # байты поля и разметка в bytearray: доступ по индексу намного быстрее, чем к массиву NumPy
+    walls = bytearray(grid.tobytes())
+    visited = _cell_marks(grid, 1)
+    cells = np.flatnonzero(np.frombuffer(visited, dtype=np.uint8) == 0)
+    if not len(cells):
+        return grid
+    up, down = -2 * cols, 2 * cols
+    randoms = _random_stream(rng)
+    start = int(cells[rng.integers(len(cells))])
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        options = []
+        if not visited[cell + up]:
+            options.append(cell + up)
+        if not visited[cell + 2]:
+            options.append(cell + 2)
+        if not visited[cell + down]:
+            options.append(cell + down)
+        if not visited[cell - 2]:
+            options.append(cell - 2)
+        if not options:
+            stack.pop()
+            continue
+        other = options[int(next(randoms) * len(options))]
+        walls[(cell + other) >> 1] = FREE
+        visited[other] = 1
+        stack.append(other)
+    grid.reshape(-1)[:] = np.frombuffer(walls, dtype=np.uint8)
+    return grid
 
-    pass
+
+def carve_wilson(grid: Maze, rng: Optional[np.random.Generator] = None) -> Maze:
+    """
+    Алгоритм Уилсона: равномерно случайное остовное дерево решетки.
+
+    Из каждой клетки вне дерева делается случайное блуждание до дерева;
+    для клетки запоминается только последнее направление выхода, так что
+    петли стираются сами. Затем путь проходится заново и присоединяется к
+    дереву. Первые блуждания долгие, поэтому алгоритм медленнее остальных.
+    """
+    rng = _generator(rng)
+    cols = grid.shape[1]
+    walls = bytearray(grid.tobytes())
+    # 0 — клетка вне дерева, 1 — в дереве, 2 — не клетка решетки
+    state = _cell_marks(grid, 2)
+    cells = np.flatnonzero(np.frombuffer(state, dtype=np.uint8) == 0)
+    if not len(cells):
+        return grid
+    steps = (-2 * cols, 2, 2 * cols, -2)
+    exit_step = bytearray(len(state))
+    directions = _random_stream(rng, 4)
+    state[int(cells[rng.integers(len(cells))])] = 1
+    for start in rng.permutation(cells).tolist():
+        cell = start
+        while not state[cell]:
+            direction = next(directions)
+            if state[cell + steps[direction]] != 2:
+                exit_step[cell] = direction
+                cell += steps[direction]
+        cell = start
+        while not state[cell]:
+            state[cell] = 1
+            other = cell + steps[exit_step[cell]]
+            walls[(cell + other) >> 1] = FREE
+            cell = other
+    grid.reshape(-1)[:] = np.frombuffer(walls, dtype=np.uint8)
+    return grid
+
+
+GENERATORS: Dict[str, Callable[[Maze, Optional[np.random.Generator]], Maze]] = {
+    "bin_tree": carve_bin_tree,
+    "sidewinder": carve_sidewinder,
+    "backtracker": carve_backtracker,
+    "wilson": carve_wilson,
+}
+
+
+def generate_maze(
+    rows: int = 15,
+    cols: int = 15,
+    algorithm: str = "bin_tree",
+    random_exit: bool = True,
+    rng: Optional[np.random.Generator] = None,
+    out: Optional[Maze] = None,
+) -> Maze:
+    """
+    Компактный лабиринт `rows` x `cols` (коды FREE, WALL, EXIT) алгоритмом из `GENERATORS`.
+
+    Все алгоритмы строят идеальный лабиринт: между любыми двумя клетками
+    ровно один путь. Без `rng` генератор NumPy инициализируется из модуля
+    `random`, и лабиринт воспроизводится через `random.seed`. С буфером
+    `out` лабиринт строится прямо в нем (см. `lattice`).
+    """
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Unknown maze algorithm: {algorithm!r}")
+    if rng is None:
+        rng = _generator(rng)
+    grid = GENERATORS[algorithm](lattice(rows, cols, out), rng)
+    return _place_exits(grid, random_exit, rng)
+
+
+def to_list(grid: Maze) -> List[List[Union[str, int]]]:
+    """
+    Лабиринт в виде списка строк из символов "■", " " и "X".
+    """
+    return np.array(SYMBOLS, dtype=object)[grid].tolist()
+
+
+def bin_tree_maze(
+    rows: int = 15, cols: int = 15, random_exit: bool = True, out: Optional[Maze] = None
+) -> Union[List[List[Union[str, int]]], Maze]:
+    """
+    Лабиринт алгоритмом двоичного дерева в виде списка строк.
+
+    Случайные числа берутся из модуля `random` в том же порядке, что и при
+    вызове `remove_wall` для каждой клетки: сначала направления всех клеток
+    построчно, затем вход и выход. Если передан буфер `out`, лабиринт
+    строится в нем и возвращается сам буфер, без списка строк.
+    """
+    grid = _place_exits(carve_bin_tree(lattice(rows, cols, out)), random_exit)
+    return grid if out is not None else to_list(grid)
+
+
+Grid = Union[List[List[Union[str, int]]], Maze]
+Coord = Tuple[int, int]
+
+# Метки массива расстояний: непройденная клетка и стена
+UNREACHED, BLOCKED = -1, -2
+
+# Волну из стольких клеток дешевле обойти циклом, чем операциями над массивами
+_SCALAR_FRONTIER = 32
+
+_CODES = str.maketrans({" ": chr(FREE), "■": chr(WALL), "X": chr(EXIT)})
+
+
+def from_list(grid: Grid) -> Maze:
+    """
+    Компактный лабиринт из списка строк; числа волны считаются проходом.
+    """
+    if isinstance(grid, np.ndarray):
+        return grid
+    try:
+        rows = ["".join(row).translate(_CODES).encode("latin-1") for row in grid]
+    except TypeError:
+        # в лабиринте уже есть номера шагов волны
+        rows = [bytes(WALL if value == "■" else EXIT if value == "X" else FREE for value in row) for row in grid]
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(grid), -1).copy()
+
+
+def get_exits(grid: Grid) -> List[Coord]:
+    """
+    Координаты входа и выхода (клеток "X") построчно.
+    """
+    if isinstance(grid, np.ndarray):
+        return [(int(x), int(y)) for x, y in np.argwhere(grid == EXIT)]
+    return [(x, y) for x, row in enumerate(grid) for y, value in enumerate(row) if value == "X"]
+
+
+def make_step(grid: List[List[Union[str, int]]], k: int) -> List[List[Union[str, int]]]:
+    """
+    Один шаг волны: соседи клеток с номером `k`, помеченные 0, получают номер `k + 1`.
+
+    Шаг просматривает все поле, поэтому `solve_maze` им не пользуется, а
+    обходит лабиринт в ширину (см. `bfs_distances`).
+    """
+    rows, cols = len(grid), len(grid[0])
+    for x, row in enumerate(grid):
+        for y, value in enumerate(row):
+            if value != k or isinstance(value, str):
+                continue
+            for nx, ny in ((x - 1, y), (x, y + 1), (x + 1, y), (x, y - 1)):
+                if 0 <= nx < rows and 0 <= ny < cols and grid[nx][ny] == 0 and not isinstance(grid[nx][ny], str):
+                    grid[nx][ny] = k + 1
+    return grid
 
 
 def shortest_path(
     grid: List[List[Union[str, int]]], exit_coord: Tuple[int, int]
 ) -> Optional[Union[Tuple[int, int], List[Tuple[int, int]]]]:
     """
+    Путь от `exit_coord` до клетки с номером 1 по убыванию номеров волны.
+
+    Если у клетки пути нет соседа с номером на единицу меньше, пути нет.
+    """
+    rows, cols = len(grid), len(grid[0])
+    x, y = exit_coord
+    k = grid[x][y]
+    path = [(x, y)]
+    while k != 1:
+        for nx, ny in ((x - 1, y), (x, y + 1), (x + 1, y), (x, y - 1)):
+            if 0 <= nx < rows and 0 <= ny < cols and grid[nx][ny] == k - 1 and not isinstance(grid[nx][ny], str):
+                x, y, k = nx, ny, k - 1
+                path.append((x, y))
+                break
+        else:
+            return None
+    return path
+
+
+def _is_wall(grid: Grid, x: int, y: int) -> bool:
+    # в списке строк стена — символ, в компактном лабиринте — код WALL
+    if isinstance(grid, np.ndarray):
+        return bool(grid[x, y] == WALL)
+    return grid[x][y] == "■"
+
+
+def encircled_exit(grid: Grid, coord: Coord) -> bool:
+    """
+    Заперт ли выход `coord`: из него нельзя шагнуть внутрь лабиринта.
+
+    Выход в углу заперт всегда, выход на стороне — если соседняя с ним
+    клетка внутри поля стена. Клетка не на границе выходом не считается
+    и запертой не бывает.
+    """
+    rows, cols = len(grid), len(grid[0])
+    x, y = coord
+    if x in (0, rows - 1) and y in (0, cols - 1):
+        return True
+    if x in (0, rows - 1):
+        return _is_wall(grid, 1 if x == 0 else rows - 2, y)
+    if y in (0, cols - 1):
+        return _is_wall(grid, x, 1 if y == 0 else cols - 2)
+    return False
+
+
+def distance_buffer(shape: Tuple[int, int]) -> np.ndarray:
+    """
+    Массив расстояний для `bfs_distances`: поле с рамкой шириной в одну клетку.
+
+    Один буфер можно передавать в несколько поисков на лабиринтах одного размера.
+    """
+    rows, cols = shape
+    return np.empty((rows + 2, cols + 2), dtype=np.int32)
+
+
+def _prepare(grid: Maze, dist: Optional[np.ndarray]) -> np.ndarray:
+    # расстояния с рамкой из стен: у любой клетки поля есть четыре соседа в массиве
+    if dist is None:
+        dist = distance_buffer(grid.shape)
+    elif dist.shape != (grid.shape[0] + 2, grid.shape[1] + 2) or dist.dtype != np.int32:
+        raise ValueError(f"Distance buffer must be int32 of shape {(grid.shape[0] + 2, grid.shape[1] + 2)}")
+    dist[0], dist[-1], dist[:, 0], dist[:, -1] = BLOCKED, BLOCKED, BLOCKED, BLOCKED
+    # проход — BLOCKED + 1, то есть UNREACHED; без маски и лишних копий поля
+    inner = dist[1:-1, 1:-1]
+    np.not_equal(grid, WALL, out=inner, casting="unsafe")
+    inner += BLOCKED
+    return dist
+
+
+def _flat(dist: np.ndarray, cell: Coord) -> int:
+    return (cell[0] + 1) * dist.shape[1] + cell[1] + 1
+
+
+def _expand(dist: np.ndarray, frontier: Union[List[int], np.ndarray], level: int) -> Union[List[int], np.ndarray]:
+    """
+    Пометить номером `level` непройденных соседей волны `frontier` и вернуть новую волну.
+
+    Узкая волна обходится циклом по memoryview, широкая — операциями над массивами.
+    """
+    width = dist.shape[1]
+    flat = dist.reshape(-1)
+    if len(frontier) <= _SCALAR_FRONTIER:
+        view = memoryview(flat)
+        reached = []
+        for cell in frontier.tolist() if isinstance(frontier, np.ndarray) else frontier:
+            for other in (cell - width, cell + 1, cell + width, cell - 1):
+                if view[other] == UNREACHED:
+                    view[other] = level
+                    reached.append(other)
+        return reached
+    cells = (np.asarray(frontier)[:, None] + np.array([-width, 1, width, -1])).reshape(-1)
+    cells = cells[flat[cells] == UNREACHED]
+    # клетка, достижимая из нескольких клеток волны, остается одна: на месте
+    # каждой записывается своя отрицательная метка, и выживает последняя
+    tags = -3 - np.arange(len(cells), dtype=np.int32)
+    flat[cells] = tags
+    cells = cells[flat[cells] == tags]
+    flat[cells] = level
+    return cells
+
+
+def bfs_distances(
+    grid: Maze,
+    sources: List[Coord],
+    dist: Optional[np.ndarray] = None,
+    target: Optional[Coord] = None,
+) -> np.ndarray:
+    """
+    Расстояния от ближайшего из `sources` до клеток компактного лабиринта.
+
+    Обход в ширину идет волнами и пишет номер волны в массив int32 с рамкой
+    (см. `distance_buffer`): UNREACHED — проход, до которого не дошли,
+    BLOCKED — стена. Если задана клетка `target`, обход останавливается,
+    как только до нее дошли. Возвращает весь массив с рамкой.
+    """
+    dist = _prepare(grid, dist)
+    for _ in _waves(dist, sources, target):
+        pass
+    return dist
+
+
+def _waves(
+    dist: np.ndarray, sources: List[Coord], target: Optional[Coord] = None
+) -> Iterator[Union[List[int], np.ndarray]]:
+    # волны обхода в ширину по подготовленному массиву `dist` в плоских номерах клеток
+    flat = dist.reshape(-1)
+    frontier: Union[List[int], np.ndarray] = list(
+        dict.fromkeys(cell for cell in map(partial(_flat, dist), sources) if flat[cell] == UNREACHED)
+    )
+    flat[frontier] = 0
+    stop = _flat(dist, target) if target is not None else None
+    level = 0
+    while len(frontier):
+        yield frontier
+        if stop is not None and flat[stop] != UNREACHED:
+            return
+        level += 1
+        frontier = _expand(dist, frontier, level)
+
+
+def bfs_waves(
+    grid: Maze,
+    sources: List[Coord],
+    dist: Optional[np.ndarray] = None,
+    target: Optional[Coord] = None,
+) -> Generator[np.ndarray, None, np.ndarray]:
+    """
+    Обход в ширину по шагам: выдает клетки каждой волны массивом N x 2.
+
+    Первая волна — сами `sources`. Расстояния пишутся в `dist`, как в
+    `bfs_distances`; по окончании генератор возвращает этот массив
+    (значение `StopIteration`, результат `yield from`).
+    """
+    dist = _prepare(grid, dist)
+    width = dist.shape[1]
+    for frontier in _waves(dist, sources, target):
+        xs, ys = np.divmod(np.asarray(frontier, dtype=np.int64), width)
+        yield np.stack((xs - 1, ys - 1), axis=1)
+    return dist
+
+
+def _walk_back(dist: np.ndarray, cell: int) -> List[int]:
+    # от клетки к источнику волны по соседям с номером на единицу меньше
+    width = dist.shape[1]
+    view = memoryview(dist.reshape(-1))
+    path = [cell]
+    level = view[cell]
+    while level > 0:
+        level -= 1
+        for other in (cell - width, cell + 1, cell + width, cell - 1):
+            if view[other] == level:
+                cell = other
+                break
+        path.append(cell)
+    return path
+
+
+def _coords(dist: np.ndarray, cells: List[int]) -> List[Coord]:
+    xs, ys = np.divmod(np.array(cells, dtype=np.int64), dist.shape[1])
+    return list(zip((xs - 1).tolist(), (ys - 1).tolist()))
+
+
+def bfs_path(
+    grid: Maze, source: Coord, target: Coord, dist: Optional[np.ndarray] = None
+) -> Optional[List[Coord]]:
+    """
+    Кратчайший путь от `source` до `target` обходом в ширину или None.
+
+    Волна идет от `target`, поэтому путь, собранный по убыванию номеров от
+    `source`, сразу получается в нужном порядке.
+    """
+    dist = bfs_distances(grid, [target], dist, target=source)
+    start = _flat(dist, source)
+    if dist.reshape(-1)[start] < 0:
+        return None
+    return _coords(dist, _walk_back(dist, start))
+
+
+def bidirectional_path(grid: Maze, source: Coord, target: Coord) -> Optional[List[Coord]]:
+    """
+    Кратчайший путь от `source` до `target` встречными волнами или None.
+
+    Каждый раз на шаг продвигается более узкая волна; на первом уровне,
+    где волны встретились, выбирается клетка встречи с наименьшей суммой
+    расстояний. Волны проходят примерно вдвое меньше клеток, чем одна.
+    """
+    sides = [_prepare(grid, None), _prepare(grid, None)]
+    flats = [side.reshape(-1) for side in sides]
+    starts = [_flat(sides[0], source), _flat(sides[1], target)]
+    if any(flat[cell] != UNREACHED for flat, cell in zip(flats, starts)):
+        return None
+    frontiers: List[Union[List[int], np.ndarray]] = [[starts[0]], [starts[1]]]
+    levels = [0, 0]
+    for flat, cell in zip(flats, starts):
+        flat[cell] = 0
+    meeting = starts[0] if starts[0] == starts[1] else None
+    while meeting is None and len(frontiers[0]) and len(frontiers[1]):
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        levels[side] += 1
+        frontiers[side] = _expand(sides[side], frontiers[side], levels[side])
+        reached = np.asarray(frontiers[side], dtype=np.int64)
+        other = flats[1 - side][reached]
+        hits = reached[other >= 0]
+        if len(hits):
+            meeting = int(hits[np.argmin(other[other >= 0])])
+    if meeting is None:
+        return None
+    head = _walk_back(sides[0], meeting)
+    tail = _walk_back(sides[1], meeting)
+    return _coords(sides[0], head[::-1] + tail[1:])
+
+
+def nearest_exit(
+    grid: Grid, start: Coord, exits: Optional[List[Coord]] = None, dist: Optional[np.ndarray] = None
+) -> Optional[Tuple[Coord, List[Coord]]]:
+    """
+    Ближайший к `start` выход и путь до него за один обход.
 
-    :param grid:
-    :param exit_coord:
-    :return:
+    Волна идет сразу от всех выходов (по умолчанию — всех клеток EXIT,
+    кроме `start`, без запертых) и останавливается, дойдя до `start`;
+    путь по убыванию номеров волны заканчивается в ближайшем выходе.
+    Возвращает (выход, путь от `start` до выхода) или None. Лабиринт может
+    быть списком строк или компактным массивом.
+    """
+    grid = from_list(grid)
+    if exits is None:
+        exits = [cell for cell in get_exits(grid) if cell != start and not encircled_exit(grid, cell)]
+    if not exits:
+        return None
+    dist = bfs_distances(grid, exits, dist, target=start)
+    cell = _flat(dist, start)
+    if dist.reshape(-1)[cell] < 0:
+        return None
+    path = _coords(dist, _walk_back(dist, cell))
+    return path[-1], path
+
+
+def _manhattan(cell: int, other: int, width: int) -> int:
+    # манхэттенское расстояние между клетками плоского поля ширины `width`
+    x, y = divmod(cell, width)
+    ox, oy = divmod(other, width)
+    return abs(x - ox) + abs(y - oy)
+
+
+def astar_path(
+    grid: Maze, source: Coord, target: Coord, dist: Optional[np.ndarray] = None
+) -> Optional[List[Coord]]:
     """
-    pass
+    Кратчайший путь от `source` до `target` алгоритмом A* или None.
+
+    Эвристика — манхэттенское расстояние, она согласована с шагами по
+    четырем направлениям, поэтому номер клетки в `dist` окончателен, как
+    только ее достали из кучи. При равных оценках первой берется клетка,
+    дальше ушедшая от `source`. Путь собирается по `dist`, как после обхода в ширину.
+    """
+    dist = _prepare(grid, dist)
+    view = memoryview(dist.reshape(-1))
+    width = dist.shape[1]
+    start, goal = _flat(dist, source), _flat(dist, target)
+    if view[start] == BLOCKED or view[goal] == BLOCKED:
+        return None
+    view[start] = 0
+    heap = [(_manhattan(start, goal, width), 0, start)]
+    while heap:
+        _, depth, cell = heapq.heappop(heap)
+        cost = -depth
+        if cell == goal:
+            return _coords(dist, _walk_back(dist, goal))[::-1]
+        if cost > view[cell]:
+            continue  # клетку уже достали из кучи с меньшей стоимостью
+        cost += 1
+        for other in (cell - width, cell + 1, cell + width, cell - 1):
+            known = view[other]
+            if known == UNREACHED or known > cost:
+                view[other] = cost
+                heapq.heappush(heap, (cost + _manhattan(other, goal, width), -cost, other))
+    return None
+
+
+def _next_event(events: np.ndarray) -> np.ndarray:
+    # для каждой клетки строки — индекс ближайшего события справа от нее (включительно)
+    cols = events.shape[1]
+    index = np.where(events, np.arange(cols, dtype=np.int32), np.int32(cols))
+    return np.minimum.accumulate(index[:, ::-1], axis=1)[:, ::-1]
+
+
+def _jump_events(passable: np.ndarray, goal: Tuple[int, int]) -> Dict[Tuple[int, int], np.ndarray]:
+    """
+    Где останавливаются прыжки JPS в каждом из четырех направлений.
+
+    `passable` — проходимость поля с рамкой из стен. Прыжок по прямой
+    кончается на стене (пути нет) или на точке перехода: цели или клетке,
+    у которой сбоку проход, а у предыдущей клетки на том же боку стена.
+    Вертикальный прыжок кончается еще и там, откуда горизонтальный прыжок
+    вбок находит точку перехода. Маски строятся для всего поля сразу, так
+    что каждый прыжок — один поиск первой истины в строке или столбце.
+    """
+    blocked = ~passable
+    target = np.zeros_like(passable)
+    target[goal] = True
+    events = {}
+    for step in (1, -1):
+        # сбоку проход, а у предыдущей (по ходу) клетки на том же боку стена
+        forced = np.zeros_like(passable)
+        behind = np.roll(blocked, step, axis=1)
+        forced[1:-1] = passable[:-2] & behind[:-2] | passable[2:] & behind[2:]
+        events[(0, step)] = blocked | target | forced
+    reaches = {}
+    for step in (1, -1):
+        stops = events[(0, step)] if step == 1 else events[(0, step)][:, ::-1]
+        found = passable if step == 1 else passable[:, ::-1]
+        hit = np.take_along_axis(found, np.minimum(_next_event(stops), stops.shape[1] - 1), axis=1)
+        reaches[step] = hit if step == 1 else hit[:, ::-1]
+    for step in (1, -1):
+        forced = np.zeros_like(passable)
+        behind = np.roll(blocked, step, axis=0)
+        forced[:, 1:-1] = passable[:, :-2] & behind[:, :-2] | passable[:, 2:] & behind[:, 2:]
+        sideways = np.zeros_like(passable)
+        sideways[:, :-1] |= reaches[1][:, 1:]
+        sideways[:, 1:] |= reaches[-1][:, :-1]
+        events[(step, 0)] = blocked | target | forced | sideways
+    return events
+
+
+def _jump(
+    events: Dict[Tuple[int, int], np.ndarray], passable: np.ndarray, x: int, y: int, dx: int, dy: int
+) -> Optional[Tuple[int, int]]:
+    # прыжок из (x, y) по направлению (dx, dy) до первого события; на стене точки нет
+    stops = events[(dx, dy)]
+    if dy == 1:
+        y += int(stops[x, y:].argmax())
+    elif dy == -1:
+        y -= int(stops[x, y::-1].argmax())
+    elif dx == 1:
+        x += int(stops[x:, y].argmax())
+    else:
+        x -= int(stops[x::-1, y].argmax())
+    return (x, y) if passable[x, y] else None
 
 
-def encircled_exit(grid: List[List[Union[str, int]]], coord: Tuple[int, int]) -> bool:
+def jps_path(grid: Maze, source: Coord, target: Coord) -> Optional[List[Coord]]:
     """
+    Кратчайший путь от `source` до `target` поиском с прыжками (JPS) или None.
 
-    :param grid:
-    :param coord:
-    :return:
+    Вариант A* для открытых полей: из клетки ищутся не соседи, а точки
+    перехода по прямым (см. `_jump_events`), так что в кучу попадают только
+    повороты пути. Шаг назад, к родителю, не рассматривается. В узких
+    коридорах лабиринта выигрыша нет, там лучше `bfs_path`.
+    """
+    passable = np.zeros((grid.shape[0] + 2, grid.shape[1] + 2), dtype=bool)
+    np.not_equal(grid, WALL, out=passable[1:-1, 1:-1])
+    start, goal = (source[0] + 1, source[1] + 1), (target[0] + 1, target[1] + 1)
+    if not passable[start] or not passable[goal]:
+        return None
+    events = _jump_events(passable, goal)
+    costs = {start: 0}
+    parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+    heap = [(abs(start[0] - goal[0]) + abs(start[1] - goal[1]), 0, start)]
+    while heap:
+        _, depth, cell = heapq.heappop(heap)
+        cost = -depth
+        if cell == goal:
+            break
+        if cost > costs[cell]:
+            continue
+        x, y = cell
+        parent = parents[cell]
+        back = None if parent is None else _direction(cell, parent)
+        for dx, dy in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+            if (dx, dy) == back or not passable[x + dx, y + dy]:
+                continue
+            point = _jump(events, passable, x + dx, y + dy, dx, dy)
+            if point is None:
+                continue
+            reached = cost + abs(point[0] - x) + abs(point[1] - y)
+            if reached < costs.get(point, reached + 1):
+                costs[point] = reached
+                parents[point] = cell
+                estimate = abs(point[0] - goal[0]) + abs(point[1] - goal[1])
+                heapq.heappush(heap, (reached + estimate, -reached, point))
+    else:
+        return None
+    turns = [goal]
+    while parents[turns[-1]] is not None:
+        turns.append(parents[turns[-1]])  # type: ignore[arg-type]
+    turns.reverse()
+    path = [(turns[0][0] - 1, turns[0][1] - 1)]
+    for (x, y), point in zip(turns, turns[1:]):
+        dx, dy = _direction((x, y), point)
+        while (x, y) != point:
+            x, y = x + dx, y + dy
+            path.append((x - 1, y - 1))
+    return path
+
+
+def _direction(cell: Tuple[int, int], other: Tuple[int, int]) -> Tuple[int, int]:
+    # единичный шаг вдоль прямой от `cell` к `other`
+    return (other[0] > cell[0]) - (other[0] < cell[0]), (other[1] > cell[1]) - (other[1] < cell[1])
+
+
+SOLVERS: Dict[str, Callable[[Maze, Coord, Coord], Optional[List[Coord]]]] = {
+    "bfs": bfs_path,
+    "bidirectional": bidirectional_path,
+    "astar": astar_path,
+    "jps": jps_path,
+}
+
+
+def solve_waves(grid: Grid) -> Generator[np.ndarray, None, Optional[Union[Coord, List[Coord]]]]:
     """
+    Решение лабиринта по шагам для анимации: выдает волны обхода в ширину.
 
-    pass
+    Волна идет от первого выхода; каждая волна — массив N x 2 только что
+    достигнутых клеток. Генератор возвращает то же, что `solve_maze`
+    вторым элементом: путь от второго выхода к первому, координату
+    единственного выхода или None.
+    """
+    exits = get_exits(grid)
+    if len(exits) == 1:
+        return exits[0]
+    if encircled_exit(grid, exits[0]) or encircled_exit(grid, exits[1]):
+        return None
+    dist = yield from bfs_waves(from_list(grid), [exits[0]], target=exits[1])
+    cell = _flat(dist, exits[1])
+    if dist.reshape(-1)[cell] < 0:
+        return None
+    return _coords(dist, _walk_back(dist, cell))
+
+
+def find_path(grid: Grid, source: Coord, target: Coord, method: str = "bfs") -> Optional[List[Coord]]:
+    """
+    Кратчайший путь от `source` до `target` способом из `SOLVERS` или None.
+    """
+    if method not in SOLVERS:
+        raise ValueError(f"Unknown maze solver: {method!r}")
+    return SOLVERS[method](from_list(grid), source, target)
 
 
 def solve_maze(
-    grid: List[List[Union[str, int]]],
-) -> Tuple[List[List[Union[str, int]]], Optional[Union[Tuple[int, int], List[Tuple[int, int]]]]]:
+    grid: Grid,
+) -> Tuple[Grid, Optional[Union[Tuple[int, int], List[Tuple[int, int]]]]]:
     """
+    Путь от второго выхода лабиринта к первому или None, если пути нет.
 
-    :param grid:
-    :return:
+    Лабиринт может быть списком строк или компактным массивом; он не
+    меняется. Если выход один, вместо пути возвращается его координата.
     """
+    exits = get_exits(grid)
+    if len(exits) == 1:
+        return grid, exits[0]
+    if encircled_exit(grid, exits[0]) or encircled_exit(grid, exits[1]):
+        return grid, None
+    return grid, bfs_path(from_list(grid), exits[1], exits[0])
 
-    pass
 
+# Направления шагов в закодированном пути: вверх, вправо, вниз, влево
+MOVES = b"URDL"
+# шаг по коду направления и код направления по шагу (dx + 1) * 3 + dy + 1
+_MOVE_DX = np.zeros(256, dtype=np.int64)
+_MOVE_DY = np.zeros(256, dtype=np.int64)
+_MOVE_CODES = np.zeros(9, dtype=np.uint8)
+for _code, (_dx, _dy) in zip(MOVES, ((-1, 0), (0, 1), (1, 0), (0, -1))):
+    _MOVE_DX[_code], _MOVE_DY[_code] = _dx, _dy
+    _MOVE_CODES[(_dx + 1) * 3 + _dy + 1] = _code
 
-def add_path_to_grid(
-    grid: List[List[Union[str, int]]], path: Optional[Union[Tuple[int, int], List[Tuple[int, int]]]]
-) -> List[List[Union[str, int]]]:
+EncodedPath = Tuple[Coord, bytes]
+Path = Union[Coord, List[Coord], np.ndarray, EncodedPath]
+
+
+def encode_path(path: Union[List[Coord], np.ndarray]) -> EncodedPath:
+    """
+    Путь в виде начальной клетки и байтовой строки шагов из `MOVES`, по байту на шаг.
     """
+    cells = np.asarray(path, dtype=np.int64).reshape(-1, 2)
+    steps = np.diff(cells, axis=0)
+    if np.abs(steps).sum(axis=1).max(initial=1) != 1:
+        raise ValueError("Path cells must be adjacent")
+    codes = _MOVE_CODES[(steps[:, 0] + 1) * 3 + steps[:, 1] + 1]
+    return (int(cells[0, 0]), int(cells[0, 1])), codes.tobytes()
 
-    :param grid:
-    :param path:
-    :return:
+
+def decode_path(path: EncodedPath) -> np.ndarray:
+    """
+    Клетки закодированного пути массивом N x 2 (строка, столбец).
     """
+    (x, y), moves = path
+    codes = np.frombuffer(moves, dtype=np.uint8)
+    if not np.isin(codes, np.frombuffer(MOVES, dtype=np.uint8)).all():
+        raise ValueError(f"Path moves must be one of {MOVES!r}")
+    cells = np.empty((len(codes) + 1, 2), dtype=np.int64)
+    cells[0] = x, y
+    np.cumsum(_MOVE_DX[codes], out=cells[1:, 0])
+    np.cumsum(_MOVE_DY[codes], out=cells[1:, 1])
+    cells[1:] += cells[0]
+    return cells
+
+
+def path_cells(path: Path) -> np.ndarray:
+    """
+    Клетки пути любого вида (см. `add_path_to_grid`) массивом N x 2.
+    """
+    if isinstance(path, tuple) and len(path) == 2 and isinstance(path[1], (bytes, bytearray)):
+        return decode_path(path)  # type: ignore[arg-type]
+    cells = np.asarray(path, dtype=np.int64)
+    return cells.reshape(-1, 2)
+
+
+def add_path_to_grid(grid: Grid, path: Optional[Path], mark: Optional[Union[str, int]] = None) -> Grid:
+    """
+    Отметить клетки пути в лабиринте и вернуть его.
 
-    if path:
-        for i, row in enumerate(grid):
-            for j, _ in enumerate(row):
-                if (i, j) in path:
-                    grid[i][j] = "X"
+    Путь — список клеток, массив N x 2, одна клетка или начальная клетка
+    с закодированными шагами (см. `encode_path`). Меняются только клетки
+    пути. В массив NumPy, в том числе в срез большего поля, пишется код
+    EXIT, в список строк — "X"; другую отметку можно передать в `mark`.
+    """
+    if path is None or len(path) == 0:
+        return grid
+    cells = path_cells(path)
+    if isinstance(grid, np.ndarray):
+        grid[cells[:, 0], cells[:, 1]] = EXIT if mark is None else mark
+        return grid
+    mark = "X" if mark is None else mark
+    for x, y in cells.tolist():
+        grid[x][y] = mark
     return grid
 
 
+_SYMBOL_TABLE = str.maketrans({code: symbol for code, symbol in enumerate(SYMBOLS)})
+
+
+def render_rows(grid: Grid) -> Iterator[str]:
+    """
+    Строки текстового изображения лабиринта по одной.
+
+    Строка компактного лабиринта переводится в символы целиком, поэтому
+    лабиринт из файла, отображенного в память, читается построчно.
+    """
+    for row in grid:
+        if isinstance(row, np.ndarray):
+            yield row.tobytes().decode("latin-1").translate(_SYMBOL_TABLE)
+        else:
+            yield "".join(str(value) for value in row)
+
+
+def render_maze(grid: Grid, file: Optional[TextIO] = None) -> None:
+    """
+    Напечатать лабиринт построчно в `file` (по умолчанию в stdout).
+    """
+    file = sys.stdout if file is None else file
+    for line in render_rows(grid):
+        file.write(line + "\n")
+
+
 if __name__ == "__main__":
-    print(pd.DataFrame(bin_tree_maze(15, 15)))
+    render_maze(bin_tree_maze(15, 15))
+    print()
     GRID = bin_tree_maze(15, 15)
-    print(pd.DataFrame(GRID))
+    render_maze(GRID)
+    print()
     _, PATH = solve_maze(GRID)
     MAZE = add_path_to_grid(GRID, PATH)
-    print(pd.DataFrame(MAZE))
+    render_maze(MAZE)
@@ -0,0 +1,80 @@
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+import typing as tp
+
+import numpy as np
+
+import maze
+
+
+def legacy_add_path_to_grid(
+    grid: tp.List[tp.List[tp.Union[str, int]]], path: tp.Optional[tp.List[tp.Tuple[int, int]]]
+) -> tp.List[tp.List[tp.Union[str, int]]]:
+    """
+    Прежняя отметка пути: каждая клетка поля ищется в списке пути.
+    """
+    if path:
+        for i, row in enumerate(grid):
+            for j, _ in enumerate(row):
+                if (i, j) in path:
+                    grid[i][j] = "X"
+    return grid
+
+
+def _timed(function: tp.Callable[[], tp.Any], repeat: int) -> float:
+    # лучшее время из `repeat` запусков меньше всего зависит от шума
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(
+    size: int, algorithm: str = "backtracker", repeat: int = 3, legacy: bool = True, seed: int = 0
+) -> tp.Dict[str, tp.Any]:
+    """
+    Замерить отметку пути на лабиринте `size` x `size`.
+
+    Путь между фиксированными выходами отмечается прежним способом (только
+    при `legacy`), в списке строк, в массиве NumPy и в массиве по
+    закодированному пути. Время — лучшее из `repeat` запусков.
+    """
+    grid = maze.generate_maze(size, size, algorithm, random_exit=False, rng=np.random.default_rng(seed))
+    exits = maze.get_exits(grid)
+    path = maze.bfs_path(grid, exits[1], exits[0])
+    rows = maze.to_list(grid)
+    cells = np.array(path)
+    encoded = maze.encode_path(path)
+    times = {
+        "legacy": _timed(lambda: legacy_add_path_to_grid(copy.deepcopy(rows), path), 1) if legacy else None,
+        "list": _timed(lambda: maze.add_path_to_grid(rows, path), repeat),
+        "array": _timed(lambda: maze.add_path_to_grid(grid, cells), repeat),
+        "encoded": _timed(lambda: maze.add_path_to_grid(grid, encoded), repeat),
+    }
+    return {"size": size, "algorithm": algorithm, "path_length": len(path), "seconds": times}
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Замеры отметки пути в лабиринте.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[51, 101, 201, 2001])
+    parser.add_argument("--algorithm", default="backtracker", choices=list(maze.GENERATORS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--legacy-max", type=int, default=201, help="прежний способ замеряется только на лабиринтах не больше этого"
+    )
+    args = parser.parse_args(argv)
+    results = [
+        measure(size, args.algorithm, args.repeat, legacy=size <= args.legacy_max) for size in args.sizes
+    ]
+    report = {"python": platform.python_version(), "numpy": np.__version__, "results": results}
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,226 @@
+import argparse
+import time
 import tkinter as tk
-from typing import List
-from tkinter import ttk, messagebox
-from maze import bin_tree_maze, solve_maze, add_path_to_grid
-
-
-def draw_cell(x, y, color, size: int = 10):
-    x *= size
-    y *= size
-    x1 = x + size
-    y1 = y + size
-    canvas.create_rectangle(x, y, x1, y1, fill=color)
-
-
-def draw_maze(grid: List[List[str]], size: int = 10):
-    for x, row in enumerate(grid):
-        for y, cell in enumerate(row):
-            if cell == " ":
-                color = 'White'
-            elif cell == "■":
-                color = 'black'
-            elif cell == "X":
-                color = "red"
-            draw_cell(y, x, color, size)
-
-
-def show_solution():
-    maze, path = solve_maze(GRID)
-    maze = add_path_to_grid(GRID, path)
+from tkinter import messagebox, ttk
+from typing import Callable, Generator, List, Optional
+
+import numpy as np
+
+from maze import EXIT, FREE, WALL, Grid, Path, from_list, generate_maze, path_cells, solve_maze, solve_waves
+
+# Цвет пикселя по коду клетки компактного лабиринта
+PALETTE = np.zeros((256, 3), dtype=np.uint8)
+PALETTE[FREE] = (255, 255, 255)
+PALETTE[WALL] = (0, 0, 0)
+PALETTE[EXIT] = (255, 0, 0)
+PATH_COLOR = "red"
+WAVE = (128, 192, 255)
+
+
+def maze_ppm(grid: Grid, size: int = 10) -> bytes:
+    """
+    Двоичный PPM лабиринта: клетка — квадрат `size` x `size` пикселей.
+
+    Пиксели получаются из кодов клеток одной выборкой из `PALETTE`, без
+    цикла по клеткам.
+    """
+    return _ppm(PALETTE[from_list(grid)], size)
+
+
+def _ppm(pixels: np.ndarray, size: int) -> bytes:
+    # пиксели по клетке -> двоичный PPM, где клетка — квадрат size x size
+    if size > 1:
+        pixels = pixels.repeat(size, axis=0).repeat(size, axis=1)
+    height, width = pixels.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + pixels.tobytes()
+
+
+def path_coords(path: Path, size: int = 10) -> List[float]:
+    """
+    Координаты центров клеток пути на холсте подряд: x0, y0, x1, y1, ...
+
+    Путь из одной клетки повторяется дважды, чтобы из него получилась линия.
+    """
+    cells = path_cells(path)
+    if len(cells) == 1:
+        cells = cells.repeat(2, axis=0)
+    # строка клетки — координата y на холсте, столбец — x
+    return ((cells[:, ::-1] + 0.5) * size).reshape(-1).tolist()
+
+
+class AnimationBudget:
+    """
+    Сколько волн показывать за кадр, чтобы анимация уложилась в `duration` секунд.
+
+    Начинаем с одной волны на кадр; если при текущей скорости анимация
+    закончится позже срока, число волн за кадр удваивается. Доля работы
+    оценивается по числу уже достигнутых клеток.
+    """
+
+    def __init__(self, duration: float = 10.0) -> None:
+        self.duration = duration
+        self.batch = 1
+
+    def update(self, progress: float, elapsed: float) -> int:
+        if 0 < progress < 1 and elapsed / progress > self.duration:
+            self.batch *= 2
+        return self.batch
+
+
+class MazeView:
+    """
+    Лабиринт на холсте Tk: одна картинка и одна линия пути.
+
+    Лабиринт рисуется один раз в `tk.PhotoImage`, путь — ломаной поверх
+    нее. Повторная отрисовка меняет картинку и координаты ломаной, а не
+    создает новые элементы холста.
+    """
+
+    # Больше стольких клеток за кадр дешевле перерисовать картинку целиком
+    put_limit = 2000
+
+    def __init__(self, canvas: tk.Canvas, cell_size: int = 10) -> None:
+        self.canvas = canvas
+        self.cell_size = cell_size
+        # ссылка на картинку нужна, иначе Tk удалит ее вместе с объектом Python
+        self.image: Optional[tk.PhotoImage] = None
+        self.image_item: Optional[int] = None
+        self.path_item: Optional[int] = None
+        # цвета клеток для анимации: по пикселю на клетку
+        self.pixels: Optional[np.ndarray] = None
+        self.animation = 0
+
+    def draw_maze(self, grid: Grid) -> None:
+        """ Нарисовать лабиринт и убрать путь; идущая анимация останавливается. """
+        self.animation += 1
+        self.image = tk.PhotoImage(master=self.canvas, data=maze_ppm(grid, self.cell_size), format="PPM")
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+        else:
+            self.canvas.itemconfigure(self.image_item, image=self.image)
+        self.clear_path()
+
+    def draw_path(self, path: Path) -> None:
+        """ Показать путь ломаной через центры клеток. """
+        coords = path_coords(path, self.cell_size)
+        if self.path_item is None:
+            width = max(1, self.cell_size // 2)
+            self.path_item = self.canvas.create_line(*coords, fill=PATH_COLOR, width=width, capstyle=tk.ROUND)
+        else:
+            self.canvas.coords(self.path_item, *coords)
+            self.canvas.itemconfigure(self.path_item, state=tk.NORMAL)
+
+    def clear_path(self) -> None:
+        """ Спрятать путь. """
+        if self.path_item is not None:
+            self.canvas.itemconfigure(self.path_item, state=tk.HIDDEN)
+
+    def paint_cells(self, cells: np.ndarray, color: tuple = WAVE) -> None:
+        """
+        Закрасить клетки на картинке лабиринта.
+
+        Немного клеток красится по одной через `PhotoImage.put`, а если их
+        больше `put_limit`, картинка один раз строится заново из `pixels`.
+        """
+        if self.image is None or self.pixels is None:
+            return
+        self.pixels[cells[:, 0], cells[:, 1]] = color
+        if len(cells) > self.put_limit:
+            self.image.configure(data=_ppm(self.pixels, self.cell_size), format="PPM")
+            return
+        size = self.cell_size
+        hex_color = "#%02x%02x%02x" % color
+        for x, y in cells.tolist():
+            self.image.put(hex_color, to=(y * size, x * size, (y + 1) * size, (x + 1) * size))
+
+    def animate(
+        self,
+        grid: Grid,
+        frame_ms: int = 30,
+        duration: float = 10.0,
+        done: Optional[Callable[[Optional[Path]], None]] = None,
+    ) -> None:
+        """
+        Показать, как волна обхода в ширину расходится от входа.
+
+        Волны берутся из генератора `solve_waves` пачками в обработчике
+        `after`, так что окно не замирает; за кадр закрашиваются только
+        новые клетки. Размер пачки подстраивается (см. `AnimationBudget`),
+        а считать волны дольше `frame_ms` за кадр не дают. В конце
+        рисуется путь и вызывается `done(path)`.
+        """
+        self.draw_maze(grid)
+        cells = from_list(grid)
+        self.pixels = PALETTE[cells]
+        waves: Generator = solve_waves(grid)
+        budget = AnimationBudget(duration)
+        total = max(1, int(np.count_nonzero(cells != WALL)))
+        reached = 0
+        start = time.perf_counter()
+        # новая анимация останавливает предыдущую, если та еще идет
+        self.animation += 1
+        animation = self.animation
+
+        def frame() -> None:
+            nonlocal reached
+            if animation != self.animation:
+                return
+            frame_start = time.perf_counter()
+            cells = []
+            path = None
+            finished = False
+            try:
+                for _ in range(budget.batch):
+                    cells.append(next(waves))
+                    if time.perf_counter() - frame_start > frame_ms / 1000:
+                        break
+            except StopIteration as stop:
+                path, finished = stop.value, True
+            if cells:
+                new = np.concatenate(cells)
+                reached += len(new)
+                self.paint_cells(new)
+            if finished:
+                if path:
+                    self.draw_path(path)
+                if done is not None:
+                    done(path)
+                return
+            budget.update(reached / total, time.perf_counter() - start)
+            self.canvas.after(frame_ms, frame)
+
+        frame()
+
+
+def show_solution() -> None:
+    if ANIMATE:
+        VIEW.animate(GRID, done=_report)
+        return
+    _, path = solve_maze(GRID)
     if path:
-        draw_maze(maze, CELL_SIZE)
+        VIEW.draw_path(path)
     else:
+        _report(path)
+
+
+def _report(path: Optional[Path]) -> None:
+    if not path:
         tk.messagebox.showinfo("Message", "No solutions")
 
 
 if __name__ == "__main__":
-    global GRID, CELL_SIZE
-    N, M = 51, 77
+    parser = argparse.ArgumentParser(description="Лабиринт и его решение в окне Tk.")
+    parser.add_argument("--rows", type=int, default=51)
+    parser.add_argument("--cols", type=int, default=77)
+    parser.add_argument("--cell-size", type=int, default=10)
+    parser.add_argument("--algorithm", default="bin_tree")
+    parser.add_argument("--animate", action="store_true", help="показать волны поиска пути")
+    args = parser.parse_args()
+    N, M = args.rows, args.cols
+    ANIMATE = args.animate
 
-    CELL_SIZE = 10
-    GRID = bin_tree_maze(N, M)
+    CELL_SIZE = args.cell_size
+    GRID = generate_maze(N, M, args.algorithm)
 
     window = tk.Tk()
     window.title('Maze')
@@ -47,8 +229,8 @@ if __name__ == "__main__":
     canvas = tk.Canvas(window, width=M * CELL_SIZE, height=N * CELL_SIZE)
     canvas.pack()
 
-    draw_maze(GRID, CELL_SIZE)
+    VIEW = MazeView(canvas, CELL_SIZE)
+    VIEW.draw_maze(GRID)
     ttk.Button(window, text="Solve", command=show_solution).pack(pady=20)
 
     window.mainloop()
-
@@ -0,0 +1,83 @@
+import pathlib
+import struct
+import typing as tp
+
+import numpy as np
+
+from maze import EXIT, WALL, Maze
+
+# Заголовок файла: сигнатура формата, число строк, число столбцов
+BYTE_MAGIC = b"MAZEBYT1"
+BIT_MAGIC = b"MAZEBIT1"
+_HEADER = struct.Struct("<8sQQ")
+
+
+def _read_header(file: tp.BinaryIO) -> tp.Tuple[bytes, int, int]:
+    magic, rows, cols = _HEADER.unpack(file.read(_HEADER.size))
+    if magic not in (BYTE_MAGIC, BIT_MAGIC):
+        raise ValueError("Not a maze file")
+    return magic, rows, cols
+
+
+def save_maze(grid: Maze, filename: pathlib.Path, packed: bool = False) -> None:
+    """
+    Записать компактный лабиринт в файл.
+
+    По умолчанию клетка занимает байт (код FREE, WALL или EXIT), и файл
+    можно отобразить в память (см. `open_maze`). При `packed` клетка
+    занимает два бита: битовая плоскость стен и битовая плоскость выходов,
+    упакованные `np.packbits`; такой файл вчетверо меньше, но читается
+    только целиком.
+    """
+    rows, cols = grid.shape
+    with open(filename, "wb") as file:
+        file.write(_HEADER.pack(BIT_MAGIC if packed else BYTE_MAGIC, rows, cols))
+        if packed:
+            np.packbits(grid == WALL).tofile(file)
+            np.packbits(grid == EXIT).tofile(file)
+        else:
+            np.ascontiguousarray(grid, dtype=np.uint8).tofile(file)
+
+
+def create_maze_file(filename: pathlib.Path, rows: int, cols: int) -> np.memmap:
+    """
+    Создать файл лабиринта с байтом на клетку и отобразить его в память для записи.
+
+    В полученный массив можно сразу строить лабиринт, например
+    `maze.generate_maze(rows, cols, out=grid)`; после этого нужно вызвать `flush`.
+    """
+    with open(filename, "wb") as file:
+        file.write(_HEADER.pack(BYTE_MAGIC, rows, cols))
+        file.truncate(_HEADER.size + rows * cols)
+    return np.memmap(filename, dtype=np.uint8, mode="r+", offset=_HEADER.size, shape=(rows, cols))
+
+
+def open_maze(filename: pathlib.Path, mode: str = "r") -> np.memmap:
+    """
+    Отобразить файл лабиринта с байтом на клетку в память.
+
+    Строки читаются с диска только при обращении, поэтому лабиринт больше
+    оперативной памяти можно печатать построчно или решать (`maze.solve_maze`
+    работает с отображенным массивом как с обычным). `mode` — как у `np.memmap`.
+    """
+    with open(filename, "rb") as file:
+        magic, rows, cols = _read_header(file)
+    if magic != BYTE_MAGIC:
+        raise ValueError("Packed maze files cannot be memory-mapped; use load_maze")
+    return np.memmap(filename, dtype=np.uint8, mode=mode, offset=_HEADER.size, shape=(rows, cols))
+
+
+def load_maze(filename: pathlib.Path) -> Maze:
+    """
+    Прочитать лабиринт любого формата в массив в памяти.
+    """
+    with open(filename, "rb") as file:
+        magic, rows, cols = _read_header(file)
+        if magic == BYTE_MAGIC:
+            return np.fromfile(file, dtype=np.uint8, count=rows * cols).reshape(rows, cols)
+        size = (rows * cols + 7) // 8
+        walls = np.unpackbits(np.fromfile(file, dtype=np.uint8, count=size), count=rows * cols)
+        exits = np.unpackbits(np.fromfile(file, dtype=np.uint8, count=size), count=rows * cols)
+    grid = walls * np.uint8(WALL)
+    grid[exits.astype(bool)] = EXIT
+    return grid.reshape(rows, cols)
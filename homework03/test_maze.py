@@ -1,8 +1,30 @@
+import io
 import unittest
+from collections import deque
 from random import seed
+
+import numpy as np
+
 import maze
 
 
+def is_perfect(grid):
+    """
+    Проходы лабиринта без входа и выхода образуют дерево, покрывающее все клетки.
+    """
+    inner = grid[1:-1, 1:-1] != maze.WALL
+    cells = int(inner[::2, ::2].sum())
+    seen = {(0, 0)}
+    queue = deque(seen)
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < inner.shape[0] and 0 <= ny < inner.shape[1] and inner[nx, ny] and (nx, ny) not in seen:
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return len(seen) == inner.sum() and inner.sum() - cells == cells - 1
+
+
 class MazeTest(unittest.TestCase):
     def test_remove_wall(self):
         seed(2)
@@ -324,6 +346,297 @@ class MazeTest(unittest.TestCase):
         )
 
 
+    def test_compact_bin_tree_matches_list_maze(self):
+        for value in (42, 222, 622):
+            seed(value)
+            expected = maze.bin_tree_maze(9, 11)
+            seed(value)
+            grid = maze._place_exits(maze.carve_bin_tree(maze.lattice(9, 11)))
+            self.assertEqual(expected, maze.to_list(grid))
+
+    def test_generators_build_perfect_mazes(self):
+        for algorithm in maze.GENERATORS:
+            for rows, cols in ((3, 3), (3, 11), (11, 3), (21, 31)):
+                for value in range(3):
+                    grid = maze.generate_maze(rows, cols, algorithm, rng=np.random.default_rng(value))
+                    self.assertEqual((rows, cols), grid.shape)
+                    # вход и выход выбираются независимо и могут совпасть
+                    self.assertIn(np.count_nonzero(grid == maze.EXIT), (1, 2))
+                    self.assertTrue(is_perfect(grid), (algorithm, rows, cols, value))
+
+    def test_generators_on_boards_without_cells(self):
+        # меньше трех строк или столбцов — клеток нет, остается решетка
+        for algorithm in maze.GENERATORS:
+            for rows, cols in ((1, 1), (2, 2), (2, 5), (5, 2)):
+                with self.subTest(algorithm=algorithm, size=(rows, cols)):
+                    grid = maze.generate_maze(rows, cols, algorithm, rng=np.random.default_rng(0))
+                    self.assertEqual((rows, cols), grid.shape)
+
+    def test_generate_maze_is_reproducible_with_seed(self):
+        for algorithm in maze.GENERATORS:
+            seed(7)
+            first = maze.generate_maze(15, 15, algorithm)
+            seed(7)
+            second = maze.generate_maze(15, 15, algorithm)
+            np.testing.assert_array_equal(first, second)
+
+    def test_generate_maze_fixed_exits(self):
+        grid = maze.generate_maze(7, 9, "sidewinder", random_exit=False, rng=np.random.default_rng(0))
+        self.assertEqual(maze.EXIT, grid[0, 7])
+        self.assertEqual(maze.EXIT, grid[6, 1])
+
+    def test_generate_maze_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            maze.generate_maze(5, 5, "kruskal")
+
+    def test_sidewinder_top_row_is_corridor(self):
+        grid = maze.generate_maze(11, 11, "sidewinder", random_exit=False, rng=np.random.default_rng(1))
+        self.assertTrue((grid[1, 1:-1] == maze.FREE).all())
+
+    def test_backtracker_large_maze_has_no_recursion_limit(self):
+        grid = maze.generate_maze(401, 401, "backtracker", rng=np.random.default_rng(0))
+        self.assertTrue(is_perfect(grid))
+
+    def test_from_list_roundtrip(self):
+        seed(3)
+        grid = maze.bin_tree_maze(9, 13)
+        self.assertEqual(grid, maze.to_list(maze.from_list(grid)))
+        numbered = [["■", 1, "■"], [" ", 2, "X"]]
+        np.testing.assert_array_equal(
+            [[maze.WALL, maze.FREE, maze.WALL], [maze.FREE, maze.FREE, maze.EXIT]], maze.from_list(numbered)
+        )
+
+    def test_bfs_distances(self):
+        grid = maze.from_list(
+            [
+                ["■", "X", "■", "■", "■"],
+                ["■", " ", " ", " ", "■"],
+                ["■", "■", "■", " ", "■"],
+                ["■", " ", "■", " ", "■"],
+                ["■", "■", "■", "■", "■"],
+            ]
+        )
+        dist = maze.bfs_distances(grid, [(0, 1)])[1:-1, 1:-1]
+        self.assertEqual([0, 1, 2, 3, 4, 5], [dist[cell] for cell in [(0, 1), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3)]])
+        self.assertEqual(maze.UNREACHED, dist[3, 1])
+        self.assertEqual(maze.BLOCKED, dist[0, 0])
+
+    def test_bfs_distances_reuses_buffer(self):
+        grid = maze.generate_maze(11, 11, rng=np.random.default_rng(0))
+        buffer = maze.distance_buffer(grid.shape)
+        self.assertIs(buffer, maze.bfs_distances(grid, maze.get_exits(grid)[:1], buffer))
+        with self.assertRaises(ValueError):
+            maze.bfs_distances(grid, [(1, 1)], maze.distance_buffer((5, 5)))
+
+    def test_bfs_and_bidirectional_paths_agree(self):
+        for algorithm in maze.GENERATORS:
+            grid = maze.generate_maze(41, 61, algorithm, random_exit=False, rng=np.random.default_rng(5))
+            first, second = maze.get_exits(grid)
+            path = maze.bfs_path(grid, second, first)
+            self.assertEqual(second, path[0])
+            self.assertEqual(first, path[-1])
+            for (x, y), (nx, ny) in zip(path, path[1:]):
+                self.assertEqual(1, abs(x - nx) + abs(y - ny))
+                self.assertNotEqual(maze.WALL, grid[nx, ny])
+            # в идеальном лабиринте кратчайший путь единственный
+            self.assertEqual(path, maze.bidirectional_path(grid, second, first))
+
+    def test_paths_in_open_field(self):
+        grid = np.zeros((30, 40), dtype=np.uint8)
+        path = maze.bfs_path(grid, (0, 0), (29, 39))
+        self.assertEqual(69, len(path))
+        self.assertEqual(69, len(maze.bidirectional_path(grid, (0, 0), (29, 39))))
+        self.assertEqual([(3, 4)], maze.bidirectional_path(grid, (3, 4), (3, 4)))
+
+    def test_unreachable_paths(self):
+        grid = maze.from_list(
+            [
+                ["■", "X", "■", "■", "■"],
+                ["■", " ", "■", " ", "■"],
+                ["■", "■", "■", " ", "X"],
+                ["■", "■", "■", "■", "■"],
+            ]
+        )
+        self.assertIsNone(maze.bfs_path(grid, (0, 1), (2, 4)))
+        self.assertIsNone(maze.bidirectional_path(grid, (0, 1), (2, 4)))
+        self.assertIsNone(maze.bidirectional_path(grid, (0, 0), (2, 4)))
+        self.assertIsNone(maze.solve_maze(grid)[1])
+
+    def test_solve_compact_maze(self):
+        seed(34)
+        grid = maze.bin_tree_maze(5, 5)
+        compact = maze.from_list(grid)
+        solved, path = maze.solve_maze(compact)
+        self.assertIs(compact, solved)
+        self.assertEqual(maze.solve_maze(grid)[1], path)
+
+    def test_encircled_exit_on_compact_maze(self):
+        grid = maze.from_list(
+            [
+                ["■", "X", "■", "X", "■"],
+                ["■", " ", "■", "■", "■"],
+                ["■", " ", " ", " ", "X"],
+                ["X", "■", "■", "■", "■"],
+            ]
+        )
+        self.assertFalse(maze.encircled_exit(grid, (0, 1)))
+        self.assertTrue(maze.encircled_exit(grid, (0, 3)))
+        self.assertFalse(maze.encircled_exit(grid, (2, 4)))
+        self.assertTrue(maze.encircled_exit(grid, (3, 0)))
+
+    def test_nearest_exit(self):
+        grid = maze.from_list(
+            [
+                ["■", "X", "■", "■", "■", "■", "■"],
+                ["■", " ", " ", " ", " ", " ", "X"],
+                ["■", "■", "■", " ", "■", "■", "■"],
+                ["X", " ", " ", " ", "■", "■", "■"],
+                ["■", "■", "■", "X", "■", "■", "■"],
+            ]
+        )
+        exit_, path = maze.nearest_exit(grid, (3, 3))
+        self.assertEqual((4, 3), exit_)
+        self.assertEqual([(3, 3), (4, 3)], path)
+        exit_, path = maze.nearest_exit(grid, (1, 4))
+        self.assertEqual((1, 6), exit_)
+        self.assertEqual([(1, 4), (1, 5), (1, 6)], path)
+        exit_, path = maze.nearest_exit(grid, (0, 1))
+        self.assertEqual((1, 1), path[1])
+        self.assertNotEqual((0, 1), exit_)
+        self.assertIsNone(maze.nearest_exit(grid, (1, 1), exits=[]))
+        self.assertEqual(maze.nearest_exit(grid, (3, 3)), maze.nearest_exit(maze.to_list(grid), (3, 3)))
+
+    def test_nearest_exit_on_list_grid(self):
+        seed(3)
+        grid = maze.bin_tree_maze(11, 11, random_exit=False)
+        exit_, path = maze.nearest_exit(grid, (1, 1))
+        self.assertIn(exit_, maze.get_exits(grid))
+        self.assertEqual(maze.bfs_path(maze.from_list(grid), (1, 1), exit_), path)
+
+    def test_solvers_find_shortest_paths(self):
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            rows, cols = rng.integers(1, 12, 2)
+            grid = (rng.random((rows, cols)) < rng.random() * 0.5).astype(np.uint8)
+            free = [tuple(map(int, cell)) for cell in np.argwhere(grid == maze.FREE)]
+            if not free:
+                continue
+            source, target = (free[i] for i in rng.choice(len(free), 2))
+            expected = maze.bfs_path(grid, source, target)
+            for method in maze.SOLVERS:
+                path = maze.find_path(grid, source, target, method)
+                if expected is None:
+                    self.assertIsNone(path, method)
+                    continue
+                self.assertEqual(len(expected), len(path), method)
+                self.assertEqual((source, target), (path[0], path[-1]), method)
+                for (x, y), (nx, ny) in zip(path, path[1:]):
+                    self.assertEqual(1, abs(x - nx) + abs(y - ny), method)
+                    self.assertEqual(maze.FREE, grid[nx, ny], method)
+
+    def test_find_path_on_list_maze(self):
+        seed(34)
+        grid = maze.bin_tree_maze(5, 5)
+        expected = maze.solve_maze(grid)[1]
+        for method in maze.SOLVERS:
+            self.assertEqual(expected, maze.find_path(grid, (3, 0), (2, 4), method))
+        with self.assertRaises(ValueError):
+            maze.find_path(grid, (3, 0), (2, 4), "dijkstra")
+
+    def test_add_path_to_list_grid(self):
+        seed(34)
+        grid = maze.bin_tree_maze(5, 5)
+        _, path = maze.solve_maze(grid)
+        self.assertEqual(
+            [
+                ["■", "■", "■", "■", "■"],
+                ["■", "X", "X", "X", "■"],
+                ["■", "X", "■", "X", "X"],
+                ["X", "X", "■", " ", "■"],
+                ["■", "■", "■", "■", "■"],
+            ],
+            maze.add_path_to_grid(grid, path),
+        )
+        self.assertIs(grid, maze.add_path_to_grid(grid, None))
+
+    def test_encode_and_decode_path(self):
+        path = [(3, 0), (3, 1), (2, 1), (1, 1), (1, 2), (1, 3), (2, 3), (2, 4)]
+        encoded = maze.encode_path(path)
+        self.assertEqual(((3, 0), b"RUURRDR"), encoded)
+        self.assertEqual(path, [tuple(cell) for cell in maze.decode_path(encoded).tolist()])
+        self.assertEqual([[1, 1]], maze.decode_path(maze.encode_path([(1, 1)])).tolist())
+        with self.assertRaises(ValueError):
+            maze.encode_path([(0, 0), (1, 1)])
+        with self.assertRaises(ValueError):
+            maze.decode_path(((0, 0), b"RX"))
+
+    def test_add_path_to_array_view(self):
+        field = np.full((10, 10), maze.WALL, dtype=np.uint8)
+        view = field[2:5, 3:7]
+        maze.add_path_to_grid(view, ((0, 0), b"RRDD"))
+        self.assertEqual(
+            {(2, 3), (2, 4), (2, 5), (3, 5), (4, 5)}, {tuple(cell) for cell in np.argwhere(field == maze.EXIT).tolist()}
+        )
+        maze.add_path_to_grid(view, np.array([[1, 0], [2, 0]]), mark=maze.FREE)
+        self.assertEqual(maze.FREE, field[3, 3])
+        self.assertEqual(maze.FREE, field[4, 3])
+
+    def test_add_path_to_grid_forms_agree(self):
+        grid = maze.generate_maze(31, 31, "backtracker", random_exit=False, rng=np.random.default_rng(2))
+        first, second = maze.get_exits(grid)
+        path = maze.bfs_path(grid, second, first)
+        rows = maze.to_list(grid)
+        expected = maze.from_list(maze.add_path_to_grid(maze.to_list(grid), path))
+        for form in (path, np.array(path), maze.encode_path(path)):
+            np.testing.assert_array_equal(expected, maze.add_path_to_grid(grid.copy(), form))
+        self.assertEqual(maze.to_list(expected), maze.add_path_to_grid(rows, maze.encode_path(path)))
+
+    def test_bfs_waves(self):
+        grid = maze.from_list(
+            [
+                ["■", "X", "■", "■", "■"],
+                ["■", " ", " ", " ", "■"],
+                ["■", " ", "■", " ", "■"],
+                ["■", "■", "■", "■", "■"],
+            ]
+        )
+        waves = [sorted(map(tuple, wave.tolist())) for wave in maze.bfs_waves(grid, [(0, 1)])]
+        self.assertEqual([[(0, 1)], [(1, 1)], [(1, 2), (2, 1)], [(1, 3)], [(2, 3)]], waves)
+
+    def test_solve_waves_returns_solve_maze_path(self):
+        for value in (34, 4, 44, 131, 773):
+            seed(value)
+            grid = maze.bin_tree_maze(5, 5)
+            waves = maze.solve_waves(grid)
+            reached = []
+            while True:
+                try:
+                    reached.extend(map(tuple, next(waves).tolist()))
+                except StopIteration as stop:
+                    path = stop.value
+                    break
+            self.assertEqual(maze.solve_maze(grid)[1], path)
+            self.assertEqual(len(reached), len(set(reached)))
+            if isinstance(path, list):
+                self.assertTrue(set(path) <= set(reached))
+
+    def test_render_maze(self):
+        seed(42)
+        grid = maze.bin_tree_maze(5, 5)
+        expected = ["■■■■■", "X   ■", "■■■ ■", "■   ■", "■■■■■"]
+        self.assertEqual(expected, list(maze.render_rows(grid)))
+        self.assertEqual(expected, list(maze.render_rows(maze.from_list(grid))))
+        output = io.StringIO()
+        maze.render_maze(maze.from_list(grid), output)
+        self.assertEqual("\n".join(expected) + "\n", output.getvalue())
+
+    def test_build_maze_in_buffer(self):
+        buffer = np.empty((7, 9), dtype=np.uint8)
+        self.assertIs(buffer, maze.generate_maze(7, 9, "sidewinder", rng=np.random.default_rng(0), out=buffer))
+        self.assertTrue(is_perfect(buffer))
+        with self.assertRaises(ValueError):
+            maze.generate_maze(9, 9, out=buffer)
+
 if __name__ == "__main__":
     unittest.main()
 
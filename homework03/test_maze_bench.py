@@ -0,0 +1,40 @@
+import contextlib
+import io
+import json
+import unittest
+
+import numpy as np
+
+import maze
+import maze_bench
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_legacy_matches_add_path_to_grid(self):
+        grid = maze.generate_maze(21, 21, "sidewinder", random_exit=False, rng=np.random.default_rng(0))
+        first, second = maze.get_exits(grid)
+        path = maze.bfs_path(grid, second, first)
+        self.assertEqual(
+            maze_bench.legacy_add_path_to_grid(maze.to_list(grid), path),
+            maze.add_path_to_grid(maze.to_list(grid), path),
+        )
+
+    def test_measure(self):
+        result = maze_bench.measure(21, repeat=1)
+        self.assertEqual(21, result["size"])
+        self.assertGreater(result["path_length"], 0)
+        for name in ("legacy", "list", "array", "encoded"):
+            self.assertGreater(result["seconds"][name], 0)
+
+    def test_main_skips_legacy_on_large_mazes(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            maze_bench.main(["--sizes", "11", "31", "--legacy-max", "11", "--repeat", "1", "--algorithm", "wilson"])
+        results = json.loads(output.getvalue())["results"]
+        self.assertEqual([11, 31], [result["size"] for result in results])
+        self.assertIsNotNone(results[0]["seconds"]["legacy"])
+        self.assertIsNone(results[1]["seconds"]["legacy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import tkinter as tk
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import maze
+import maze_gui
+
+
+def _tk_root():
+    try:
+        return tk.Tk()
+    except tk.TclError:
+        return None
+
+
+class FakeImage:
+    def __init__(self, **options):
+        self.options = options
+        self.puts = []
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def put(self, color, to):
+        self.puts.append((color, to))
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.items = {}
+        self.scheduled = []
+
+    def create_image(self, *args, **options):
+        self.items[len(self.items) + 1] = ("image", options)
+        return len(self.items)
+
+    def create_line(self, *coords, **options):
+        self.items[len(self.items) + 1] = ("line", coords)
+        return len(self.items)
+
+    def itemconfigure(self, item, **options):
+        pass
+
+    def coords(self, item, *coords):
+        self.items[item] = ("line", coords)
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def run(self):
+        frames = 0
+        while self.scheduled:
+            self.scheduled.pop(0)()
+            frames += 1
+        return frames
+
+
+class MazeGuiTest(unittest.TestCase):
+    def test_maze_ppm(self):
+        grid = [["■", " "], ["X", "■"]]
+        data = maze_gui.maze_ppm(grid, size=2)
+        header, pixels = data[:11], data[11:]
+        self.assertEqual(b"P6 4 4 255\n", header)
+        image = np.frombuffer(pixels, dtype=np.uint8).reshape(4, 4, 3)
+        np.testing.assert_array_equal((0, 0, 0), image[1, 1])
+        np.testing.assert_array_equal((255, 255, 255), image[0, 3])
+        np.testing.assert_array_equal((255, 0, 0), image[3, 0])
+
+    def test_path_coords(self):
+        self.assertEqual([25.0, 15.0, 25.0, 25.0, 35.0, 25.0], maze_gui.path_coords([(1, 2), (2, 2), (2, 3)], 10))
+        self.assertEqual([15.0, 5.0, 15.0, 5.0], maze_gui.path_coords((0, 1), 10))
+        self.assertEqual(maze_gui.path_coords([(1, 1), (1, 2)], 4), maze_gui.path_coords(((1, 1), b"R"), 4))
+
+    def test_redraw_reuses_canvas_items(self):
+        root = _tk_root()
+        if root is None:
+            self.skipTest("no display")
+        try:
+            canvas = tk.Canvas(root, width=110, height=110)
+            view = maze_gui.MazeView(canvas, 10)
+            grid = maze.generate_maze(11, 11, random_exit=False, rng=np.random.default_rng(0))
+            for _ in range(3):
+                view.draw_maze(grid)
+                view.draw_path(maze.solve_maze(grid)[1])
+            self.assertEqual(2, len(canvas.find_all()))
+        finally:
+            root.destroy()
+
+
+    def test_animation_budget(self):
+        budget = maze_gui.AnimationBudget(duration=1.0)
+        self.assertEqual(1, budget.update(0.5, 0.4))
+        self.assertEqual(2, budget.update(0.1, 0.4))
+        self.assertEqual(4, budget.update(0.2, 0.4))
+        self.assertEqual(4, budget.update(0.0, 5.0))
+
+    @mock.patch.object(maze_gui.tk, "PhotoImage", FakeImage)
+    def test_animate_paints_waves_and_draws_path(self):
+        canvas = FakeCanvas()
+        view = maze_gui.MazeView(canvas, 2)
+        grid = maze.generate_maze(15, 15, "backtracker", random_exit=False, rng=np.random.default_rng(1))
+        results = []
+        view.animate(grid, frame_ms=1000, done=results.append)
+        frames = canvas.run()
+        path = maze.solve_maze(grid)[1]
+        self.assertEqual([path], results)
+        self.assertGreater(frames, 1)
+        self.assertEqual(("line", tuple(maze_gui.path_coords(path, 2))), canvas.items[view.path_item])
+        painted = {(to[1] // 2, to[0] // 2) for _, to in view.image.puts}
+        self.assertTrue(set(path) <= painted)
+        self.assertEqual(len(painted), len(view.image.puts))
+
+    @mock.patch.object(maze_gui.tk, "PhotoImage", FakeImage)
+    def test_animate_finishes_large_maze_in_few_frames(self):
+        canvas = FakeCanvas()
+        view = maze_gui.MazeView(canvas, 1)
+        grid = maze.generate_maze(201, 201, "backtracker", random_exit=False, rng=np.random.default_rng(1))
+        view.animate(grid, frame_ms=1, duration=0.01)
+        self.assertLess(canvas.run(), 200)
+
+    @mock.patch.object(maze_gui.tk, "PhotoImage", FakeImage)
+    def test_new_animation_stops_previous(self):
+        canvas = FakeCanvas()
+        view = maze_gui.MazeView(canvas, 1)
+        grid = maze.generate_maze(21, 21, "backtracker", random_exit=False, rng=np.random.default_rng(1))
+        first, second = [], []
+        view.animate(grid, done=first.append)
+        view.animate(grid, done=second.append)
+        canvas.run()
+        self.assertEqual([], first)
+        self.assertEqual(1, len(second))
+
+if __name__ == "__main__":
+    unittest.main()
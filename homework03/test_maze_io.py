@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from random import seed
+
+import numpy as np
+
+import maze
+import maze_io
+
+
+class MazeIoTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "maze.bin")
+        self.grid = maze.generate_maze(21, 33, "wilson", rng=np.random.default_rng(0))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        for packed in (False, True):
+            maze_io.save_maze(self.grid, self.filename, packed=packed)
+            np.testing.assert_array_equal(self.grid, maze_io.load_maze(self.filename))
+
+    def test_packed_file_is_smaller(self):
+        maze_io.save_maze(self.grid, self.filename)
+        size = os.path.getsize(self.filename)
+        maze_io.save_maze(self.grid, self.filename, packed=True)
+        self.assertLess(os.path.getsize(self.filename), size / 3)
+
+    def test_open_maze_is_memory_mapped(self):
+        maze_io.save_maze(self.grid, self.filename)
+        grid = maze_io.open_maze(self.filename)
+        self.assertIsInstance(grid, np.memmap)
+        np.testing.assert_array_equal(self.grid, grid)
+        self.assertEqual(maze.solve_maze(self.grid)[1], maze.solve_maze(grid)[1])
+        del grid
+        maze_io.save_maze(self.grid, self.filename, packed=True)
+        with self.assertRaises(ValueError):
+            maze_io.open_maze(self.filename)
+
+    def test_generate_into_maze_file(self):
+        grid = maze_io.create_maze_file(self.filename, 9, 9)
+        seed(42)
+        self.assertIs(grid, maze.bin_tree_maze(9, 9, out=grid))
+        grid.flush()
+        del grid
+        seed(42)
+        self.assertEqual(maze.bin_tree_maze(9, 9), maze.to_list(maze_io.load_maze(self.filename)))
+
+        grid = maze_io.open_maze(self.filename, mode="r+")
+        maze.generate_maze(9, 9, "backtracker", random_exit=False, rng=np.random.default_rng(1), out=grid)
+        _, path = maze.solve_maze(grid)
+        maze.add_path_to_grid(grid, path)
+        grid.flush()
+        del grid
+        loaded = maze_io.load_maze(self.filename)
+        self.assertTrue(all(loaded[cell] == maze.EXIT for cell in path))
+
+    def test_not_a_maze_file(self):
+        with open(self.filename, "wb") as file:
+            file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            maze_io.load_maze(self.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,113 @@
+import collections
+import functools
+import importlib
 import pathlib
 import random
+import re
 import typing as tp
 
 Cell = tp.Tuple[int, int]
 Cells = tp.List[int]
 Grid = tp.List[Cells]
 
+_MASK64 = (1 << 64) - 1
+
+# Правило Конвея в нотации B/S: рождение при 3 соседях, выживание при 2 и 3
+LIFE = "B3/S23"
+
+
+@functools.lru_cache(maxsize=None)
+def parse_rule(rule: str) -> bytes:
+    """
+    Разобрать правило в нотации B/S ("B36/S23") или S/B ("23/36").
+
+    Возвращает таблицу из 18 байт: следующее состояние клетки по индексу
+    `живая * 9 + число живых соседей`.
+    """
+    text = rule.strip().upper()
+    match = re.fullmatch(r"B([0-8]*)/S([0-8]*)", text)
+    if match is not None:
+        born, survive = match.groups()
+    else:
+        match = re.fullmatch(r"([0-8]*)/([0-8]*)", text)
+        if match is None:
+            raise ValueError(f"Invalid rule {rule!r}, expected B/S notation like 'B3/S23'")
+        survive, born = match.groups()
+    table = bytearray(18)
+    for count in born:
+        table[int(count)] = 1
+    for count in survive:
+        table[9 + int(count)] = 1
+    return bytes(table)
+
+
+LIFE_RULE = parse_rule(LIFE)
+
+
+def cell_key(cell: Cell) -> int:
+    """
+    Случайный 64-битный ключ клетки для хэширования поколений (Zobrist).
+
+    Хэш поколения — XOR ключей живых клеток, поэтому при шаге он
+    пересчитывается только по изменившимся клеткам. Ключ получается
+    перемешиванием координат (splitmix64) и не зависит от размера поля.
+    """
+    x, y = cell
+    z = (((x & 0xFFFFFFFF) << 32 | (y & 0xFFFFFFFF)) + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def parse_row(line: str) -> Cells:
+    """
+    Разобрать строку текстового файла с полем.
+
+    Клетки разделены пробелами ("0 1 0") или записаны подряд ("010").
+    """
+    values = line.split()
+    if len(values) == 1:
+        return [int(value) for value in values[0]]
+    return [int(value) for value in values]
+
 
 class GameOfLife:
-    def __init__(self, size: tp.Tuple[int, int], randomize: bool = True, max_generations: tp.Optional[int] = float("inf")) -> None:
+    # Сколько последних поколений помнит детектор циклов
+    history_size = 64
+    # (начало цикла, период), если поколение повторило одно из недавних
+    cycle: tp.Optional[tp.Tuple[int, int]] = None
+    # объект последнего хэшированного поколения и его хэш
+    _tracked: tp.Optional[tp.Tuple[tp.Any, int]] = None
+
+    def __init__(
+        self,
+        size: tp.Tuple[int, int],
+        randomize: bool = True,
+        max_generations: tp.Optional[int] = float("inf"),
+        rule: str = LIFE,
+        toroidal: bool = False,
+    ) -> None:
         self.rows, self.cols = size
+        self.rule = rule
+        # на тороидальном поле противоположные края склеены
+        self.toroidal = toroidal
         self.prev_generation = self.create_grid()
         self.curr_generation = self.create_grid(randomize=randomize)
         self.max_generations = max_generations
         self.generations = 1
 
+    @property
+    def rule(self) -> str:
+        """
+        Правило игры в нотации B/S; таблица переходов лежит в `rule_table`.
+        """
+        return self._rule
+
+    @rule.setter
+    def rule(self, rule: str) -> None:
+        self.rule_table = parse_rule(rule)
+        self._rule = rule
+
     def create_grid(self, randomize: bool = False) -> Grid:
         """
         Создание списка клеток.
@@ -42,6 +135,12 @@ class GameOfLife:
         """
         Получить соседей для данной клетки.
         """
+        if self.toroidal:
+            return self._toroidal_neighbours(cell)
+        return self._bounded_neighbours(cell)
+
+    def _bounded_neighbours(self, cell: Cell) -> Cells:
+        # соседи внутри поля: за краем клеток нет
         x, y = cell
         neighbours = []
         for dx in (-1, 0, 1):
@@ -53,18 +152,39 @@ class GameOfLife:
                     neighbours.append(self.curr_generation[nx][ny])
         return neighbours
 
+    def _toroidal_neighbours(self, cell: Cell) -> Cells:
+        # соседи на торе: координаты берутся по модулю размера поля
+        x, y = cell
+        grid, rows, cols = self.curr_generation, self.rows, self.cols
+        return [
+            grid[(x + dx) % rows][(y + dy) % cols]
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            if dx != 0 or dy != 0
+        ]
+
     def get_next_generation(self) -> Grid:
         """
         Получить следующее поколение клеток.
         """
+        grid, rule = self.curr_generation, self.rule_table
+        # выбор между тором и ограниченным полем делается один раз на поколение
+        neighbours = self._toroidal_neighbours if self.toroidal else self._bounded_neighbours
         next_gen = [[0] * self.cols for _ in range(self.rows)]
+        if rule == LIFE_RULE:
+            # B3/S23 считается без таблицы, как и в остальных бэкендах
+            for x in range(self.rows):
+                for y in range(self.cols):
+                    alive_neighbors = sum(neighbours((x, y)))
+                    if grid[x][y] == 1:
+                        next_gen[x][y] = 1 if alive_neighbors in (2, 3) else 0
+                    else:
+                        next_gen[x][y] = 1 if alive_neighbors == 3 else 0
+            return next_gen
         for x in range(self.rows):
             for y in range(self.cols):
-                alive_neighbors = sum(self.get_neighbours((x, y)))
-                if self.curr_generation[x][y] == 1:
-                    next_gen[x][y] = 1 if alive_neighbors in (2, 3) else 0
-                else:
-                    next_gen[x][y] = 1 if alive_neighbors == 3 else 0
+                alive_neighbors = sum(neighbours((x, y)))
+                next_gen[x][y] = rule[grid[x][y] * 9 + alive_neighbors]
         return next_gen
 
     def step(self) -> None:
@@ -72,6 +192,94 @@ class GameOfLife:
             self.prev_generation = self.curr_generation
             self.curr_generation = self.get_next_generation()
             self.generations += 1
+            self.record_generation()
+
+    def _generation_keys(self) -> tp.Tuple[tp.Any, tp.Any]:
+        # объекты, хранящие предыдущее и текущее поколения
+        return self.prev_generation, self.curr_generation
+
+    def generation_hash(self, previous: bool = False) -> int:
+        """
+        Хэш текущего (или предыдущего) поколения, посчитанный по всем клеткам.
+        """
+        grid = self.prev_generation if previous else self.curr_generation
+        h = 0
+        for x, row in enumerate(grid):
+            for y, value in enumerate(row):
+                if value:
+                    h ^= cell_key((x, y))
+        return h
+
+    def _update_hash(self, h: int) -> int:
+        # хэш нового поколения по хэшу предыдущего
+        return h ^ self._hash_delta()
+
+    def _hash_delta(self) -> int:
+        # XOR ключей клеток, изменившихся за последний шаг
+        h = 0
+        for x, (old, new) in enumerate(zip(self.prev_generation, self.curr_generation)):
+            if old != new:
+                for y, (a, b) in enumerate(zip(old, new)):
+                    if a != b:
+                        h ^= cell_key((x, y))
+        return h
+
+    def forget_history(self) -> None:
+        """
+        Забыть хэши прошлых поколений и найденный цикл.
+        """
+        self._tracked = None
+        self.cycle = None
+        self._history: tp.Deque[tp.Tuple[int, int]] = collections.deque()
+        self._seen: tp.Dict[int, int] = {}
+
+    def record_generation(self) -> None:
+        """
+        Запомнить хэш нового поколения и проверить, не встречалось ли оно раньше.
+
+        Если предыдущее поколение уже хэшировано, новый хэш получается из него
+        в `_update_hash`, обычно только по изменившимся клеткам. Бэкенды NumPy
+        и bit-packed вместо этого хэшируют упакованное поле целиком: так
+        дешевле, чем искать изменения. Иначе (первый шаг или поле заменено
+        снаружи) история начинается заново с полного хэша двух последних
+        поколений.
+        """
+        prev_key, curr_key = self._generation_keys()
+        if self._tracked is not None and self._tracked[0] is prev_key:
+            h = self._update_hash(self._tracked[1])
+        else:
+            self.forget_history()
+            self._remember(self.generation_hash(previous=True), self.generations - 1)
+            h = self.generation_hash()
+        self._tracked = (curr_key, h)
+        self._remember(h, self.generations)
+
+    def _remember(self, h: int, generation: int) -> None:
+        seen = self._seen.get(h)
+        if seen is not None and self.cycle is None:
+            self.cycle = (seen, generation - seen)
+        if len(self._history) >= self.history_size:
+            old_hash, old_generation = self._history.popleft()
+            if self._seen.get(old_hash) == old_generation:
+                del self._seen[old_hash]
+        self._history.append((h, generation))
+        self._seen[h] = generation
+
+    @property
+    def is_cycling(self) -> bool:
+        """
+        Повторило ли поле одно из последних `history_size` поколений.
+        """
+        return self.cycle is not None
+
+    def advance(self, n: int) -> None:
+        """
+        Продвинуть игру на `n` поколений, не превышая `max_generations`.
+        """
+        for _ in range(n):
+            if self.is_max_generations_exceeded:
+                break
+            self.step()
 
     @property
     def is_max_generations_exceeded(self) -> bool:
@@ -93,8 +301,7 @@ class GameOfLife:
         Прочитать состояние клеток из указанного файла.
         """
         with open(filename, 'r') as file:
-            lines = file.readlines()
-        grid = [list(map(int, line.strip().split())) for line in lines]
+            grid = [parse_row(line) for line in file if line.strip()]
         rows = len(grid)
         cols = len(grid[0]) if rows > 0 else 0
         game = GameOfLife(size=(rows, cols), randomize=False)
@@ -109,3 +316,39 @@ class GameOfLife:
         with open(filename, 'w') as file:
             for row in self.curr_generation:
                 file.write(' '.join(map(str, row)) + '\n')
+
+
+# Доступные способы хранения поля: имя -> "модуль.Класс"
+BACKENDS = {
+    "list": "life.GameOfLife",
+    "numpy": "life_numpy.NumpyGameOfLife",
+    "bitpacked": "life_bitpacked.BitPackedGameOfLife",
+    "sparse": "life_sparse.SparseGameOfLife",
+    "hashlife": "life_hashlife.HashLifeGameOfLife",
+}
+
+
+def get_backend(name: str) -> tp.Type[GameOfLife]:
+    """
+    Получить класс игры для способа хранения поля `name`.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {sorted(BACKENDS)}")
+    module_name, _, class_name = BACKENDS[name].rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_game(
+    size: tp.Tuple[int, int],
+    randomize: bool = True,
+    max_generations: tp.Optional[float] = float("inf"),
+    backend: str = "list",
+    rule: str = LIFE,
+    toroidal: bool = False,
+) -> GameOfLife:
+    """
+    Создать игру с выбранным способом хранения поля (см. `BACKENDS`).
+    """
+    return get_backend(backend)(
+        size, randomize=randomize, max_generations=max_generations, rule=rule, toroidal=toroidal
+    )
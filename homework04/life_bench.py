@@ -0,0 +1,154 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import typing as tp
+
+import numpy as np
+
+from life import BACKENDS, GameOfLife, create_game
+from life_io import set_live_cells
+
+# Способы хранения, которые можно замерить: все из `life.BACKENDS` и многопроцессный
+ALL_BACKENDS = list(BACKENDS) + ["parallel"]
+# Способы, чей шаг сам вызывает `count_neighbours` в этом процессе: только для
+# них шаг делится на подсчет соседей и применение правил. У многопроцессного
+# способа `count_neighbours` унаследован от NumPy, а шаг считается в пуле.
+PHASED_BACKENDS = ("numpy", "bitpacked")
+
+
+def make_game(backend: str, size: int, density: float, seed: int = 0) -> GameOfLife:
+    """
+    Игра на поле `size` x `size`, где доля `density` клеток живая.
+    """
+    if backend == "parallel":
+        from life_parallel import ParallelGameOfLife
+
+        game: GameOfLife = ParallelGameOfLife((size, size), randomize=False)
+    else:
+        game = create_game((size, size), randomize=False, backend=backend)
+    rng = np.random.default_rng(seed)
+    xs, ys = np.nonzero(rng.random((size, size)) < density)
+    set_live_cells(game, xs, ys)
+    return game
+
+
+def _timed(function: tp.Callable[[], tp.Any], repeat: int) -> float:
+    # лучшее время из `repeat` запусков меньше всего зависит от шума
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _close(game: GameOfLife) -> None:
+    close = getattr(game, "close", None)
+    if close is not None:
+        close()
+
+
+def measure(backend: str, size: int, density: float, generations: int, repeat: int = 3) -> tp.Dict[str, tp.Any]:
+    """
+    Замерить один способ хранения на одном поле.
+
+    Фазы: `allocate` — создание пустого поля через `create_grid` (а не
+    выделение памяти внутри шага), `neighbours` — `count_neighbours`,
+    `rules` — остаток `get_next_generation`: применение правил вместе с
+    выделением массива нового поколения. Хэш поколения и смена буферов ни
+    в одну из двух фаз не входят. Для способов не из `PHASED_BACKENDS`
+    `neighbours` и `rules` равны None. `step` — среднее время поколения
+    при `advance(generations)`; HashLife при этом прыгает через поколения.
+    Пиковая память замеряется отдельным прогоном под `tracemalloc`,
+    чтобы трассировка не искажала время.
+    """
+    game = make_game(backend, size, density)
+    try:
+        allocate = _timed(game.create_grid, repeat)
+        neighbours = rules = None
+        if backend in PHASED_BACKENDS:
+            neighbours = _timed(game.count_neighbours, repeat)
+            rules = max(_timed(game.get_next_generation, repeat) - neighbours, 0.0)
+        start = time.perf_counter()
+        game.advance(generations)
+        step = (time.perf_counter() - start) / generations
+        population = int(np.count_nonzero(np.asarray(game.curr_generation)))
+    finally:
+        _close(game)
+
+    tracemalloc.start()
+    game = make_game(backend, size, density)
+    try:
+        tracemalloc.reset_peak()
+        game.advance(min(generations, 3))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        _close(game)
+
+    return {
+        "backend": backend,
+        "size": size,
+        "density": density,
+        "generations": generations,
+        "cells_per_second": size * size / step if step > 0 else None,
+        "peak_memory_bytes": peak,
+        "population": population,
+        "phases": {
+            "allocate": allocate,
+            "neighbours": neighbours,
+            "rules": rules,
+            "step": step,
+        },
+    }
+
+
+def run(
+    backends: tp.Iterable[str],
+    sizes: tp.Iterable[int],
+    densities: tp.Iterable[float],
+    generations: int,
+    repeat: int = 3,
+) -> tp.Dict[str, tp.Any]:
+    """
+    Замерить все сочетания способов хранения, размеров и плотностей.
+
+    Возвращает словарь для `json.dumps`: описание окружения и список замеров.
+    """
+    results = [
+        measure(backend, size, density, generations, repeat)
+        for backend in backends
+        for size in sizes
+        for density in densities
+    ]
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Замеры скорости шага игры «Жизнь» без интерфейса.")
+    parser.add_argument("--backends", nargs="+", default=ALL_BACKENDS, choices=ALL_BACKENDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[64, 256, 1024])
+    parser.add_argument("--densities", nargs="+", type=float, default=[0.1, 0.5])
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="файл для JSON (по умолчанию stdout)")
+    args = parser.parse_args(argv)
+    report = run(args.backends, args.sizes, args.densities, args.generations, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
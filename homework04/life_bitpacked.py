@@ -0,0 +1,262 @@
+import pathlib
+import typing as tp
+
+import numpy as np
+
+from life import LIFE, LIFE_RULE, GameOfLife, parse_row
+
+Board = np.ndarray
+
+WORD_BITS = 64
+
+
+def _full_add(a: Board, b: Board, c: Board) -> tp.Tuple[Board, Board]:
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def pack_rows(grid: tp.Union[Board, tp.List[tp.List[int]]], cols: int) -> Board:
+    """
+    Упаковать поле из нулей и единиц в слова по 64 клетки.
+
+    Бит `j` слова `w` строки — клетка в столбце `w * 64 + j`.
+    """
+    cells = np.asarray(grid, dtype=np.uint8).reshape(-1, cols)
+    words = (cols + WORD_BITS - 1) // WORD_BITS
+    packed = np.zeros((cells.shape[0], words * 8), dtype=np.uint8)
+    packed[:, : (cols + 7) // 8] = np.packbits(cells, axis=1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64)
+
+
+def live_cells(board: Board) -> tp.Tuple[Board, Board]:
+    """
+    Координаты (строки, столбцы) единичных битов упакованного поля.
+
+    Распаковываются только ненулевые слова.
+    """
+    rows, words = np.nonzero(board)
+    raw = board[rows, words].astype("<u8").view(np.uint8).reshape(-1, 8)
+    index, bits = np.nonzero(np.unpackbits(raw, axis=1, bitorder="little"))
+    return rows[index], words[index] * WORD_BITS + bits
+
+
+def match_counts(planes: tp.Sequence[Board], counts: tp.Iterable[int]) -> Board:
+    """
+    Маска клеток, у которых число соседей в битовых плоскостях `planes` входит в `counts`.
+    """
+    result = np.zeros_like(planes[0])
+    for count in counts:
+        mask = ~np.zeros_like(planes[0])
+        for k, plane in enumerate(planes):
+            mask &= plane if count >> k & 1 else ~plane
+        result |= mask
+    return result
+
+
+def unpack_rows(board: Board, cols: int) -> Board:
+    """
+    Распаковать слова в массив uint8 из нулей и единиц шириной `cols`.
+    """
+    raw = board.astype("<u8").view(np.uint8)
+    return np.unpackbits(raw, axis=1, count=cols, bitorder="little")
+
+
+class BitPackedGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь» с полем, упакованным по 64 клетки в слово uint64.
+
+    Соседи считаются сразу для целых слов: восемь сдвинутых копий поля
+    складываются побитовым сумматором (bit-sliced adder) в четыре битовые
+    плоскости счетчика. Поле 10000 x 10000 занимает около 12 МБ.
+
+    Упакованные поколения хранятся в `board` и `prev_board`;
+    `curr_generation` и `prev_generation` возвращают распакованные копии.
+    """
+
+    def __init__(
+        self,
+        size: tp.Tuple[int, int],
+        randomize: bool = True,
+        max_generations: tp.Optional[float] = float("inf"),
+        rule: str = LIFE,
+        toroidal: bool = False,
+    ) -> None:
+        self.rows, self.cols = size
+        self.rule = rule
+        self.toroidal = toroidal
+        self.words = (self.cols + WORD_BITS - 1) // WORD_BITS
+        tail = self.cols % WORD_BITS
+        # маска значимых битов последнего слова строки
+        self.tail_mask = np.uint64((1 << tail) - 1 if tail else (1 << WORD_BITS) - 1)
+        self.prev_board = self.create_grid()
+        self.board = self.create_grid(randomize=randomize)
+        self.max_generations = max_generations
+        self.generations = 1
+
+    @property  # type: ignore[override]
+    def curr_generation(self) -> Board:
+        return unpack_rows(self.board, self.cols)
+
+    @curr_generation.setter
+    def curr_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self.board = pack_rows(grid, self.cols)
+
+    @property  # type: ignore[override]
+    def prev_generation(self) -> Board:
+        return unpack_rows(self.prev_board, self.cols)
+
+    @prev_generation.setter
+    def prev_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self.prev_board = pack_rows(grid, self.cols)
+
+    def create_grid(self, randomize: bool = False) -> Board:  # type: ignore[override]
+        """
+        Создание упакованного поля размером `rows` x `words`.
+
+        Если `randomize` истинно, каждая клетка равновероятно живая или мертвая.
+        """
+        if not randomize:
+            return np.zeros((self.rows, self.words), dtype=np.uint64)
+        board = np.random.randint(0, 1 << WORD_BITS, size=(self.rows, self.words), dtype=np.uint64)
+        board[:, -1:] &= self.tail_mask
+        return board
+
+    def is_alive(self, cell: tp.Tuple[int, int]) -> int:
+        x, y = cell
+        return int(self.board[x, y // WORD_BITS]) >> (y % WORD_BITS) & 1
+
+    def get_neighbours(self, cell: tp.Tuple[int, int]) -> tp.List[int]:
+        """
+        Получить соседей для данной клетки.
+        """
+        x, y = cell
+        if self.toroidal:
+            return [
+                self.is_alive((nx % self.rows, ny % self.cols))
+                for nx in (x - 1, x, x + 1)
+                for ny in (y - 1, y, y + 1)
+                if (nx, ny) != (x, y)
+            ]
+        return [
+            self.is_alive((nx, ny))
+            for nx in (x - 1, x, x + 1)
+            for ny in (y - 1, y, y + 1)
+            if (nx, ny) != (x, y) and 0 <= nx < self.rows and 0 <= ny < self.cols
+        ]
+
+    def _shift_columns(self, board: Board) -> tp.Tuple[Board, Board]:
+        # west[.., c] — клетка c - 1, east[.., c] — клетка c + 1
+        one, top = np.uint64(1), np.uint64(WORD_BITS - 1)
+        west = board << one
+        west[:, 1:] |= board[:, :-1] >> top
+        east = board >> one
+        east[:, :-1] |= board[:, 1:] << top
+        if self.toroidal:
+            last = np.uint64((self.cols - 1) % WORD_BITS)
+            west[:, 0] |= (board[:, -1] >> last) & one
+            east[:, -1] |= (board[:, 0] & one) << last
+        return west, east
+
+    def count_neighbours(self) -> tp.Tuple[Board, Board, Board, Board]:
+        """
+        Посчитать число соседей всех клеток в виде четырех битовых плоскостей.
+
+        Возвращает (bit0, bit1, bit2, bit3): бит `k` счетчика соседей клетки
+        лежит в том же бите того же слова плоскости `bitk`.
+        """
+        board = self.board
+        west, east = self._shift_columns(board)
+        zero = np.zeros((1, self.words), dtype=np.uint64)
+        # три горизонтальные плоскости строки; соседние строки получаются сдвигом по вертикали
+        planes = [west, board, east]
+        if self.toroidal:
+            up = [np.roll(plane, 1, axis=0) for plane in planes]
+            down = [np.roll(plane, -1, axis=0) for plane in planes]
+        else:
+            up = [np.vstack((zero, plane[:-1])) for plane in planes]
+            down = [np.vstack((plane[1:], zero)) for plane in planes]
+        ones_a, twos_a = _full_add(up[0], up[1], up[2])
+        ones_b, twos_b = _full_add(down[0], down[1], down[2])
+        ones_c, twos_c = west ^ east, west & east
+        bit0, twos_d = _full_add(ones_a, ones_b, ones_c)
+        twos, fours_a = _full_add(twos_a, twos_b, twos_c)
+        bit1, fours_b = twos ^ twos_d, twos & twos_d
+        return bit0, bit1, fours_a ^ fours_b, fours_a & fours_b
+
+    def get_next_generation(self) -> Board:  # type: ignore[override]
+        """
+        Получить следующее упакованное поколение клеток.
+        """
+        planes = self.count_neighbours()
+        if self.rule_table == LIFE_RULE:
+            bit0, bit1, bit2, bit3 = planes
+            # 3 соседа — рождение или выживание, 2 соседа — только выживание
+            board = bit1 & ~bit2 & ~bit3 & (bit0 | self.board)
+        else:
+            table = self.rule_table
+            born = match_counts(planes, [count for count in range(9) if table[count]])
+            survive = match_counts(planes, [count for count in range(9) if table[9 + count]])
+            board = (born & ~self.board) | (survive & self.board)
+        board[:, -1:] &= self.tail_mask
+        return board
+
+    def step(self) -> None:
+        if not self.is_max_generations_exceeded:
+            self.prev_board = self.board
+            self.board = self.get_next_generation()
+            self.generations += 1
+            self.record_generation()
+
+    def _generation_keys(self) -> tp.Tuple[Board, Board]:
+        return self.prev_board, self.board
+
+    def generation_hash(self, previous: bool = False) -> int:
+        """
+        Хэш текущего (или предыдущего) поколения по упакованному полю.
+
+        Как и в NumPy, хэш считается по всему полю, а не по разнице поколений.
+        """
+        return hash((self.prev_board if previous else self.board).tobytes())
+
+    def _update_hash(self, h: int) -> int:
+        return self.generation_hash()
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return not np.array_equal(self.board, self.prev_board)
+
+    @classmethod
+    def from_file(cls, filename: pathlib.Path) -> "BitPackedGameOfLife":
+        """
+        Прочитать состояние клеток из указанного файла.
+
+        Файл читается построчно, каждая строка сразу упаковывается.
+        """
+        packed_rows = []
+        cols = 0
+        with open(filename, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                row = np.array(parse_row(line), dtype=np.uint8)
+                cols = len(row)
+                packed_rows.append(pack_rows(row, cols))
+        game = cls(size=(len(packed_rows), cols), randomize=False)
+        if packed_rows:
+            game.board = np.vstack(packed_rows)
+            game.prev_board = game.board.copy()
+        return game
+
+    def save(self, filename: pathlib.Path) -> None:
+        """
+        Сохранить текущее состояние клеток в указанный файл.
+
+        Строки распаковываются по одной, поле целиком не распаковывается.
+        """
+        with open(filename, "w") as file:
+            for row in range(self.rows):
+                cells = unpack_rows(self.board[row : row + 1], self.cols)[0]
+                file.write(" ".join(map(str, cells)) + "\n")
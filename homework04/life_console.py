@@ -1,11 +1,27 @@
 import curses
+import typing as tp
+
 from life import GameOfLife
-from ui import UI
+from ui import RateMeter, Simulation, UI, copy_window
 
 
 class Console(UI):
-    def __init__(self, life: GameOfLife) -> None:
+    def __init__(self, life: GameOfLife, auto: bool = False, rate: tp.Optional[float] = None) -> None:
+        """
+        При `auto=True` игра шагает сама в фоновом потоке со скоростью
+        `rate` поколений в секунду (или максимально быстро), а экран
+        показывает последнее готовое поколение.
+
+        Поле рисуется по символу на клетку; если оно больше терминала,
+        стрелки сдвигают окно просмотра.
+        """
         super().__init__(life)
+        self.auto = auto
+        self.rate = rate
+        # левый верхний угол окна просмотра и строки, уже выведенные на экран
+        self.top = 0
+        self.left = 0
+        self.drawn: tp.List[str] = []
 
     def draw_borders(self, screen) -> None:
         """ Отобразить рамку. """
@@ -14,7 +30,10 @@ class Console(UI):
         screen.addch(0, 0, '+')
         screen.addch(0, w - 1, '+')
         screen.addch(h - 1, 0, '+')
-        screen.addch(h - 1, w - 1, '+')
+        try:
+            screen.addch(h - 1, w - 1, '+')
+        except curses.error:
+            pass  # curses сообщает об ошибке, когда курсор уходит за правый нижний угол
         for x in range(1, w - 1):
             screen.addch(0, x, '-')
             screen.addch(h - 1, x, '-')
@@ -22,41 +41,139 @@ class Console(UI):
             screen.addch(y, 0, '|')
             screen.addch(y, w - 1, '|')
 
-    def draw_grid(self, screen) -> None:
-        """ Отобразить состояние клеток. """
+    def viewport(self, screen) -> tp.Tuple[int, int]:
+        """ Размер видимой части поля: экран без рамки, но не больше поля. """
         h, w = screen.getmaxyx()
-        grid_height = self.life.rows
-        grid_width = self.life.cols
-        cell_height = h // grid_height
-        cell_width = w // grid_width
+        return max(min(h - 2, self.life.rows), 0), max(min(w - 2, self.life.cols), 0)
+
+    def pan(self, screen, dx: int, dy: int) -> None:
+        """ Сдвинуть окно просмотра, не выходя за пределы поля. """
+        height, width = self.viewport(screen)
+        self.top = max(0, min(self.top + dx, self.life.rows - height))
+        self.left = max(0, min(self.left + dy, self.life.cols - width))
+
+    def visible_window(self, screen) -> tp.Tuple[int, int, int, int]:
+        """ Видимый прямоугольник поля: верх, лево, высота и ширина. """
+        self.pan(screen, 0, 0)
+        height, width = self.viewport(screen)
+        return self.top, self.left, height, width
+
+    def visible_rows(self, screen, window: tp.Any = None) -> tp.List[str]:
+        """
+        Строки символов видимой части поля, по символу на клетку.
+
+        `window` — уже вырезанная видимая часть поля (например, из
+        `Simulation.snapshot`); без него она берется из игры.
+        """
+        if window is None:
+            window = copy_window(self.life, *self.visible_window(screen))
+        return ["".join(" *"[value] for value in row) for row in window]
+
+    def draw_grid(self, screen, window: tp.Any = None) -> None:
+        """
+        Отобразить состояние клеток.
+
+        На экран пишутся только символы, изменившиеся с прошлого кадра;
+        после сдвига окна или изменения размера терминала `drawn` очищается
+        и поле рисуется заново.
+        """
+        rows = self.visible_rows(screen, window)
+        for i, line in enumerate(rows):
+            old = self.drawn[i] if i < len(self.drawn) else None
+            if line == old:
+                continue
+            for j, ch in enumerate(line):
+                if old is None or old[j] != ch:
+                    screen.addch(i + 1, j + 1, ch)
+        self.drawn = rows
+
+    def redraw(self, screen) -> None:
+        """ Очистить экран и нарисовать рамку; клетки нарисуются заново. """
+        screen.erase()
+        self.draw_borders(screen)
+        self.drawn = []
 
-        for i in range(grid_height):
-            for j in range(grid_width):
-                ch = ' ' if self.life.curr_generation[i][j] == 0 else '*'
-                screen.addch(i * cell_height + 1, j * cell_width + 1, ch)
+    def handle_key(self, screen, ch: int) -> bool:
+        """
+        Обработать клавиши, общие для всех режимов.
+
+        Стрелки сдвигают окно просмотра на четверть экрана. Возвращает
+        False, если нажата 'q'.
+        """
+        if ch == ord('q'):
+            return False
+        height, width = self.viewport(screen)
+        moves = {
+            curses.KEY_UP: (-max(height // 4, 1), 0),
+            curses.KEY_DOWN: (max(height // 4, 1), 0),
+            curses.KEY_LEFT: (0, -max(width // 4, 1)),
+            curses.KEY_RIGHT: (0, max(width // 4, 1)),
+        }
+        if ch in moves:
+            top, left = self.top, self.left
+            self.pan(screen, *moves[ch])
+            if (top, left) != (self.top, self.left):
+                self.drawn = []
+        elif ch == curses.KEY_RESIZE:
+            self.redraw(screen)
+        return True
+
+    def draw_status(self, screen, status: str) -> None:
+        """
+        Вывести строку состояния поверх нижней рамки.
+
+        Остаток рамки дописывается заново, чтобы от более длинной
+        прошлой строки не оставалось символов.
+        """
+        h, w = screen.getmaxyx()
+        width = max(w - 4, 0)
+        screen.addnstr(h - 1, 2, f" {status} ".ljust(width, "-"), width)
+
+    def show(self, screen, status: str, window: tp.Any = None) -> None:
+        """ Обновить изменившиеся клетки и строку состояния одним выводом в терминал. """
+        self.draw_grid(screen, window)
+        self.draw_status(screen, f"{status}, view {self.top},{self.left}")
+        screen.noutrefresh()
+        curses.doupdate()
 
     def run(self) -> None:
         """ Запуск игрового процесса и отрисовка состояния. """
-        curses.curs_set(0)  # Скрыть курсор
-        screen = curses.initscr()
-        curses.noecho()  # Не отображать вводимые символы
-        curses.cbreak()  # Входные данные обрабатываются сразу
-        screen.nodelay(1)  # Не блокировать ввод
+        curses.wrapper(self.run_auto if self.auto else self.run_manual)
 
-        try:
-            while not self.life.is_max_generations_exceeded and self.life.is_changing:
-                screen.clear()
-                self.draw_borders(screen)
-                self.draw_grid(screen)
-                screen.refresh()
+    def run_manual(self, screen) -> None:
+        """ Шаг по нажатию пробела. """
+        curses.curs_set(0)  # Скрыть курсор
+        screen.timeout(100)  # Ждать нажатия не дольше 100 мс
+        self.redraw(screen)
 
-                ch = screen.getch()
-                if ch == ord('q'):  # Нажатие 'q' для выхода
-                    break
-                elif ch == ord(' '):  # Нажатие пробела для перехода к следующему поколению
-                    self.life.step()
+        # Игра заканчивается, когда поле повторило одно из недавних поколений
+        while not self.life.is_max_generations_exceeded and self.life.is_changing and self.life.cycle is None:
+            self.show(screen, f"{self.life.generations} gen")
+            ch = screen.getch()
+            if not self.handle_key(screen, ch):
+                break
+            if ch == ord(' '):  # Нажатие пробела для перехода к следующему поколению
+                self.life.step()
 
-                curses.napms(100)  # Задержка между обновлениями экрана
+    def run_auto(self, screen) -> None:
+        """ Непрерывная игра: шаги в фоновом потоке, на экране — последнее поколение. """
+        curses.curs_set(0)
+        screen.nodelay(1)
+        simulation = Simulation(self.life, self.rate)
+        fps = RateMeter()
+        self.redraw(screen)
+        simulation.start()
 
+        try:
+            while self.handle_key(screen, screen.getch()):
+                # копируется только видимая часть поля
+                generation, window = simulation.snapshot(self.visible_window(screen))
+                fps.tick()
+                self.show(
+                    screen, f"{generation} gen, {simulation.meter.rate:.0f} gen/s, {fps.rate:.0f} fps", window
+                )
+                if not simulation.is_alive():
+                    break  # Последнее поколение уже на экране
+                curses.napms(16)  # Около 60 кадров в секунду
         finally:
-            curses.endwin()  # Завершить работу с curses
+            simulation.stop()
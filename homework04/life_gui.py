@@ -1,42 +1,177 @@
+import typing as tp
+
+import numpy as np
 import pygame
 from life import GameOfLife
 from pygame.locals import *
-from ui import UI
+from ui import RateMeter, Simulation, UI, copy_grid
+
+ALIVE = (0, 255, 0)
+DEAD = (0, 0, 0)
+LINE = (200, 200, 200)
+
+
+def changed_cells(old: tp.Any, new: tp.Any) -> tp.List[tp.Tuple[int, int]]:
+    """
+    Координаты клеток, которые отличаются в двух поколениях.
+
+    Поколения — массивы NumPy или списки списков; в списках построчное
+    сравнение сразу пропускает строки без изменений.
+    """
+    if isinstance(new, np.ndarray):
+        xs, ys = np.nonzero(np.asarray(old) != new)
+        return list(zip(xs.tolist(), ys.tolist()))
+    cells = []
+    for i, (old_row, new_row) in enumerate(zip(old, new)):
+        if old_row != new_row:
+            cells.extend((i, j) for j, (a, b) in enumerate(zip(old_row, new_row)) if a != b)
+    return cells
+
+
+def cell_surface(rows: int, cols: int) -> pygame.Surface:
+    """
+    8-битная поверхность по клетке на пиксель с палитрой из двух цветов.
+    """
+    surface = pygame.Surface((cols, rows), depth=8)
+    surface.set_palette([DEAD, ALIVE] + [DEAD] * 254)
+    return surface
+
 
 class GUI(UI):
-    def __init__(self, life: GameOfLife, cell_size: int = 10, speed: int = 10) -> None:
+    """
+    Окно pygame с полем игры.
+
+    Режим `render="rects"` перерисовывает прямоугольниками только
+    изменившиеся клетки. Режим `render="surfarray"` для полей в миллионы
+    клеток копирует все поле в маленькую поверхность (пиксель на клетку)
+    через `pygame.surfarray` и растягивает ее на окно одной операцией.
+
+    При `auto=True` игра шагает сама в фоновом потоке (`ui.Simulation`)
+    со скоростью `rate` поколений в секунду или максимально быстро, а окно
+    не чаще `speed` раз в секунду показывает последнее готовое поколение.
+    """
+
+    # Если изменилась большая доля клеток, дешевле перерисовать окно целиком
+    full_redraw_ratio = 0.25
+    # Более мелкие клетки в режиме surfarray рисуются без линий сетки
+    min_lined_cell_size = 4
+
+    def __init__(
+        self,
+        life: GameOfLife,
+        cell_size: int = 10,
+        speed: int = 10,
+        render: str = "rects",
+        auto: bool = False,
+        rate: tp.Optional[float] = None,
+    ) -> None:
         super().__init__(life)
+        if render not in ("rects", "surfarray"):
+            raise ValueError(f"Unknown render mode: {render!r}")
         self.cell_size = cell_size
         self.speed = speed
+        self.render = render
+        self.auto = auto
+        self.rate = rate
         self.width = life.cols * cell_size
         self.height = life.rows * cell_size
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Game of Life")
+        self.lines = self.render_lines()
+        self.cells = cell_surface(life.rows, life.cols)
+        # растянутая копия `cells` того же формата, чтобы scale писал без выделения памяти
+        self.scaled = pygame.Surface((self.width, self.height), depth=8)
+        self.scaled.set_palette(self.cells.get_palette())
+        # поколение, которое сейчас нарисовано на экране
+        self.drawn: tp.Any = None
 
-    def draw_lines(self) -> None:
-        """ Отобразить линии сетки. """
+    def render_lines(self) -> pygame.Surface:
+        """ Нарисовать линии сетки один раз на прозрачной поверхности. """
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         for x in range(0, self.width, self.cell_size):
-            pygame.draw.line(self.screen, (200, 200, 200), (x, 0), (x, self.height))
+            pygame.draw.line(surface, LINE, (x, 0), (x, self.height))
         for y in range(0, self.height, self.cell_size):
-            pygame.draw.line(self.screen, (200, 200, 200), (0, y), (self.width, y))
+            pygame.draw.line(surface, LINE, (0, y), (self.width, y))
+        return surface
+
+    def draw_lines(self) -> None:
+        """ Отобразить линии сетки. """
+        self.screen.blit(self.lines, (0, 0))
 
-    def draw_grid(self) -> None:
+    def draw_grid(self, grid: tp.Any = None) -> None:
         """ Отобразить состояние клеток. """
+        self.screen.fill(DEAD)
+        if grid is None:
+            grid = self.life.curr_generation
         for i in range(self.life.rows):
             for j in range(self.life.cols):
-                color = (0, 255, 0) if self.life.curr_generation[i][j] == 1 else (0, 0, 0)
-                pygame.draw.rect(
-                    self.screen,
-                    color,
-                    pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
-                )
+                if grid[i][j] == 1:
+                    pygame.draw.rect(
+                        self.screen,
+                        ALIVE,
+                        pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
+                    )
+        self.drawn = copy_grid(grid)
+
+    def draw_surface(self, grid: tp.Any = None) -> None:
+        """ Отобразить все клетки одним растянутым блитом. """
+        grid = np.asarray(self.life.curr_generation if grid is None else grid, dtype=np.uint8)
+        # surfarray индексируется как [x][y], то есть [столбец][строка]
+        pygame.surfarray.blit_array(self.cells, grid.T)
+        pygame.transform.scale(self.cells, (self.width, self.height), self.scaled)
+        self.screen.blit(self.scaled, (0, 0))
+        if self.cell_size >= self.min_lined_cell_size:
+            self.draw_lines()
+
+    def draw_changes(self, grid: tp.Any = None) -> tp.Optional[tp.List[pygame.Rect]]:
+        """
+        Перерисовать только клетки, изменившиеся с последней отрисовки.
+
+        Возвращает прямоугольники, которые нужно передать в
+        `pygame.display.update`, или None, если окно перерисовано целиком.
+        """
+        if grid is None:
+            grid = self.life.curr_generation
+        if self.drawn is None:
+            changed = None
+        else:
+            changed = changed_cells(self.drawn, grid)
+        if changed is None or len(changed) > self.full_redraw_ratio * self.life.rows * self.life.cols:
+            self.draw_grid(grid)
+            self.draw_lines()
+            return None
+        rects = []
+        for i, j in changed:
+            rect = pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
+            self.screen.fill(ALIVE if grid[i][j] == 1 else DEAD, rect)
+            self.screen.blit(self.lines, rect, rect)
+            rects.append(rect)
+        self.drawn = copy_grid(grid)
+        return rects
+
+    def draw(self, grid: tp.Any = None) -> None:
+        """ Отрисовать поколение выбранным способом и обновить окно. """
+        if self.render == "surfarray":
+            self.draw_surface(grid)
+            rects = None
+        else:
+            rects = self.draw_changes(grid)
+        if rects is None:
+            pygame.display.flip()  # Обновить экран целиком
+        elif rects:
+            pygame.display.update(rects)  # Обновить только изменившиеся клетки
 
     def run(self) -> None:
         """ Запуск игрового процесса и отрисовка состояния. """
+        if self.auto:
+            self.run_auto()
+            return
         clock = pygame.time.Clock()
         running = True
+        self.drawn = None
 
-        while running and not self.life.is_max_generations_exceeded:
+        # Останавливаемся, как только поле зациклилось (в том числе замерло)
+        while running and not self.life.is_max_generations_exceeded and self.life.cycle is None:
             for event in pygame.event.get():
                 if event.type == QUIT:
                     running = False
@@ -46,11 +181,35 @@ class GUI(UI):
                     elif event.key == K_q:
                         running = False
 
-            self.screen.fill((0, 0, 0))  # Очистить экран
-            self.draw_grid()
-            self.draw_lines()
-            pygame.display.flip()  # Обновить экран
-
+            self.draw()
             clock.tick(self.speed)  # Задержка для управления частотой обновления
 
         pygame.quit()
+
+    def run_auto(self) -> None:
+        """ Непрерывная игра: шаги в фоновом потоке, в окне — последнее поколение. """
+        clock = pygame.time.Clock()
+        simulation = Simulation(self.life, self.rate)
+        fps = RateMeter()
+        self.drawn = None
+        running = True
+        simulation.start()
+
+        try:
+            while running:
+                for event in pygame.event.get():
+                    if event.type == QUIT or event.type == KEYDOWN and event.key == K_q:
+                        running = False
+
+                generation, grid = simulation.snapshot()
+                self.draw(grid)
+                fps.tick()
+                pygame.display.set_caption(
+                    f"Game of Life: {generation} gen, {simulation.meter.rate:.0f} gen/s, {fps.rate:.0f} fps"
+                )
+                if not simulation.is_alive():
+                    break  # Последнее поколение уже на экране
+                clock.tick(self.speed)
+        finally:
+            simulation.stop()
+            pygame.quit()
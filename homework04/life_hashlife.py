@@ -0,0 +1,238 @@
+import functools
+import typing as tp
+
+from life import LIFE_RULE
+from life_sparse import LiveCells, SparseGameOfLife
+
+# Максимальное число узлов в кэшах `join` и `successor`; при переполнении
+# вытесняются давно не использованные узлы.
+CACHE_SIZE = 1 << 20
+
+
+class Node(tp.NamedTuple):
+    """
+    Узел квадродерева размером 2**k x 2**k.
+
+    `a`, `b`, `c`, `d` — четверти: северо-запад, северо-восток, юго-запад,
+    юго-восток; `n` — число живых клеток. Хэш вычисляется один раз при
+    создании, чтобы словари кэшей не обходили дерево рекурсивно.
+    """
+
+    k: int
+    a: tp.Optional["Node"]
+    b: tp.Optional["Node"]
+    c: tp.Optional["Node"]
+    d: tp.Optional["Node"]
+    n: int
+    hash: int
+
+    def __hash__(self) -> int:
+        return self.hash
+
+
+ON = Node(0, None, None, None, None, 1, 1)
+OFF = Node(0, None, None, None, None, 0, 0)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def join(a: Node, b: Node, c: Node, d: Node) -> Node:
+    """
+    Собрать узел уровня k + 1 из четырех узлов уровня k.
+    """
+    n = a.n + b.n + c.n + d.n
+    nhash = (
+        a.k + 2 + 5131830419411 * a.hash + 3758991985019 * b.hash + 8973110871315 * c.hash + 4318490180473 * d.hash
+    ) & ((1 << 63) - 1)
+    return Node(a.k + 1, a, b, c, d, n, nhash)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_zero(k: int) -> Node:
+    """
+    Пустой узел уровня k.
+    """
+    return OFF if k == 0 else join(get_zero(k - 1), get_zero(k - 1), get_zero(k - 1), get_zero(k - 1))
+
+
+def centre(m: Node) -> Node:
+    """
+    Поместить узел в центр пустого узла вдвое большего размера.
+    """
+    z = get_zero(m.k - 1)
+    return join(join(z, z, z, m.a), join(z, z, m.b, z), join(z, m.c, z, z), join(m.d, z, z, z))
+
+
+def _life(
+    a: Node, b: Node, c: Node, d: Node, e: Node, f: Node, g: Node, h: Node, i: Node, rule: bytes
+) -> Node:
+    outer = a.n + b.n + c.n + d.n + f.n + g.n + h.n + i.n
+    return ON if rule[e.n * 9 + outer] else OFF
+
+
+def _life_4x4(m: Node, rule: bytes) -> Node:
+    # a, b, c, d у m — блоки 2 x 2; результат — центральный блок 2 x 2 через поколение
+    na = _life(m.a.a, m.a.b, m.b.a, m.a.c, m.a.d, m.b.c, m.c.a, m.c.b, m.d.a, rule)
+    nb = _life(m.a.b, m.b.a, m.b.b, m.a.d, m.b.c, m.b.d, m.c.b, m.d.a, m.d.b, rule)
+    nc = _life(m.a.c, m.a.d, m.b.c, m.c.a, m.c.b, m.d.a, m.c.c, m.c.d, m.d.c, rule)
+    nd = _life(m.a.d, m.b.c, m.b.d, m.c.b, m.d.a, m.d.b, m.c.d, m.d.c, m.d.d, rule)
+    return join(na, nb, nc, nd)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def successor(m: Node, j: tp.Optional[int] = None, rule: bytes = LIFE_RULE) -> Node:
+    """
+    Центральная половина узла `m` через 2**j поколений (по умолчанию j = k - 2).
+
+    `rule` — таблица правила (см. `life.parse_rule`); правила с B0 не
+    поддерживаются, так как пустой узел должен оставаться пустым.
+    """
+    if m.n == 0:
+        return m.a
+    if m.k == 2:
+        return _life_4x4(m, rule)
+    j = m.k - 2 if j is None else min(j, m.k - 2)
+    c1 = successor(join(m.a.a, m.a.b, m.a.c, m.a.d), j, rule)
+    c2 = successor(join(m.a.b, m.b.a, m.a.d, m.b.c), j, rule)
+    c3 = successor(join(m.b.a, m.b.b, m.b.c, m.b.d), j, rule)
+    c4 = successor(join(m.a.c, m.a.d, m.c.a, m.c.b), j, rule)
+    c5 = successor(join(m.a.d, m.b.c, m.c.b, m.d.a), j, rule)
+    c6 = successor(join(m.b.c, m.b.d, m.d.a, m.d.b), j, rule)
+    c7 = successor(join(m.c.a, m.c.b, m.c.c, m.c.d), j, rule)
+    c8 = successor(join(m.c.b, m.d.a, m.c.d, m.d.c), j, rule)
+    c9 = successor(join(m.d.a, m.d.b, m.d.c, m.d.d), j, rule)
+    if j < m.k - 2:
+        # шаг меньше половины размера: собрать центр из центров девяти подузлов без второго прыжка
+        return join(
+            join(c1.d, c2.c, c4.b, c5.a),
+            join(c2.d, c3.c, c5.b, c6.a),
+            join(c4.d, c5.c, c7.b, c8.a),
+            join(c5.d, c6.c, c8.b, c9.a),
+        )
+    return join(
+        successor(join(c1, c2, c4, c5), j, rule),
+        successor(join(c2, c3, c5, c6), j, rule),
+        successor(join(c4, c5, c7, c8), j, rule),
+        successor(join(c5, c6, c8, c9), j, rule),
+    )
+
+
+def clear_cache() -> None:
+    """
+    Освободить все кэши узлов.
+    """
+    join.cache_clear()
+    successor.cache_clear()
+    get_zero.cache_clear()
+
+
+def _is_padded(node: Node) -> bool:
+    # все живые клетки лежат в центральной четверти узла
+    return (
+        node.a.n == node.a.d.d.n
+        and node.b.n == node.b.c.c.n
+        and node.c.n == node.c.b.b.n
+        and node.d.n == node.d.a.a.n
+    )
+
+
+def construct(live: LiveCells) -> tp.Tuple[Node, int, int]:
+    """
+    Построить квадродерево по множеству живых клеток.
+
+    Возвращает узел и координаты (строка, столбец) его левого верхнего угла.
+    """
+    if not live:
+        return get_zero(3), 0, 0
+    top = min(x for x, _ in live)
+    left = min(y for _, y in live)
+    # ключ — (столбец, строка), как и порядок четвертей a, b (по горизонтали), c, d
+    pattern: tp.Dict[tp.Tuple[int, int], Node] = {(y - left, x - top): ON for x, y in live}
+    k = 0
+    while len(pattern) != 1 or k < 3:
+        next_level = {}
+        z = get_zero(k)
+        while pattern:
+            (x, y), _ = next(iter(pattern.items()))
+            x, y = x - (x & 1), y - (y & 1)
+            a = pattern.pop((x, y), z)
+            b = pattern.pop((x + 1, y), z)
+            c = pattern.pop((x, y + 1), z)
+            d = pattern.pop((x + 1, y + 1), z)
+            next_level[x >> 1, y >> 1] = join(a, b, c, d)
+        pattern = next_level
+        k += 1
+    return pattern.popitem()[1], top, left
+
+
+def expand(node: Node, top: int = 0, left: int = 0) -> LiveCells:
+    """
+    Множество живых клеток узла с левым верхним углом в (`top`, `left`).
+    """
+    live: LiveCells = set()
+    stack = [(node, top, left)]
+    while stack:
+        node, x, y = stack.pop()
+        if node.n == 0:
+            continue
+        if node.k == 0:
+            live.add((x, y))
+            continue
+        half = 1 << (node.k - 1)
+        stack.append((node.a, x, y))
+        stack.append((node.b, x, y + half))
+        stack.append((node.c, x + half, y))
+        stack.append((node.d, x + half, y + half))
+    return live
+
+
+def advance(node: Node, top: int, left: int, n: int, rule: bytes = LIFE_RULE) -> tp.Tuple[Node, int, int]:
+    """
+    Продвинуть узел на `n` поколений прыжками по 2**j.
+
+    Возвращает новый узел и координаты его левого верхнего угла.
+    """
+    j = 0
+    while n:
+        if n & 1:
+            # узор должен занимать центральную четверть узла, а прыжок 2**j —
+            # не превышать восьмой части его стороны, иначе узор выйдет за
+            # пределы центральной половины, которую возвращает `successor`
+            while node.k < j + 3 or not _is_padded(node):
+                shift = 1 << (node.k - 1)
+                node, top, left = centre(node), top - shift, left - shift
+            quarter = 1 << (node.k - 2)
+            node, top, left = successor(node, j, rule), top + quarter, left + quarter
+        n >>= 1
+        j += 1
+    return node, top, left
+
+
+class HashLifeGameOfLife(SparseGameOfLife):
+    """
+    Игра «Жизнь» на бесконечной плоскости с перемоткой алгоритмом HashLife.
+
+    Поле представляется мемоизированным квадродеревом, и `advance(n)`
+    прыгает на 2**j поколений за раз, поэтому периодические узоры и
+    планеры доходят до поколения 10**6 за секунды. В отличие от остальных
+    способов хранения, клетки за пределами `rows` x `cols` не умирают:
+    размер поля задает только окно для `curr_generation` и `save`.
+    """
+
+    bounded = False
+
+    def advance(self, n: int) -> None:
+        """
+        Продвинуть игру на `n` поколений, не превышая `max_generations`.
+
+        Первые n - 1 поколений проходятся прыжками HashLife, последнее —
+        обычным шагом, чтобы `prev_generation` и `is_changing` относились
+        к предыдущему поколению, как после `step`.
+        """
+        n = int(min(n, self.max_generations - self.generations))
+        if n <= 0:
+            return
+        if n > 1:
+            node, top, left = advance(*construct(self.live), n - 1, self.rule_table)
+            self.live = expand(node, top, left)
+            self.generations += n - 1
+        self.step()
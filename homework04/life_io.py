@@ -0,0 +1,295 @@
+import array
+import itertools
+import os
+import pathlib
+import re
+import struct
+import typing as tp
+
+import numpy as np
+
+from life import GameOfLife, create_game
+from life_bitpacked import WORD_BITS, BitPackedGameOfLife, live_cells, pack_rows, unpack_rows
+from life_sparse import SparseGameOfLife
+
+Board = np.ndarray
+
+# Заголовок снимка: сигнатура, число строк, число столбцов, число кадров
+SNAPSHOT_MAGIC = b"LIFEBIT1"
+_HEADER = struct.Struct("<8sQQQ")
+_COUNT_OFFSET = 24
+
+# Длина строки в RLE-файле по соглашению формата
+RLE_LINE_LENGTH = 70
+
+_RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?")
+
+
+def read_rle(filename: pathlib.Path) -> tp.Tuple[tp.Tuple[int, int], str, Board, Board]:
+    """
+    Прочитать узор в формате RLE.
+
+    Возвращает размер (строки, столбцы), правило и координаты живых клеток
+    (строки, столбцы). Файл разбирается построчно, координаты копятся в
+    компактных массивах, а не в списках кортежей.
+    """
+    xs, ys = array.array("q"), array.array("q")
+    size = None
+    rule = "B3/S23"
+    x = y = 0
+    count = ""
+    with open(filename, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if size is None:
+                match = _RLE_HEADER.match(line)
+                if match is None:
+                    raise ValueError(f"Invalid RLE header: {line!r}")
+                size = int(match.group(2)), int(match.group(1))
+                rule = match.group(3) or rule
+                continue
+            for ch in line:
+                if ch.isdigit():
+                    count += ch
+                    continue
+                run = int(count) if count else 1
+                count = ""
+                if ch == "!":
+                    return size, rule, np.frombuffer(xs, dtype=np.int64), np.frombuffer(ys, dtype=np.int64)
+                if ch == "$":
+                    x, y = x + run, 0
+                elif ch == "b" or ch == ".":
+                    y += run
+                elif ch.isalpha():
+                    # многоцветные варианты формата: любая буква, кроме b, — живая клетка
+                    xs.extend(itertools.repeat(x, run))
+                    ys.extend(range(y, y + run))
+                    y += run
+                else:
+                    raise ValueError(f"Unexpected character {ch!r} in RLE data")
+    if size is None:
+        raise ValueError("RLE header not found")
+    return size, rule, np.frombuffer(xs, dtype=np.int64), np.frombuffer(ys, dtype=np.int64)
+
+
+def _rows(game: GameOfLife) -> tp.Iterator[tp.Sequence[int]]:
+    # строки текущего поколения по одной, без распаковки всего поля
+    if isinstance(game, BitPackedGameOfLife):
+        for x in range(game.rows):
+            yield unpack_rows(game.board[x : x + 1], game.cols)[0]
+    elif isinstance(game, SparseGameOfLife):
+        by_row: tp.Dict[int, tp.List[int]] = {}
+        for x, y in game.live:
+            if 0 <= x < game.rows and 0 <= y < game.cols:
+                by_row.setdefault(x, []).append(y)
+        for x in range(game.rows):
+            row = [0] * game.cols
+            for y in by_row.get(x, ()):
+                row[y] = 1
+            yield row
+    else:
+        yield from game.curr_generation
+
+
+def write_rle(game: GameOfLife, filename: pathlib.Path) -> None:
+    """
+    Сохранить текущее поколение в формате RLE.
+
+    Мертвые клетки в конце строки и пустые строки в конце поля опускаются,
+    подряд идущие пустые строки записываются одним счетчиком перед `$`.
+    """
+    tokens: tp.List[str] = []
+    empty_rows = 0
+    for row in _rows(game):
+        runs = [(int(value), len(list(group))) for value, group in itertools.groupby(row)]
+        if runs and runs[-1][0] == 0:
+            runs.pop()
+        if not runs:
+            empty_rows += 1
+            continue
+        if tokens:
+            tokens.append(f"{empty_rows + 1 if empty_rows else ''}$")
+        elif empty_rows:
+            tokens.append(f"{empty_rows}$")
+        empty_rows = 0
+        tokens.extend(f"{length if length > 1 else ''}{'o' if value else 'b'}" for value, length in runs)
+    tokens.append("!")
+    with open(filename, "w") as file:
+        file.write(f"x = {game.cols}, y = {game.rows}, rule = {game.rule}\n")
+        line = ""
+        for token in tokens:
+            if len(line) + len(token) > RLE_LINE_LENGTH:
+                file.write(line + "\n")
+                line = ""
+            line += token
+        file.write(line + "\n")
+
+
+def pack_cells(rows: int, cols: int, xs: Board, ys: Board) -> Board:
+    """
+    Упакованное поле `rows` x `cols` с живыми клетками (`xs`, `ys`).
+
+    Клетки за пределами поля отбрасываются.
+    """
+    inside = (xs >= 0) & (xs < rows) & (ys >= 0) & (ys < cols)
+    xs, ys = xs[inside], ys[inside]
+    board = np.zeros((rows, (cols + WORD_BITS - 1) // WORD_BITS), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (ys % WORD_BITS).astype(np.uint64))
+    np.bitwise_or.at(board, (xs, ys // WORD_BITS), bits)
+    return board
+
+
+def set_live_cells(game: GameOfLife, xs: Board, ys: Board) -> None:
+    """
+    Сделать текущим и предыдущим поколением поле с живыми клетками (`xs`, `ys`).
+
+    Для упакованного и разреженного полей плотная матрица не создается.
+    """
+    inside = (xs >= 0) & (xs < game.rows) & (ys >= 0) & (ys < game.cols)
+    xs, ys = xs[inside], ys[inside]
+    if isinstance(game, BitPackedGameOfLife):
+        board = pack_cells(game.rows, game.cols, xs, ys)
+        game.board, game.prev_board = board, board.copy()
+    elif isinstance(game, SparseGameOfLife):
+        game.live = set(zip(xs.tolist(), ys.tolist()))
+        game.prev_live = set(game.live)
+    else:
+        grid = np.zeros((game.rows, game.cols), dtype=np.uint8)
+        grid[xs, ys] = 1
+        cells = grid if isinstance(game.curr_generation, np.ndarray) else grid.tolist()
+        game.curr_generation = cells
+        game.prev_generation = cells
+    game.forget_history()
+
+
+def load_rle(
+    filename: pathlib.Path, backend: str = "list", max_generations: tp.Optional[float] = float("inf")
+) -> GameOfLife:
+    """
+    Создать игру с узором и правилом из RLE-файла (см. `life.BACKENDS`).
+    """
+    size, rule, xs, ys = read_rle(filename)
+    game = create_game(size, randomize=False, max_generations=max_generations, backend=backend, rule=rule)
+    set_live_cells(game, xs, ys)
+    return game
+
+
+def _packed(game: GameOfLife) -> Board:
+    # текущее поколение в упакованном виде (см. life_bitpacked)
+    if isinstance(game, BitPackedGameOfLife):
+        return game.board
+    if isinstance(game, SparseGameOfLife):
+        cells = np.array(sorted(game.live), dtype=np.int64).reshape(-1, 2)
+        return pack_cells(game.rows, game.cols, cells[:, 0], cells[:, 1])
+    return pack_rows(np.asarray(game.curr_generation, dtype=np.uint8), game.cols)
+
+
+def frame_dtype(rows: int, cols: int) -> np.dtype:
+    """
+    Тип кадра снимка: номер поколения и поле, упакованное по 64 клетки в слово.
+    """
+    words = (cols + WORD_BITS - 1) // WORD_BITS
+    return np.dtype([("generation", "<u8"), ("board", "<u8", (rows, words))])
+
+
+def _read_header(file: tp.BinaryIO) -> tp.Tuple[int, int, int]:
+    magic, rows, cols, count = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a Game of Life snapshot file")
+    return rows, cols, count
+
+
+def _write_frame(file: tp.BinaryIO, game: GameOfLife) -> None:
+    file.write(struct.pack("<Q", game.generations))
+    np.ascontiguousarray(_packed(game), dtype="<u8").tofile(file)
+
+
+def save_snapshot(game: GameOfLife, filename: pathlib.Path) -> None:
+    """
+    Записать текущее поколение в новый двоичный снимок.
+
+    Снимок — заголовок (сигнатура, строки, столбцы, число кадров) и кадры
+    одинакового размера, поэтому файл отображается в память целиком
+    (см. `open_snapshot`), а поле занимает бит на клетку.
+    """
+    with open(filename, "wb") as file:
+        file.write(_HEADER.pack(SNAPSHOT_MAGIC, game.rows, game.cols, 1))
+        _write_frame(file, game)
+
+
+def append_snapshot(game: GameOfLife, filename: pathlib.Path) -> int:
+    """
+    Дописать текущее поколение в конец снимка для последующего воспроизведения.
+
+    Если файла нет, он создается. Возвращает число кадров в файле.
+    """
+    if not os.path.exists(filename):
+        save_snapshot(game, filename)
+        return 1
+    with open(filename, "r+b") as file:
+        rows, cols, count = _read_header(file)
+        if (rows, cols) != (game.rows, game.cols):
+            raise ValueError(f"Snapshot is {rows}x{cols}, game is {game.rows}x{game.cols}")
+        # кадр, дописанный до сбоя, но не учтенный в заголовке, перезаписывается
+        file.seek(_HEADER.size + count * frame_dtype(rows, cols).itemsize)
+        _write_frame(file, game)
+        file.truncate()
+        file.seek(_COUNT_OFFSET)
+        file.write(struct.pack("<Q", count + 1))
+    return count + 1
+
+
+def open_snapshot(filename: pathlib.Path, mode: str = "r") -> np.memmap:
+    """
+    Отобразить кадры снимка в память.
+
+    Возвращает массив записей с полями `generation` и `board` длиной в
+    число кадров; кадры читаются с диска только при обращении к ним.
+    """
+    with open(filename, "rb") as file:
+        rows, cols, count = _read_header(file)
+    return np.memmap(filename, dtype=frame_dtype(rows, cols), mode=mode, offset=_HEADER.size, shape=(count,))
+
+
+def iter_snapshots(filename: pathlib.Path) -> tp.Iterator[tp.Tuple[int, Board]]:
+    """
+    Читать кадры снимка по одному: (номер поколения, упакованное поле).
+    """
+    with open(filename, "rb") as file:
+        rows, cols, count = _read_header(file)
+        dtype = frame_dtype(rows, cols)
+        for _ in range(count):
+            frame = np.fromfile(file, dtype=dtype, count=1)[0]
+            yield int(frame["generation"]), frame["board"].astype(np.uint64)
+
+
+def set_packed(game: GameOfLife, board: Board) -> None:
+    """
+    Сделать текущим и предыдущим поколением упакованное поле `board`.
+    """
+    if isinstance(game, BitPackedGameOfLife):
+        game.board = np.array(board, dtype=np.uint64)
+        game.prev_board = game.board.copy()
+        game.forget_history()
+    else:
+        set_live_cells(game, *live_cells(np.asarray(board, dtype=np.uint64)))
+
+
+def load_snapshot(
+    filename: pathlib.Path,
+    index: int = -1,
+    backend: str = "bitpacked",
+    max_generations: tp.Optional[float] = float("inf"),
+) -> GameOfLife:
+    """
+    Создать игру из кадра `index` снимка (по умолчанию — последнего).
+    """
+    with open(filename, "rb") as file:
+        rows, cols, _ = _read_header(file)
+    frame = open_snapshot(filename)[index]
+    game = create_game((rows, cols), randomize=False, max_generations=max_generations, backend=backend)
+    set_packed(game, frame["board"])
+    game.generations = int(frame["generation"])
+    return game
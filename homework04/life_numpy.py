@@ -0,0 +1,121 @@
+import pathlib
+import typing as tp
+
+import numpy as np
+
+from life import LIFE_RULE, GameOfLife, parse_row
+
+Board = np.ndarray
+
+
+class NumpyGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь», в которой поле хранится как массив NumPy типа uint8.
+
+    Число соседей считается суммой восьми сдвинутых срезов поля с рамкой
+    из нулей, поэтому шаг не содержит циклов Python по клеткам.
+    `curr_generation` и `prev_generation` — двумерные массивы: они
+    индексируются так же, как списки списков (`grid[i][j]`).
+    """
+
+    @property  # type: ignore[override]
+    def curr_generation(self) -> Board:
+        return self._curr
+
+    @curr_generation.setter
+    def curr_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self._curr = np.array(grid, dtype=np.uint8, ndmin=2)
+
+    @property  # type: ignore[override]
+    def prev_generation(self) -> Board:
+        return self._prev
+
+    @prev_generation.setter
+    def prev_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self._prev = np.array(grid, dtype=np.uint8, ndmin=2)
+
+    def create_grid(self, randomize: bool = False) -> Board:  # type: ignore[override]
+        """
+        Создание поля размером `rows` x `cols`.
+
+        Если `randomize` истинно, каждая клетка равновероятно живая или мертвая.
+        """
+        if randomize:
+            return np.random.randint(0, 2, size=(self.rows, self.cols), dtype=np.uint8)
+        return np.zeros((self.rows, self.cols), dtype=np.uint8)
+
+    def count_neighbours(self) -> Board:
+        """
+        Получить число живых соседей для всех клеток сразу.
+        """
+        padded = np.pad(self._curr, 1, mode="wrap" if self.toroidal else "constant")
+        counts = np.zeros(self._curr.shape, dtype=np.uint8)
+        rows, cols = self._curr.shape
+        for dx in (0, 1, 2):
+            for dy in (0, 1, 2):
+                if dx == 1 and dy == 1:
+                    continue
+                counts += padded[dx:dx + rows, dy:dy + cols]
+        return counts
+
+    def get_next_generation(self) -> Board:  # type: ignore[override]
+        """
+        Получить следующее поколение клеток.
+        """
+        counts = self.count_neighbours()
+        if self.rule_table == LIFE_RULE:
+            alive = (counts == 3) | ((self._curr == 1) & (counts == 2))
+            return alive.view(np.uint8)
+        # индекс в таблице правила: живая * 9 + число соседей
+        counts += self._curr * np.uint8(9)
+        return np.frombuffer(self.rule_table, dtype=np.uint8)[counts]
+
+    def step(self) -> None:
+        if not self.is_max_generations_exceeded:
+            # сеттеры копируют массив, а здесь достаточно поменять ссылки
+            self._prev = self._curr
+            self._curr = self.get_next_generation()
+            self.generations += 1
+            self.record_generation()
+
+    def _generation_keys(self) -> tp.Tuple[Board, Board]:
+        return self._prev, self._curr
+
+    def generation_hash(self, previous: bool = False) -> int:
+        """
+        Хэш текущего (или предыдущего) поколения.
+
+        Хэшируется поле, упакованное по биту на клетку: это дешевле, чем
+        искать изменившиеся клетки, поэтому хэш не обновляется по разнице
+        поколений и не совпадает с хэшами списков и разреженных полей.
+        """
+        return hash(np.packbits(self._prev if previous else self._curr).tobytes())
+
+    def _update_hash(self, h: int) -> int:
+        return self.generation_hash()
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return not np.array_equal(self._curr, self._prev)
+
+    @classmethod
+    def from_file(cls, filename: pathlib.Path) -> "NumpyGameOfLife":
+        """
+        Прочитать состояние клеток из указанного файла.
+        """
+        with open(filename, "r") as file:
+            rows = [np.array(parse_row(line), dtype=np.uint8) for line in file if line.strip()]
+        grid = np.vstack(rows) if rows else np.zeros((0, 0), dtype=np.uint8)
+        game = cls(size=grid.shape, randomize=False)
+        game.curr_generation = grid
+        game.prev_generation = grid
+        return game
+
+    def save(self, filename: pathlib.Path) -> None:
+        """
+        Сохранить текущее состояние клеток в указанный файл.
+        """
+        np.savetxt(filename, self._curr, fmt="%d", delimiter=" ")
@@ -0,0 +1,209 @@
+import argparse
+import multiprocessing
+import time
+import typing as tp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from life import LIFE, LIFE_RULE
+from life_numpy import Board, NumpyGameOfLife
+
+# Буферы поколений в разделяемой памяти, открытые в процессе-работнике
+_buffers: tp.List[Board] = []
+_segments: tp.List[shared_memory.SharedMemory] = []
+
+
+def _attach(names: tp.List[str], shape: tp.Tuple[int, int]) -> None:
+    for name in names:
+        segment = shared_memory.SharedMemory(name=name)
+        _segments.append(segment)
+        _buffers.append(np.ndarray(shape, dtype=np.uint8, buffer=segment.buf))
+
+
+def _step_strip(task: tp.Tuple[int, int, int, bytes]) -> None:
+    src, start, stop, rule = task
+    _step_rows(_buffers[src], _buffers[1 - src], start, stop, rule)
+
+
+def _wrap_border(buffer: Board) -> None:
+    # рамка тороидального поля — копия противоположных краев
+    buffer[0, 1:-1] = buffer[-2, 1:-1]
+    buffer[-1, 1:-1] = buffer[1, 1:-1]
+    buffer[:, 0] = buffer[:, -2]
+    buffer[:, -1] = buffer[:, 1]
+
+
+def _step_rows(src: Board, dst: Board, start: int, stop: int, rule: bytes = LIFE_RULE) -> None:
+    """
+    Посчитать строки `start`..`stop - 1` следующего поколения.
+
+    Буферы имеют рамку из нулевых клеток шириной 1, поэтому строки соседних
+    полос (halo) читаются прямо из общего буфера, без копирования.
+    """
+    cols = src.shape[1] - 2
+    counts = np.zeros((stop - start, cols), dtype=np.uint8)
+    for dx in (-1, 0, 1):
+        for dy in (0, 1, 2):
+            if dx == 0 and dy == 1:
+                continue
+            counts += src[start + dx : stop + dx, dy : dy + cols]
+    alive = src[start:stop, 1 : cols + 1]
+    if rule == LIFE_RULE:
+        dst[start:stop, 1 : cols + 1] = (counts == 3) | ((alive == 1) & (counts == 2))
+    else:
+        counts += alive * np.uint8(9)
+        dst[start:stop, 1 : cols + 1] = np.frombuffer(rule, dtype=np.uint8)[counts]
+
+
+class ParallelGameOfLife(NumpyGameOfLife):
+    """
+    Игра «Жизнь», шагающая горизонтальными полосами в пуле процессов.
+
+    Два буфера поколений с нулевой рамкой лежат в разделяемой памяти
+    (`multiprocessing.shared_memory`) и меняются ролями каждый шаг, так что
+    новое поле не создается. Каждый процесс считает свою полосу, читая
+    граничные строки соседних полос из того же буфера. После работы нужно
+    вызвать `close` или использовать игру как контекстный менеджер.
+    """
+
+    def __init__(
+        self,
+        size: tp.Tuple[int, int],
+        randomize: bool = True,
+        max_generations: tp.Optional[float] = float("inf"),
+        workers: tp.Optional[int] = None,
+        rule: str = LIFE,
+        toroidal: bool = False,
+    ) -> None:
+        rows, cols = size
+        self.workers = workers or multiprocessing.cpu_count()
+        shape = (rows + 2, cols + 2)
+        nbytes = shape[0] * shape[1]
+        self._segments = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)]
+        self._buffers = [np.ndarray(shape, dtype=np.uint8, buffer=segment.buf) for segment in self._segments]
+        for buffer in self._buffers:
+            buffer[:] = 0
+        self._current = 0
+        bounds = np.linspace(1, rows + 1, min(self.workers, max(rows, 1)) + 1, dtype=int)
+        self._strips = [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if start < stop]
+        self._pool = None
+        if self.workers > 1:
+            names = [segment.name for segment in self._segments]
+            self._pool = multiprocessing.Pool(self.workers, initializer=_attach, initargs=(names, shape))
+        super().__init__(size, randomize=randomize, max_generations=max_generations, rule=rule, toroidal=toroidal)
+
+    @property  # type: ignore[override]
+    def curr_generation(self) -> Board:
+        return self._buffers[self._current][1:-1, 1:-1]
+
+    @curr_generation.setter
+    def curr_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self._buffers[self._current][1:-1, 1:-1] = np.asarray(grid, dtype=np.uint8)
+        # буфер изменен на месте, поэтому хэш поколения надо пересчитать
+        self.forget_history()
+
+    @property  # type: ignore[override]
+    def prev_generation(self) -> Board:
+        return self._buffers[1 - self._current][1:-1, 1:-1]
+
+    @prev_generation.setter
+    def prev_generation(self, grid: tp.Union[Board, tp.List[tp.List[int]]]) -> None:
+        self._buffers[1 - self._current][1:-1, 1:-1] = np.asarray(grid, dtype=np.uint8)
+        self.forget_history()
+
+    def _generation_keys(self) -> tp.Tuple[Board, Board]:
+        return self._buffers[1 - self._current], self._buffers[self._current]
+
+    @property
+    def _curr(self) -> Board:  # type: ignore[override]
+        return self.curr_generation
+
+    @property
+    def _prev(self) -> Board:  # type: ignore[override]
+        return self.prev_generation
+
+    def get_next_generation(self) -> Board:
+        """
+        Получить следующее поколение клеток в виде нового массива.
+
+        `step` не использует этот метод и пишет поколение во второй буфер.
+        """
+        if self.toroidal:
+            _wrap_border(self._buffers[self._current])
+        buffer = np.zeros_like(self._buffers[self._current])
+        _step_rows(self._buffers[self._current], buffer, 1, self.rows + 1, self.rule_table)
+        return buffer[1:-1, 1:-1]
+
+    def step(self) -> None:
+        if self.is_max_generations_exceeded:
+            return
+        src = self._current
+        if self.toroidal:
+            _wrap_border(self._buffers[src])
+        if self._pool is None:
+            for start, stop in self._strips:
+                _step_rows(self._buffers[src], self._buffers[1 - src], start, stop, self.rule_table)
+        else:
+            tasks = [(src, start, stop, self.rule_table) for start, stop in self._strips]
+            self._pool.map(_step_strip, tasks)
+        self._current = 1 - src
+        self.generations += 1
+        self.record_generation()
+
+    def close(self) -> None:
+        """
+        Остановить пул процессов и освободить разделяемую память.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        # массивы ссылаются на память сегментов и должны исчезнуть раньше них
+        self._buffers = [buffer.copy() for buffer in self._buffers]
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+    def __enter__(self) -> "ParallelGameOfLife":
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        self.close()
+
+
+def benchmark(
+    size: int, generations: int, workers: tp.Iterable[int]
+) -> tp.List[tp.Tuple[int, float, float]]:
+    """
+    Замерить время шага на поле `size` x `size` для разного числа процессов.
+
+    Возвращает список (процессы, секунд на поколение, ускорение относительно
+    первого замера).
+    """
+    results = []
+    np.random.seed(0)
+    start_grid = np.random.randint(0, 2, size=(size, size), dtype=np.uint8)
+    for count in workers:
+        with ParallelGameOfLife((size, size), randomize=False, workers=count) as game:
+            game.curr_generation = start_grid
+            game.step()
+            start = time.perf_counter()
+            for _ in range(generations):
+                game.step()
+            elapsed = (time.perf_counter() - start) / generations
+        baseline = results[0][1] if results else elapsed
+        results.append((count, elapsed, baseline / elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Масштабирование многопроцессного шага игры «Жизнь».")
+    parser.add_argument("--size", type=int, default=4000)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--max-workers", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+    print(f"{'workers':>8} {'s/gen':>10} {'speedup':>8}")
+    for count, seconds, speedup in benchmark(args.size, args.generations, range(1, args.max_workers + 1)):
+        print(f"{count:>8} {seconds:>10.4f} {speedup:>8.2f}")
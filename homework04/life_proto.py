@@ -1,15 +1,51 @@
+import functools
 import random
 import typing as tp
+import numpy as np
 import pygame
+from life import LIFE, parse_rule
 from pygame.locals import *
 
 Cell = tp.Tuple[int, int]
 Cells = tp.List[int]
 Grid = tp.List[Cells]
+NeighbourTable = tp.Tuple[tp.Tuple[int, ...], ...]
+
+@functools.lru_cache(maxsize=16)
+def neighbour_table(rows: int, cols: int, toroidal: bool = False) -> NeighbourTable:
+    """
+    Индексы соседей каждой клетки поля, развернутого построчно в один массив.
+
+    На тороидальном поле края склеены, иначе у клеток края соседей меньше
+    восьми. Таблица строится один раз для каждого размера поля.
+    """
+    table = []
+    for x in range(rows):
+        for y in range(cols):
+            neighbours = []
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if dx == 0 and dy == 0:
+                        continue
+                    nx, ny = x + dx, y + dy
+                    if toroidal:
+                        neighbours.append(nx % rows * cols + ny % cols)
+                    elif 0 <= nx < rows and 0 <= ny < cols:
+                        neighbours.append(nx * cols + ny)
+            table.append(tuple(neighbours))
+    return tuple(table)
+
 
 class GameOfLife:
     def __init__(
-        self, width: int = 640, height: int = 480, cell_size: int = 10, speed: int = 10
+        self,
+        width: int = 640,
+        height: int = 480,
+        cell_size: int = 10,
+        speed: int = 10,
+        render: str = "rects",
+        toroidal: bool = False,
+        rule: str = LIFE,
     ) -> None:
         self.width = width
         self.height = height
@@ -27,9 +63,51 @@ class GameOfLife:
         # Скорость протекания игры
         self.speed = speed
 
+        # Способ отрисовки: "rects" — прямоугольник на клетку,
+        # "surfarray" — поле целиком через поверхность с пикселем на клетку
+        self.render = render
+        self.cells = pygame.Surface((self.cell_width, self.cell_height), depth=8)
+        self.cells.set_palette([(0, 0, 0), (0, 255, 0)] + [(0, 0, 0)] * 254)
+        self.scaled = pygame.Surface(self.screen_size, depth=8)
+        self.scaled.set_palette(self.cells.get_palette())
+
+        # Два построчных буфера клеток: текущее поколение и место для следующего
+        self.toroidal = toroidal
+        # следующее состояние клетки по индексу `живая * 9 + число соседей`
+        self.rule_table = parse_rule(rule)
+        self._table = neighbour_table(self.cell_height, self.cell_width, toroidal)
+        self._front = bytearray(self.cell_height * self.cell_width)
+        self._back = bytearray(self.cell_height * self.cell_width)
+
         # Инициализация сетки клеток
         self.grid = self.create_grid(randomize=True)
-    
+
+    @property
+    def grid(self) -> Grid:
+        """
+        Снимок текущего поколения в виде списка строк.
+
+        Снимок не связан с полем: `game.grid[i][j] = 1` ничего не меняет.
+        Клетку меняет `set_cell`, поле целиком — присваивание `game.grid`.
+        """
+        cols = self.cell_width
+        return [list(self._front[i : i + cols]) for i in range(0, len(self._front), cols)]
+
+    @grid.setter
+    def grid(self, grid: Grid) -> None:
+        if len(grid) != self.cell_height or any(len(row) != self.cell_width for row in grid):
+            raise ValueError(f"Grid must be {self.cell_height}x{self.cell_width} cells")
+        self._front[:] = bytes(value for row in grid for value in row)
+
+    def set_cell(self, cell: Cell, value: int) -> None:
+        """
+        Сделать клетку `cell` живой (1) или мертвой (0).
+        """
+        x, y = cell
+        if not (0 <= x < self.cell_height and 0 <= y < self.cell_width):
+            raise IndexError(f"Cell {cell} is outside the {self.cell_height}x{self.cell_width} grid")
+        self._front[x * self.cell_width + y] = value
+
     def create_grid(self, randomize: bool = False) -> Grid:
         """
         Создание списка клеток.
@@ -43,9 +121,15 @@ class GameOfLife:
         """
         Отрисовка списка клеток с закрашиванием их в соответствующие цвета.
         """
+        if self.render == "surfarray":
+            grid = np.frombuffer(self._front, dtype=np.uint8).reshape(self.cell_height, self.cell_width)
+            pygame.surfarray.blit_array(self.cells, grid.T)
+            pygame.transform.scale(self.cells, self.screen_size, self.scaled)
+            self.screen.blit(self.scaled, (0, 0))
+            return
         for i in range(self.cell_height):
             for j in range(self.cell_width):
-                color = (0, 255, 0) if self.grid[i][j] == 1 else (0, 0, 0)
+                color = (0, 255, 0) if self._front[i * self.cell_width + j] == 1 else (0, 0, 0)
                 pygame.draw.rect(
                     self.screen,
                     color,
@@ -57,29 +141,31 @@ class GameOfLife:
         Вернуть список соседних клеток для клетки `cell`.
         """
         x, y = cell
-        neighbours = []
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.cell_height and 0 <= ny < self.cell_width:
-                    neighbours.append(self.grid[nx][ny])
-        return neighbours
+        return [self._front[i] for i in self._table[x * self.cell_width + y]]
+
+    def _compute_next(self) -> None:
+        # следующее поколение пишется в `_back`; цикл не создает объектов
+        src, dst, rule = self._front, self._back, self.rule_table
+        for i, neighbours in enumerate(self._table):
+            count = 0
+            for j in neighbours:
+                count += src[j]
+            dst[i] = rule[src[i] * 9 + count]
 
     def get_next_generation(self) -> Grid:
         """
         Получить следующее поколение клеток.
         """
-        next_gen = [[0] * self.cell_width for _ in range(self.cell_height)]
-        for i in range(self.cell_height):
-            for j in range(self.cell_width):
-                alive_neighbors = sum(self.get_neighbours((i, j)))
-                if self.grid[i][j] == 1:
-                    next_gen[i][j] = 1 if alive_neighbors in (2, 3) else 0
-                else:
-                    next_gen[i][j] = 1 if alive_neighbors == 3 else 0
-        return next_gen
+        self._compute_next()
+        cols = self.cell_width
+        return [list(self._back[i : i + cols]) for i in range(0, len(self._back), cols)]
+
+    def step(self) -> None:
+        """
+        Перейти к следующему поколению, поменяв буферы местами.
+        """
+        self._compute_next()
+        self._front, self._back = self._back, self._front
 
     def draw_lines(self) -> None:
         """ Отрисовать сетку """
@@ -102,7 +188,7 @@ class GameOfLife:
                     running = False
                 elif event.type == KEYDOWN:
                     if event.key == K_SPACE:
-                        self.grid = self.get_next_generation()
+                        self.step()
 
             self.screen.fill(pygame.Color("white"))
             self.draw_grid()
@@ -0,0 +1,207 @@
+import collections
+import pathlib
+import random
+import typing as tp
+
+from life import LIFE, LIFE_RULE, Cell, Cells, GameOfLife, Grid, cell_key, parse_row
+
+LiveCells = tp.Set[Cell]
+
+_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class SparseGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь», хранящая только координаты живых клеток.
+
+    Шаг перебирает живые клетки и их окрестности, поэтому его стоимость
+    зависит от числа живых клеток, а не от площади поля: на поле
+    10**9 x 10**9 планер шагает так же быстро, как на поле 5 x 5.
+    Поколения хранятся в `live` и `prev_live`; `curr_generation` и
+    `prev_generation` строят плотную матрицу всего поля, а для больших
+    полей нужно использовать `window`.
+    """
+
+    # Клетки за пределами поля всегда мертвые; подклассы с бесконечной
+    # плоскостью (см. life_hashlife) выключают это ограничение.
+    bounded = True
+
+    def __init__(
+        self,
+        size: tp.Tuple[int, int],
+        randomize: bool = True,
+        max_generations: tp.Optional[float] = float("inf"),
+        rule: str = LIFE,
+        toroidal: bool = False,
+    ) -> None:
+        self.rows, self.cols = size
+        self.rule = rule
+        if self.rule_table[0]:
+            raise ValueError("Rules with B0 turn on every empty cell and need a dense board")
+        if toroidal and not self.bounded:
+            raise ValueError(f"{type(self).__name__} has no edges to wrap around")
+        self.toroidal = toroidal
+        self.prev_live = self.create_grid()
+        self.live = self.create_grid(randomize=randomize)
+        self.max_generations = max_generations
+        self.generations = 1
+
+    @property  # type: ignore[override]
+    def curr_generation(self) -> Grid:
+        return self._to_grid(self.live, 0, 0, self.rows, self.cols)
+
+    @curr_generation.setter
+    def curr_generation(self, grid: Grid) -> None:
+        self.live = self._from_grid(grid)
+
+    @property  # type: ignore[override]
+    def prev_generation(self) -> Grid:
+        return self._to_grid(self.prev_live, 0, 0, self.rows, self.cols)
+
+    @prev_generation.setter
+    def prev_generation(self, grid: Grid) -> None:
+        self.prev_live = self._from_grid(grid)
+
+    @staticmethod
+    def _from_grid(grid: Grid) -> LiveCells:
+        return {(x, y) for x, row in enumerate(grid) for y, value in enumerate(row) if value}
+
+    @staticmethod
+    def _to_grid(live: LiveCells, top: int, left: int, height: int, width: int) -> Grid:
+        grid = [[0] * width for _ in range(height)]
+        if height * width < len(live):
+            cells: tp.Iterable[Cell] = (
+                (x, y) for x in range(top, top + height) for y in range(left, left + width) if (x, y) in live
+            )
+        else:
+            cells = live
+        for x, y in cells:
+            if top <= x < top + height and left <= y < left + width:
+                grid[x - top][y - left] = 1
+        return grid
+
+    def create_grid(self, randomize: bool = False) -> LiveCells:  # type: ignore[override]
+        """
+        Создание множества живых клеток.
+
+        Если `randomize` истинно, каждая клетка поля равновероятно живая
+        или мертвая; это перебирает все поле и годится только для небольших полей.
+        """
+        if not randomize:
+            return set()
+        return {(x, y) for x in range(self.rows) for y in range(self.cols) if random.randint(0, 1)}
+
+    @property
+    def population(self) -> int:
+        """
+        Число живых клеток.
+        """
+        return len(self.live)
+
+    def window(self, top: int, left: int, height: int, width: int) -> Grid:
+        """
+        Плотная матрица клеток прямоугольника `height` x `width` с углом в (`top`, `left`).
+
+        Используется интерфейсами для отрисовки видимой части большого поля.
+        """
+        return self._to_grid(self.live, top, left, height, width)
+
+    def get_neighbours(self, cell: Cell) -> Cells:
+        """
+        Получить соседей для данной клетки.
+        """
+        x, y = cell
+        if self.toroidal:
+            return [1 if ((x + dx) % self.rows, (y + dy) % self.cols) in self.live else 0 for dx, dy in _OFFSETS]
+        return [
+            1 if (x + dx, y + dy) in self.live else 0
+            for dx, dy in _OFFSETS
+            if not self.bounded or 0 <= x + dx < self.rows and 0 <= y + dy < self.cols
+        ]
+
+    def get_next_generation(self) -> LiveCells:  # type: ignore[override]
+        """
+        Получить следующее поколение живых клеток.
+        """
+        rows, cols, live, rule = self.rows, self.cols, self.live, self.rule_table
+        if self.toroidal:
+            counts: tp.Counter[Cell] = collections.Counter(
+                ((x + dx) % rows, (y + dy) % cols) for x, y in live for dx, dy in _OFFSETS
+            )
+        else:
+            counts = collections.Counter((x + dx, y + dy) for x, y in live for dx, dy in _OFFSETS)
+        if rule == LIFE_RULE:
+            born = {cell for cell, count in counts.items() if count == 3 or count == 2 and cell in live}
+        else:
+            born = {cell for cell, count in counts.items() if rule[(cell in live) * 9 + count]}
+            if rule[9]:
+                # клетки без соседей не попадают в счетчик, но по правилу S0 выживают
+                born |= live - counts.keys()
+        if not self.bounded or self.toroidal:
+            return born
+        return {(x, y) for x, y in born if 0 <= x < rows and 0 <= y < cols}
+
+    def step(self) -> None:
+        if not self.is_max_generations_exceeded:
+            self.prev_live = self.live
+            self.live = self.get_next_generation()
+            self.generations += 1
+            self.record_generation()
+
+    def _generation_keys(self) -> tp.Tuple[LiveCells, LiveCells]:
+        return self.prev_live, self.live
+
+    def generation_hash(self, previous: bool = False) -> int:
+        """
+        Хэш текущего (или предыдущего) поколения, посчитанный по всем клеткам.
+        """
+        h = 0
+        for cell in self.prev_live if previous else self.live:
+            h ^= cell_key(cell)
+        return h
+
+    def _hash_delta(self) -> int:
+        h = 0
+        for cell in self.prev_live ^ self.live:
+            h ^= cell_key(cell)
+        return h
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return self.live != self.prev_live
+
+    @classmethod
+    def from_file(cls, filename: pathlib.Path) -> "SparseGameOfLife":
+        """
+        Прочитать состояние клеток из указанного файла.
+
+        Файл читается построчно, запоминаются только живые клетки.
+        """
+        live = set()
+        rows = cols = 0
+        with open(filename, "r") as file:
+            for x, line in enumerate(line for line in file if line.strip()):
+                values = parse_row(line)
+                live.update((x, y) for y, value in enumerate(values) if value)
+                rows, cols = x + 1, len(values)
+        game = cls(size=(rows, cols), randomize=False)
+        game.live = live
+        game.prev_live = set(live)
+        return game
+
+    def save(self, filename: pathlib.Path) -> None:
+        """
+        Сохранить текущее состояние клеток в указанный файл.
+        """
+        by_row: tp.Dict[int, tp.List[int]] = collections.defaultdict(list)
+        for x, y in self.live:
+            by_row[x].append(y)
+        with open(filename, "w") as file:
+            for x in range(self.rows):
+                row = [0] * self.cols
+                for y in by_row.get(x, ()):
+                    row[y] = 1
+                file.write(" ".join(map(str, row)) + "\n")
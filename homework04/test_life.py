@@ -1,3 +1,4 @@
+import itertools
 import json
 import os
 import random
@@ -137,3 +138,149 @@ class TestGameOfLife(unittest.TestCase):
         for _ in range(self.max_generations + 1):
             game.step()
         self.assertFalse(game.is_changing)
+
+    def test_create_game_with_backend(self):
+        for backend in life.BACKENDS:
+            with self.subTest(backend=backend):
+                game = life.create_game((self.rows, self.cols), randomize=False, backend=backend)
+                self.assertIsInstance(game, life.get_backend(backend))
+                game.curr_generation = self.grid
+                game.step()
+                self.assertEqual(self.grid, [list(row) for row in game.prev_generation])
+        self.assertIs(life.GameOfLife, life.get_backend("list"))
+        with self.assertRaises(ValueError):
+            life.create_game((3, 3), backend="unknown")
+
+    def test_advance(self):
+        game = life.GameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        reference = life.GameOfLife((self.rows, self.cols))
+        reference.curr_generation = self.grid
+        game.advance(5)
+        for _ in range(5):
+            reference.step()
+        self.assertEqual(reference.curr_generation, game.curr_generation)
+        self.assertEqual(reference.prev_generation, game.prev_generation)
+        self.assertEqual(6, game.generations)
+
+        game = life.GameOfLife((self.rows, self.cols), max_generations=4)
+        game.advance(100)
+        self.assertEqual(4, game.generations)
+
+    def test_still_life_is_detected(self):
+        game = life.GameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        while game.cycle is None:
+            game.step()
+        onset, period = game.cycle
+        self.assertEqual(1, period)
+        self.assertFalse(game.is_changing)
+        self.assertEqual(game.generations, onset + period)
+
+    def test_oscillator_is_detected(self):
+        blinker = [[0, 0, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 0, 0, 0]]
+        for backend in life.BACKENDS:
+            with self.subTest(backend=backend):
+                game = life.create_game((5, 5), randomize=False, backend=backend)
+                game.curr_generation = blinker
+                game.step()
+                self.assertIsNone(game.cycle)
+                game.step()
+                self.assertEqual((1, 2), game.cycle)
+                self.assertTrue(game.is_cycling)
+                self.assertTrue(game.is_changing)
+
+    def test_generation_hash_is_incremental(self):
+        glider = [[0] * 10 for _ in range(10)]
+        for x, y in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            glider[x][y] = 1
+        for backend in life.BACKENDS:
+            with self.subTest(backend=backend):
+                game = life.create_game((10, 10), randomize=False, backend=backend)
+                game.curr_generation = glider
+                for _ in range(5):
+                    game.step()
+                    self.assertEqual(game.generation_hash(), game._tracked[1])
+
+    def test_generation_hashes_follow_boards(self):
+        # на торе 8x8 глайдер возвращается на место через 32 поколения
+        glider = [[0] * 8 for _ in range(8)]
+        for x, y in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            glider[x][y] = 1
+        reference = life.GameOfLife((8, 8), randomize=False, toroidal=True)
+        reference.curr_generation = glider
+        boards = []
+        for _ in range(40):
+            reference.step()
+            boards.append(reference.curr_generation)
+        for backend in life.BACKENDS:
+            if backend == "hashlife":
+                continue
+            with self.subTest(backend=backend):
+                game = life.create_game((8, 8), randomize=False, backend=backend, toroidal=True)
+                game.curr_generation = glider
+                hashes = []
+                for _ in range(40):
+                    game.step()
+                    hashes.append(game._tracked[1])
+                # хэши совпадают ровно тогда, когда совпадают поля
+                for i, j in itertools.combinations(range(40), 2):
+                    self.assertEqual(boards[i] == boards[j], hashes[i] == hashes[j])
+                self.assertEqual((1, 32), game.cycle)
+
+    def test_history_is_bounded(self):
+        game = life.create_game((10, 10), randomize=False, backend="sparse")
+        game.bounded = False
+        game.history_size = 4
+        game.live = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+        for _ in range(20):
+            game.step()
+        self.assertIsNone(game.cycle)
+        self.assertEqual(4, len(game._history))
+        self.assertEqual(4, len(game._seen))
+
+    def test_parse_rule(self):
+        self.assertEqual(life.LIFE_RULE, life.parse_rule("B3/S23"))
+        self.assertEqual(life.LIFE_RULE, life.parse_rule("23/3"))
+        highlife = life.parse_rule("b36/s23")
+        self.assertEqual([3, 6], [count for count in range(9) if highlife[count]])
+        self.assertEqual([2, 3], [count for count in range(9) if highlife[9 + count]])
+        self.assertEqual(bytes(18), life.parse_rule("B/S"))
+        for rule in ("B9/S23", "B3S23", "life"):
+            with self.assertRaises(ValueError):
+                life.parse_rule(rule)
+
+    def test_rules_and_topology_agree_across_backends(self):
+        random.seed(7)
+        grid = [[random.randint(0, 1) for _ in range(70)] for _ in range(12)]
+        for rule in ("B3/S23", "B36/S23", "B2/S", "B3678/S34678", "B3/S012345678"):
+            for toroidal in (False, True):
+                reference = life.GameOfLife((12, 70), randomize=False, rule=rule, toroidal=toroidal)
+                reference.curr_generation = grid
+                # углы и клетки на границе слов bit-packed
+                cells = [(0, 0), (0, 69), (11, 0), (11, 69), (5, 63), (5, 64)]
+                neighbours = [sorted(reference.get_neighbours(cell)) for cell in cells]
+                for _ in range(4):
+                    reference.step()
+                for backend in ("numpy", "bitpacked", "sparse"):
+                    with self.subTest(rule=rule, toroidal=toroidal, backend=backend):
+                        game = life.create_game((12, 70), randomize=False, backend=backend, rule=rule, toroidal=toroidal)
+                        game.curr_generation = grid
+                        self.assertEqual(neighbours, [sorted(map(int, game.get_neighbours(cell))) for cell in cells])
+                        for _ in range(4):
+                            game.step()
+                        self.assertEqual(reference.curr_generation, [list(map(int, row)) for row in game.curr_generation])
+
+    def test_toroidal_glider_returns(self):
+        game = life.GameOfLife((6, 6), randomize=False, toroidal=True)
+        glider = [[0] * 6 for _ in range(6)]
+        for x, y in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            glider[x][y] = 1
+        game.curr_generation = glider
+        self.assertEqual(8, len(game.get_neighbours((0, 0))))
+        game.advance(24)
+        self.assertEqual(glider, game.curr_generation)
+        with self.assertRaises(ValueError):
+            life.create_game((6, 6), backend="hashlife", toroidal=True)
+        with self.assertRaises(ValueError):
+            life.create_game((6, 6), backend="sparse", rule="B0/S8")
@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import life_bench
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_make_game(self):
+        game = life_bench.make_game("bitpacked", 100, 0.25)
+        density = np.count_nonzero(game.curr_generation) / 100 ** 2
+        self.assertAlmostEqual(0.25, density, delta=0.03)
+        other = life_bench.make_game("sparse", 100, 0.25)
+        self.assertEqual(game.curr_generation.tolist(), other.curr_generation)
+
+    def test_run(self):
+        report = life_bench.run(["list", "numpy", "hashlife", "parallel"], [8, 16], [0.5], generations=2, repeat=1)
+        self.assertEqual(8, len(report["results"]))
+        for result in report["results"]:
+            self.assertGreater(result["cells_per_second"], 0)
+            self.assertGreater(result["peak_memory_bytes"], 0)
+            self.assertGreater(result["phases"]["step"], 0)
+        numpy_result = report["results"][2]
+        self.assertEqual(("numpy", 8), (numpy_result["backend"], numpy_result["size"]))
+        self.assertIsNotNone(numpy_result["phases"]["neighbours"])
+        self.assertIsNotNone(numpy_result["phases"]["rules"])
+        # у списков и многопроцессного способа шаг не делится на фазы
+        for result in (report["results"][0], report["results"][6]):
+            self.assertIsNone(result["phases"]["neighbours"])
+            self.assertIsNone(result["phases"]["rules"])
+
+    def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            life_bench.main(["--backends", "sparse", "--sizes", "8", "--generations", "1", "-o", path])
+            with open(path) as f:
+                report = json.load(f)
+        self.assertEqual(2, len(report["results"]))
+        self.assertIn("numpy", report)
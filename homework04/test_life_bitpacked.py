@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import life_bitpacked
+import life_numpy
+
+
+class TestBitPackedGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+
+    def test_pack_and_unpack_rows(self):
+        cells = np.random.randint(0, 2, size=(5, 130), dtype=np.uint8)
+        packed = life_bitpacked.pack_rows(cells, 130)
+        self.assertEqual((5, 3), packed.shape)
+        self.assertEqual(np.uint64, packed.dtype)
+        self.assertEqual(int(cells[2, 65]), int(packed[2, 1]) >> 1 & 1)
+        self.assertTrue(np.array_equal(cells, life_bitpacked.unpack_rows(packed, 130)))
+
+    def test_create_grid_uses_one_bit_per_cell(self):
+        game = life_bitpacked.BitPackedGameOfLife((100, 1000))
+        self.assertEqual(100 * 16 * 8, game.board.nbytes)
+        self.assertEqual((100, 1000), game.curr_generation.shape)
+        self.assertEqual(0, int(game.board[:, -1].max()) >> (1000 % 64))
+
+    def test_get_neighbours(self):
+        game = life_bitpacked.BitPackedGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        self.assertEqual(4, sum(game.get_neighbours((2, 3))))
+        self.assertEqual(3, len(game.get_neighbours((0, 0))))
+        self.assertEqual(1, sum(game.get_neighbours((5, 7))))
+
+    def test_can_update(self):
+        game = life_bitpacked.BitPackedGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.step()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation.tolist())
+
+    def test_matches_numpy_backend_across_words(self):
+        for cols in (63, 64, 65, 200):
+            with self.subTest(cols=cols):
+                reference = life_numpy.NumpyGameOfLife((30, cols))
+                game = life_bitpacked.BitPackedGameOfLife((30, cols), randomize=False)
+                game.curr_generation = reference.curr_generation
+                for _ in range(15):
+                    reference.step()
+                    game.step()
+                    self.assertTrue(np.array_equal(reference.curr_generation, game.curr_generation))
+
+    def test_is_changing(self):
+        game = life_bitpacked.BitPackedGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertTrue(game.is_changing)
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_save_and_load(self):
+        game = life_bitpacked.BitPackedGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grid.txt")
+            game.save(path)
+            loaded = life_bitpacked.BitPackedGameOfLife.from_file(path)
+            self.assertEqual(self.grid, loaded.curr_generation.tolist())
+            self.assertFalse(loaded.is_changing)
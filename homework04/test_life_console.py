@@ -0,0 +1,69 @@
+import curses
+import unittest
+
+import life
+import life_console
+
+
+class FakeScreen:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.writes = []
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def addch(self, y, x, ch):
+        self.writes.append((y, x, ch))
+
+    def addnstr(self, y, x, text, n):
+        for j, ch in enumerate(text[:n]):
+            self.addch(y, x + j, ch)
+
+
+class TestConsole(unittest.TestCase):
+    def setUp(self):
+        self.grid = [[0] * 12 for _ in range(10)]
+        for x, y in [(1, 2), (2, 2), (3, 2)]:
+            self.grid[x][y] = 1
+
+    def test_draw_grid_writes_only_changes(self):
+        game = life.GameOfLife((10, 12), randomize=False)
+        game.curr_generation = self.grid
+        console = life_console.Console(game)
+        screen = FakeScreen(7, 6)
+        console.draw_grid(screen)
+        self.assertEqual(5 * 4, len(screen.writes))
+        self.assertEqual("  * ", console.drawn[1])
+        game.step()
+        screen.writes = []
+        console.draw_grid(screen)
+        self.assertEqual({(2, 3, " "), (4, 3, " "), (3, 2, "*"), (3, 4, "*")}, set(screen.writes))
+
+    def test_viewport_pan(self):
+        for backend in ("list", "sparse"):
+            with self.subTest(backend=backend):
+                game = life.create_game((10, 12), randomize=False, backend=backend)
+                game.curr_generation = self.grid
+                console = life_console.Console(game)
+                screen = FakeScreen(5, 5)
+                console.handle_key(screen, curses.KEY_DOWN)
+                console.handle_key(screen, curses.KEY_RIGHT)
+                self.assertEqual((1, 1), (console.top, console.left))
+                console.pan(screen, 100, 100)
+                self.assertEqual((7, 9), (console.top, console.left))
+                console.pan(screen, -100, -100)
+                console.pan(screen, 1, 2)
+                self.assertEqual(["*  ", "*  ", "*  "], console.visible_rows(screen))
+                self.assertFalse(console.handle_key(screen, ord("q")))
+
+    def test_status_overwrites_longer_previous_status(self):
+        console = life_console.Console(life.GameOfLife((10, 12), randomize=False))
+        screen = FakeScreen(5, 30)
+        console.draw_status(screen, "100 gen, view 100,0")
+        console.draw_status(screen, "1 gen, view 0,0")
+        line = [" "] * 30
+        for y, x, ch in screen.writes:
+            line[x] = ch
+        self.assertEqual("   1 gen, view 0,0 ---------  ", "".join(line))
@@ -0,0 +1,57 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import life
+import life_gui
+
+
+class TestGUI(unittest.TestCase):
+    def setUp(self):
+        self.game = life.GameOfLife((4, 5), randomize=False)
+        self.game.curr_generation = [
+            [0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 1, 0, 0],
+        ]
+        self.gui = life_gui.GUI(self.game, cell_size=4)
+        self.gui.screen = pygame.Surface((self.gui.width, self.gui.height))
+
+    def pixel(self, i, j):
+        # центр клетки, в стороне от линий сетки
+        return tuple(self.gui.screen.get_at((j * 4 + 2, i * 4 + 2)))[:3]
+
+    def test_changed_cells(self):
+        old = [[0, 1], [1, 0]]
+        new = [[0, 1], [0, 1]]
+        self.assertEqual([(1, 0), (1, 1)], life_gui.changed_cells(old, new))
+        self.assertEqual([(1, 0), (1, 1)], life_gui.changed_cells(np.array(old), np.array(new)))
+
+    def test_draw_changes_redraws_only_changed_cells(self):
+        self.assertIsNone(self.gui.draw_changes())
+        self.assertEqual(life_gui.ALIVE, self.pixel(2, 2))
+        self.game.step()
+        rects = self.gui.draw_changes()
+        self.assertEqual(4, len(rects))
+        self.assertEqual(life_gui.ALIVE, self.pixel(2, 1))
+        self.assertEqual(life_gui.DEAD, self.pixel(1, 2))
+        self.assertEqual(life_gui.LINE, tuple(self.gui.screen.get_at((4, 9)))[:3])
+        self.assertEqual([], self.gui.draw_changes())
+
+    def test_draw_surface(self):
+        for game in (self.game, life.create_game((4, 5), randomize=False, backend="bitpacked")):
+            game.curr_generation = self.game.curr_generation
+            gui = life_gui.GUI(game, cell_size=4, render="surfarray")
+            gui.screen = pygame.Surface((gui.width, gui.height))
+            gui.draw_surface()
+            self.gui = gui
+            self.assertEqual(life_gui.ALIVE, self.pixel(2, 2))
+            self.assertEqual(life_gui.DEAD, self.pixel(2, 1))
+            self.assertEqual(life_gui.LINE, tuple(gui.screen.get_at((4, 9)))[:3])
+        with self.assertRaises(ValueError):
+            life_gui.GUI(self.game, render="unknown")
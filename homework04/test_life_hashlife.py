@@ -0,0 +1,80 @@
+import random
+import unittest
+
+import life_hashlife
+import life_sparse
+
+
+class TestHashLifeGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.glider = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+        self.blinker = {(1, 0), (1, 1), (1, 2)}
+
+    def test_construct_and_expand(self):
+        random.seed(5)
+        live = {(random.randint(-50, 50), random.randint(-20, 80)) for _ in range(300)}
+        node, top, left = life_hashlife.construct(live)
+        self.assertEqual(len(live), node.n)
+        self.assertEqual(live, life_hashlife.expand(node, top, left))
+
+    def test_advance_matches_step(self):
+        random.seed(11)
+        start = life_sparse.SparseGameOfLife((30, 30)).live
+        for n in (1, 2, 3, 8, 13, 64, 100):
+            with self.subTest(n=n):
+                reference = life_sparse.SparseGameOfLife((30, 30), randomize=False)
+                reference.bounded = False
+                reference.live = set(start)
+                for _ in range(n):
+                    reference.step()
+                game = life_hashlife.HashLifeGameOfLife((30, 30), randomize=False)
+                game.live = set(start)
+                game.advance(n)
+                self.assertEqual(reference.live, game.live)
+                self.assertEqual(reference.prev_live, game.prev_live)
+                self.assertEqual(n + 1, game.generations)
+
+    def test_glider_to_generation_million(self):
+        game = life_hashlife.HashLifeGameOfLife((5, 5), randomize=False)
+        game.live = set(self.glider)
+        game.advance(10**6)
+        self.assertEqual({(x + 250000, y + 250000) for x, y in self.glider}, game.live)
+        self.assertEqual(10**6 + 1, game.generations)
+        self.assertTrue(game.is_changing)
+
+    def test_blinker_keeps_period(self):
+        game = life_hashlife.HashLifeGameOfLife((3, 3), randomize=False)
+        game.live = set(self.blinker)
+        game.advance(10**6)
+        self.assertEqual(self.blinker, game.live)
+        game.advance(10**6 + 1)
+        self.assertEqual({(0, 1), (1, 1), (2, 1)}, game.live)
+        self.assertEqual([[0, 1, 0], [0, 1, 0], [0, 1, 0]], game.curr_generation)
+
+    def test_advance_respects_max_generations(self):
+        game = life_hashlife.HashLifeGameOfLife((5, 5), randomize=False, max_generations=10)
+        game.live = set(self.glider)
+        game.advance(100)
+        self.assertEqual(10, game.generations)
+        self.assertTrue(game.is_max_generations_exceeded)
+        game.advance(1)
+        self.assertEqual(10, game.generations)
+
+    def test_cache_is_bounded(self):
+        self.assertEqual(life_hashlife.CACHE_SIZE, life_hashlife.join.cache_info().maxsize)
+        self.assertEqual(life_hashlife.CACHE_SIZE, life_hashlife.successor.cache_info().maxsize)
+        life_hashlife.clear_cache()
+        self.assertEqual(0, life_hashlife.join.cache_info().currsize)
+
+    def test_custom_rule(self):
+        # репликатор HighLife
+        cells = {(0, 2), (0, 3), (0, 4), (1, 1), (1, 4), (2, 0), (2, 4), (3, 0), (3, 3), (4, 0), (4, 1), (4, 2)}
+        game = life_hashlife.HashLifeGameOfLife((5, 5), randomize=False, rule="B36/S23")
+        game.live = set(cells)
+        reference = life_sparse.SparseGameOfLife((5, 5), randomize=False, rule="B36/S23")
+        reference.bounded = False
+        reference.live = set(cells)
+        game.advance(50)
+        for _ in range(50):
+            reference.step()
+        self.assertEqual(reference.live, game.live)
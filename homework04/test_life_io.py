@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import life
+import life_io
+
+
+class TestLifeIO(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_from_file_without_spaces(self):
+        tests_dir = os.path.dirname(__file__)
+        game = life.GameOfLife.from_file(os.path.join(tests_dir, "grid.txt"))
+        self.assertEqual(self.grid, game.curr_generation)
+
+    def test_read_rle(self):
+        with open(self.path("glider.rle"), "w") as f:
+            f.write("#N Glider\nx = 3, y = 4, rule = B3/S23\nbo$2bo$\n3o!\n")
+        size, rule, xs, ys = life_io.read_rle(self.path("glider.rle"))
+        self.assertEqual((4, 3), size)
+        self.assertEqual("B3/S23", rule)
+        self.assertEqual([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], list(zip(xs.tolist(), ys.tolist())))
+
+    def test_rle_round_trip(self):
+        grid = [[0] * 8 for _ in range(3)] + self.grid + [[0] * 8]
+        for backend in life.BACKENDS:
+            with self.subTest(backend=backend):
+                game = life.create_game((10, 8), randomize=False, backend=backend)
+                game.curr_generation = grid
+                life_io.write_rle(game, self.path("grid.rle"))
+                loaded = life_io.load_rle(self.path("grid.rle"), backend=backend)
+                self.assertEqual(grid, [list(map(int, row)) for row in loaded.curr_generation])
+        with open(self.path("grid.rle")) as f:
+            self.assertEqual("x = 8, y = 10, rule = B3/S23", f.readline().strip())
+            self.assertTrue(f.read().startswith("3$2o2b4o$"))
+
+    def test_snapshot_append_and_replay(self):
+        frames = {}
+        for backend in life.BACKENDS:
+            with self.subTest(backend=backend):
+                game = life.create_game((6, 70), randomize=False, backend=backend)
+                game.curr_generation = [(row * 9)[:70] for row in self.grid]
+                path = self.path(f"{backend}.bin")
+                for count in range(1, 4):
+                    self.assertEqual(count, life_io.append_snapshot(game, path))
+                    game.step()
+                frames[backend] = [(n, board.tolist()) for n, board in life_io.iter_snapshots(path)]
+                mapped = life_io.open_snapshot(path)
+                self.assertEqual([1, 2, 3], mapped["generation"].tolist())
+                self.assertEqual(6 * 2 * 8 + 8, mapped.dtype.itemsize)
+                loaded = life_io.load_snapshot(path, index=1, backend=backend)
+                self.assertEqual(2, loaded.generations)
+                self.assertEqual(frames[backend][1][1], life_io._packed(loaded).tolist())
+                del mapped
+        # HashLife живет на бесконечной плоскости, и его поколения отличаются у границ
+        del frames["hashlife"]
+        self.assertTrue(all(frame == frames["list"] for frame in frames.values()))
+
+    def test_snapshot_rejects_other_sizes(self):
+        life_io.save_snapshot(life.GameOfLife((3, 3)), self.path("game.bin"))
+        with self.assertRaises(ValueError):
+            life_io.append_snapshot(life.GameOfLife((4, 3)), self.path("game.bin"))
+        with open(self.path("bad.bin"), "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            life_io.open_snapshot(self.path("bad.bin"))
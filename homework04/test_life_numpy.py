@@ -0,0 +1,87 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+import life
+import life_numpy
+
+
+class TestNumpyGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+
+    def test_can_create_an_empty_grid(self):
+        game = life_numpy.NumpyGameOfLife((3, 4))
+        grid = game.create_grid(randomize=False)
+        self.assertEqual(np.uint8, grid.dtype)
+        self.assertEqual([[0] * 4] * 3, grid.tolist())
+
+    def test_count_neighbours(self):
+        game = life_numpy.NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        counts = game.count_neighbours()
+        for cell in [(2, 3), (0, 0), (0, 7), (5, 0), (5, 7), (0, 3), (5, 3), (2, 0), (2, 7)]:
+            self.assertEqual(sum(game.get_neighbours(cell)), counts[cell])
+
+    def test_can_update(self):
+        game = life_numpy.NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.curr_generation = game.get_next_generation()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation.tolist())
+
+    def test_matches_list_backend(self):
+        random.seed(42)
+        reference = life.GameOfLife((40, 30))
+        game = life_numpy.NumpyGameOfLife((40, 30))
+        game.curr_generation = reference.curr_generation
+        for _ in range(10):
+            reference.step()
+            game.step()
+            self.assertEqual(reference.curr_generation, game.curr_generation.tolist())
+            self.assertEqual(reference.prev_generation, game.prev_generation.tolist())
+
+    def test_is_changing(self):
+        game = life_numpy.NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertTrue(game.is_changing)
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_save_and_load(self):
+        game = life_numpy.NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grid.txt")
+            game.save(path)
+            loaded = life.GameOfLife.from_file(path)
+            self.assertEqual(self.grid, loaded.curr_generation)
+            loaded = life_numpy.NumpyGameOfLife.from_file(path)
+            self.assertIsInstance(loaded, life_numpy.NumpyGameOfLife)
+            self.assertEqual(self.grid, loaded.curr_generation.tolist())
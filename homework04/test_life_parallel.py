@@ -0,0 +1,85 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+import life_numpy
+import life_parallel
+
+
+class TestParallelGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+
+    def test_can_update(self):
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        with life_parallel.ParallelGameOfLife((self.rows, self.cols), workers=1) as game:
+            game.curr_generation = self.grid
+            num_updates = 0
+            for step in sorted(steps.keys(), key=int):
+                with self.subTest(step=step):
+                    for _ in range(int(step) - num_updates):
+                        game.step()
+                        num_updates += 1
+                    self.assertEqual(steps[step], game.curr_generation.tolist())
+
+    def test_matches_numpy_backend(self):
+        for workers in (1, 2, 3):
+            with self.subTest(workers=workers):
+                reference = life_numpy.NumpyGameOfLife((41, 29))
+                with life_parallel.ParallelGameOfLife((41, 29), randomize=False, workers=workers) as game:
+                    game.curr_generation = reference.curr_generation
+                    for _ in range(10):
+                        reference.step()
+                        game.step()
+                        self.assertTrue(np.array_equal(reference.curr_generation, game.curr_generation))
+                        self.assertTrue(np.array_equal(reference.prev_generation, game.prev_generation))
+                    self.assertEqual(reference.is_changing, game.is_changing)
+                    self.assertTrue(np.array_equal(reference.get_next_generation(), game.get_next_generation()))
+
+    def test_rule_and_toroidal(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                options = dict(rule="B36/S23", toroidal=True)
+                reference = life_numpy.NumpyGameOfLife((23, 17), **options)
+                with life_parallel.ParallelGameOfLife((23, 17), randomize=False, workers=workers, **options) as game:
+                    game.curr_generation = reference.curr_generation
+                    self.assertTrue(np.array_equal(reference.get_next_generation(), game.get_next_generation()))
+                    for _ in range(6):
+                        reference.step()
+                        game.step()
+                    self.assertTrue(np.array_equal(reference.curr_generation, game.curr_generation))
+
+    def test_step_reuses_buffers(self):
+        with life_parallel.ParallelGameOfLife((20, 20), workers=1) as game:
+            first, second = game.curr_generation, game.prev_generation
+            for generation in range(4):
+                game.step()
+                curr, prev = (second, first) if generation % 2 == 0 else (first, second)
+                self.assertTrue(np.shares_memory(curr, game.curr_generation))
+                self.assertTrue(np.shares_memory(prev, game.prev_generation))
+
+    def test_close_keeps_last_generation(self):
+        game = life_parallel.ParallelGameOfLife((self.rows, self.cols), workers=2)
+        game.curr_generation = self.grid
+        game.close()
+        self.assertEqual(self.grid, game.curr_generation.tolist())
+
+    def test_benchmark(self):
+        results = life_parallel.benchmark(64, 2, [1, 2])
+        self.assertEqual([1, 2], [workers for workers, _, _ in results])
+        self.assertEqual(1.0, results[0][2])
@@ -112,3 +112,49 @@ class TestGameOfLife(unittest.TestCase):
                     game.grid = game.get_next_generation()
                     num_updates += 1
                 self.assertEqual(steps[step], game.grid)
+
+    def test_neighbour_table(self):
+        table = life_proto.neighbour_table(3, 4)
+        self.assertIs(table, life_proto.neighbour_table(3, 4))
+        self.assertEqual((1, 4, 5), table[0])
+        self.assertEqual(8, len(table[5]))
+        toroidal = life_proto.neighbour_table(3, 4, toroidal=True)
+        self.assertEqual((11, 8, 9, 3, 1, 7, 4, 5), toroidal[0])
+
+    def test_step_reuses_buffers(self):
+        game = life_proto.GameOfLife(width=self.width, height=self.height, cell_size=1)
+        game.grid = self.grid
+        expected = game.get_next_generation()
+        self.assertEqual(self.grid, game.grid)
+        buffers = {id(game._front), id(game._back)}
+        game.step()
+        self.assertEqual(expected, game.grid)
+        self.assertEqual(buffers, {id(game._front), id(game._back)})
+
+    def test_grid_setter_checks_size(self):
+        game = life_proto.GameOfLife(width=3, height=3, cell_size=1)
+        game.grid = [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+        for grid in ([[1, 1], [1, 1]], [[0, 1, 0], [0, 1, 0]], [[0, 1, 0], [0, 1], [0, 1, 0]]):
+            with self.subTest(grid=grid):
+                with self.assertRaises(ValueError):
+                    game.grid = grid
+                self.assertEqual([[0, 1, 0], [0, 1, 0], [0, 1, 0]], game.grid)
+        game.step()
+        self.assertEqual([[0, 0, 0], [1, 1, 1], [0, 0, 0]], game.grid)
+
+    def test_set_cell(self):
+        game = life_proto.GameOfLife(width=3, height=3, cell_size=1)
+        game.grid = game.create_grid()
+        game.grid[1][1] = 1
+        self.assertEqual(0, game.grid[1][1])
+        game.set_cell((1, 2), 1)
+        self.assertEqual([[0, 0, 0], [0, 0, 1], [0, 0, 0]], game.grid)
+        with self.assertRaises(IndexError):
+            game.set_cell((3, 0), 1)
+
+    def test_toroidal(self):
+        game = life_proto.GameOfLife(width=5, height=5, cell_size=1, toroidal=True)
+        game.grid = [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0]]
+        self.assertEqual(8, len(game.get_neighbours((0, 0))))
+        game.step()
+        self.assertEqual([[0, 0, 1, 0, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0]], game.grid)
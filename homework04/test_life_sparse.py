@@ -0,0 +1,93 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import life
+import life_sparse
+
+
+class TestSparseGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+        self.glider = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+
+    def test_get_neighbours(self):
+        game = life_sparse.SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        self.assertEqual(8, len(game.get_neighbours((2, 3))))
+        self.assertEqual(4, sum(game.get_neighbours((2, 3))))
+        self.assertEqual(2, sum(game.get_neighbours((0, 0))))
+        self.assertEqual(1, sum(game.get_neighbours((5, 7))))
+
+    def test_can_update(self):
+        game = life_sparse.SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.step()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation)
+
+    def test_matches_list_backend(self):
+        random.seed(7)
+        reference = life.GameOfLife((25, 35))
+        game = life_sparse.SparseGameOfLife((25, 35), randomize=False)
+        game.curr_generation = reference.curr_generation
+        for _ in range(20):
+            reference.step()
+            game.step()
+            self.assertEqual(reference.curr_generation, game.curr_generation)
+
+    def test_glider_on_huge_board(self):
+        game = life_sparse.SparseGameOfLife((10**9, 10**9), randomize=False)
+        game.live = set(self.glider)
+        for _ in range(400):
+            game.step()
+        self.assertEqual({(x + 100, y + 100) for x, y in self.glider}, game.live)
+        self.assertEqual(5, game.population)
+        self.assertEqual(401, game.generations)
+        self.assertTrue(game.is_changing)
+
+    def test_window(self):
+        game = life_sparse.SparseGameOfLife((10**6, 10**6), randomize=False)
+        game.live = {(x + 500, y + 1000) for x, y in self.glider}
+        self.assertEqual([[0, 0, 1, 0], [0, 0, 0, 1], [0, 1, 1, 1]], game.window(500, 999, 3, 4))
+        self.assertEqual([[0, 0], [0, 0]], game.window(0, 0, 2, 2))
+
+    def test_is_not_changing(self):
+        game = life_sparse.SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_save_and_load(self):
+        game = life_sparse.SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grid.txt")
+            game.save(path)
+            self.assertEqual(self.grid, life.GameOfLife.from_file(path).curr_generation)
+            loaded = life_sparse.SparseGameOfLife.from_file(path)
+            self.assertEqual(self.grid, loaded.curr_generation)
+            self.assertFalse(loaded.is_changing)
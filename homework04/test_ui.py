@@ -0,0 +1,55 @@
+import time
+import unittest
+
+import life
+import ui
+
+
+class TestSimulation(unittest.TestCase):
+    def test_runs_until_max_generations(self):
+        game = life.create_game((20, 20), max_generations=50, backend="numpy")
+        simulation = ui.Simulation(game)
+        simulation.start()
+        simulation.join(timeout=10)
+        self.assertFalse(simulation.is_alive())
+        generation, grid = simulation.snapshot()
+        self.assertEqual(game.generations, generation)
+        self.assertTrue(generation == 50 or game.cycle is not None)
+        grid[0][0] = 1 - grid[0][0]
+        self.assertNotEqual(grid[0][0], game.curr_generation[0][0])
+
+    def test_target_rate_and_stop(self):
+        # планер на бесконечной плоскости никогда не повторяется
+        game = life.create_game((5, 5), randomize=False, backend="sparse")
+        game.bounded = False
+        game.live = {(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)}
+        simulation = ui.Simulation(game, rate=100)
+        simulation.start()
+        time.sleep(0.3)
+        simulation.stop()
+        self.assertFalse(simulation.is_alive())
+        self.assertLess(game.generations, 60)
+        self.assertGreater(simulation.meter.rate, 0)
+
+    def test_snapshot_window(self):
+        grid = [[0] * 12 for _ in range(10)]
+        for x, y in [(1, 2), (2, 2), (3, 2)]:
+            grid[x][y] = 1
+        for backend in ("list", "numpy", "bitpacked", "sparse"):
+            with self.subTest(backend=backend):
+                game = life.create_game((10, 12), randomize=False, backend=backend)
+                game.curr_generation = grid
+                generation, window = ui.Simulation(game).snapshot(window=(1, 1, 3, 4))
+                self.assertEqual(1, generation)
+                self.assertEqual([[0, 1, 0, 0]] * 3, [list(map(int, row)) for row in window])
+        # плотное поле такого размера не поместилось бы в память
+        game = life.create_game((10**6, 10**6), randomize=False, backend="sparse")
+        game.live = {(500000, 500001)}
+        generation, window = ui.Simulation(game).snapshot(window=(499999, 499999, 3, 3))
+        self.assertEqual([[0, 0, 0], [0, 0, 1], [0, 0, 0]], window)
+
+    def test_copy_grid(self):
+        grid = [[0, 1], [1, 0]]
+        copy = ui.copy_grid(grid)
+        copy[0][0] = 1
+        self.assertEqual([[0, 1], [1, 0]], grid)
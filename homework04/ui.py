@@ -1,8 +1,124 @@
 import abc
+import collections
+import threading
+import time
+import typing as tp
+
+import numpy as np
 
 from life import GameOfLife
 
 
+def copy_grid(grid: tp.Any) -> tp.Any:
+    """
+    Независимая копия поколения: массива NumPy или списка списков.
+
+    Некоторые способы хранения переиспользуют буферы поколений, поэтому
+    интерфейсы рисуют копию, а не сам `curr_generation`.
+    """
+    if isinstance(grid, np.ndarray):
+        return grid.copy()
+    return [list(row) for row in grid]
+
+
+def copy_window(life: GameOfLife, top: int, left: int, height: int, width: int) -> tp.Any:
+    """
+    Копия прямоугольника `height` x `width` текущего поколения с углом в (`top`, `left`).
+
+    Разреженные поля строят прямоугольник через `window`, не собирая
+    плотное поле целиком, поэтому его стоимость не зависит от размера поля.
+    """
+    if hasattr(life, "window"):
+        return life.window(top, left, height, width)
+    grid = life.curr_generation
+    if isinstance(grid, np.ndarray):
+        return grid[top : top + height, left : left + width].copy()
+    return [list(row[left : left + width]) for row in grid[top : top + height]]
+
+
+class RateMeter:
+    """
+    Частота событий (поколений или кадров) за последние `window` секунд.
+    """
+
+    def __init__(self, window: float = 1.0) -> None:
+        self.window = window
+        self._events: tp.Deque[tp.Tuple[float, int]] = collections.deque()
+        self._total = 0
+
+    def tick(self, count: int = 1) -> None:
+        now = time.perf_counter()
+        self._events.append((now, count))
+        self._total += count
+        while self._events[0][0] < now - self.window:
+            self._total -= self._events.popleft()[1]
+
+    @property
+    def rate(self) -> float:
+        if len(self._events) < 2:
+            return 0.0
+        span = self._events[-1][0] - self._events[0][0]
+        # первое событие открывает окно и само в частоту не входит
+        return (self._total - self._events[0][1]) / span if span > 0 else 0.0
+
+
+class Simulation(threading.Thread):
+    """
+    Фоновый поток, который шагает игру независимо от отрисовки.
+
+    Поток делает шаги с максимальной скоростью или `rate` поколений в
+    секунду, пока игра не закончится. Интерфейс в любой момент забирает
+    последнее готовое поколение через `snapshot`; поколения, которые он не
+    успел показать, просто пропускаются.
+    """
+
+    def __init__(self, life: GameOfLife, rate: tp.Optional[float] = None) -> None:
+        super().__init__(daemon=True)
+        self.life = life
+        self.rate = rate
+        self.meter = RateMeter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        life = self.life
+        return life.is_max_generations_exceeded or life.cycle is not None
+
+    def run(self) -> None:
+        period = 1 / self.rate if self.rate else 0.0
+        deadline = time.perf_counter()
+        while not self._stop_event.is_set() and not self.finished:
+            with self._lock:
+                self.life.step()
+            self.meter.tick()
+            if period:
+                deadline += period
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                else:
+                    # не догоняем отставание пачкой шагов
+                    deadline = time.perf_counter()
+
+    def snapshot(self, window: tp.Optional[tp.Tuple[int, int, int, int]] = None) -> tp.Tuple[int, tp.Any]:
+        """
+        Номер и копия последнего готового поколения.
+
+        Если задано окно `(top, left, height, width)`, копируется только
+        этот прямоугольник (см. `copy_window`).
+        """
+        with self._lock:
+            if window is not None:
+                return self.life.generations, copy_window(self.life, *window)
+            return self.life.generations, copy_grid(self.life.curr_generation)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
 class UI(abc.ABC):
     def __init__(self, life: GameOfLife) -> None:
         self.life = life